@@ -0,0 +1,271 @@
+"""Headless JSON API for CarWorth valuations.
+
+A dependency-free ASGI application exposing the calculators over HTTP,
+without a Streamlit session or script rerun per request.
+
+Run with:
+    uvicorn app.api:app --host 0.0.0.0 --port 8000
+
+Endpoints:
+    POST /value              Value a single car (cached calculate_car_value)
+    POST /value/batch        Value many cars in one request
+    POST /value/summary      Value a single car as a flat record; concurrent
+                             requests are coalesced into batch valuations
+    POST /portfolio          Inventory totals, verdict mix by state/fuel/brand
+                             and depreciation by age
+    GET  /road-tax/{state}   Road tax slab table for a state
+    GET  /gst/classify       GST category (?fuel_type=&engine_cc=&length_mm=)
+    GET  /health             Liveness probe, valuation cache and coalescer stats
+    GET  /metrics            Per-stage timings, Prometheus text format
+                             (requires CARWORTH_METRICS=1)
+"""
+
+import json
+from typing import Awaitable, Callable, Optional
+from urllib.parse import parse_qs
+
+from app.config import APP_VERSION, COALESCE_MAX_BATCH, COALESCE_MAX_WAIT
+from app.metrics import METRICS
+from app.coalescer import Coalescer
+from app.calculators.valuation import VALUATION_CACHE, cached_car_value
+from app.calculators.batch import value_rows
+from app.calculators.portfolio import summarize_portfolio
+from app.calculators.results import to_plain
+from app.data.road_tax import STATE_TAX_CONFIG, get_state_tax_table
+from app.data.gst import classify_gst_category
+from app.utils.listings import ListingError, parse_listing
+from app.utils.validators import validate_inputs
+
+# Request limits
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_BATCH_SIZE = 10000
+
+# Concurrent /value/summary requests share vectorized batch valuations
+SUMMARY_COALESCER = Coalescer(value_rows, COALESCE_MAX_BATCH, COALESCE_MAX_WAIT)
+
+Send = Callable[[dict], Awaitable[None]]
+Receive = Callable[[], Awaitable[dict]]
+
+
+class HTTPError(Exception):
+    """Error returned to the client as a JSON body."""
+
+    def __init__(self, status: int, message: str, errors: Optional[list[str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.errors = errors
+
+
+def _parse_and_validate(raw) -> tuple[Optional[dict], list[str]]:
+    """Parse one listing; returns (inputs, errors)."""
+    if not isinstance(raw, dict):
+        return None, ["Expected a JSON object"]
+    try:
+        inputs = parse_listing(raw)
+    except ListingError as e:
+        return None, e.errors
+    is_valid, errors = validate_inputs(inputs)
+    return (inputs, []) if is_valid else (None, errors)
+
+
+def value_car(body) -> dict:
+    """Handle POST /value."""
+    inputs, errors = _parse_and_validate(body)
+    if errors:
+        raise HTTPError(400, "Invalid listing", errors)
+    return cached_car_value(inputs)
+
+
+async def value_summary(body) -> dict:
+    """
+    Handle POST /value/summary.
+
+    Returns the same flat record as one /value/batch result (without the
+    index), computed together with other requests arriving at the same time.
+    """
+    inputs, errors = _parse_and_validate(body)
+    if errors:
+        raise HTTPError(400, "Invalid listing", errors)
+    return await SUMMARY_COALESCER.submit(inputs)
+
+
+def _listings(body) -> list:
+    """The listings of a batch request: a JSON array or {"listings": [...]}."""
+    listings = body.get("listings") if isinstance(body, dict) else body
+    if not isinstance(listings, list):
+        raise HTTPError(400, "Expected a JSON array of listings or {\"listings\": [...]}")
+    if len(listings) > MAX_BATCH_SIZE:
+        raise HTTPError(413, f"Batch too large (max {MAX_BATCH_SIZE} listings)")
+    return listings
+
+
+def value_batch(body) -> dict:
+    """
+    Handle POST /value/batch.
+
+    Accepts a JSON array of listings or {"listings": [...]}. Valid listings
+    are valued together with the batch engine; each result is a flat record
+    tagged with its position, and invalid listings carry their errors instead.
+    """
+    listings = _listings(body)
+
+    results: list[Optional[dict]] = [None] * len(listings)
+    valid = []
+    for index, raw in enumerate(listings):
+        inputs, errors = _parse_and_validate(raw)
+        if errors:
+            results[index] = {"index": index, "errors": errors}
+        else:
+            valid.append({"index": index, **inputs})
+
+    for record in value_rows(valid):
+        results[record["index"]] = record
+
+    return {"count": len(listings), "valued": len(valid), "results": results}
+
+
+def portfolio(body) -> dict:
+    """
+    Handle POST /portfolio.
+
+    Accepts the same body as /value/batch and returns the portfolio summary.
+    Invalid listings are left out; their positions and errors are listed
+    under "rejected".
+    """
+    rejected = []
+    valid = []
+    for index, raw in enumerate(_listings(body)):
+        inputs, errors = _parse_and_validate(raw)
+        if errors:
+            rejected.append({"index": index, "errors": errors})
+        else:
+            valid.append(inputs)
+    return {**summarize_portfolio(valid).to_dict(), "rejected": rejected}
+
+
+def road_tax_table(state: str) -> dict:
+    """Handle GET /road-tax/{state}."""
+    if state not in STATE_TAX_CONFIG:
+        raise HTTPError(404, f"Unknown state: {state}")
+    return get_state_tax_table(state)
+
+
+def gst_classify(query: dict[str, list[str]]) -> dict:
+    """Handle GET /gst/classify."""
+    fuel_type = query.get("fuel_type", [None])[0]
+    if not fuel_type:
+        raise HTTPError(400, "Missing query parameter: fuel_type")
+
+    specs = {}
+    for name in ("engine_cc", "length_mm"):
+        value = query.get(name, [None])[0]
+        try:
+            specs[name] = int(value) if value else None
+        except ValueError:
+            raise HTTPError(400, f"Invalid value for {name}: {value!r}")
+
+    return dict(classify_gst_category(fuel_type, **specs))
+
+
+async def _read_json(receive: Receive):
+    """Read and decode the request body."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise HTTPError(413, "Request body too large")
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    try:
+        return json.loads(b"".join(chunks))
+    except ValueError:
+        raise HTTPError(400, "Request body is not valid JSON")
+
+
+async def _send(send: Send, status: int, body: bytes, content_type: bytes) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(send: Send, status: int, payload) -> None:
+    await _send(send, status, json.dumps(payload, default=to_plain).encode(), b"application/json")
+
+
+async def _dispatch(scope: dict, receive: Receive):
+    method = scope["method"]
+    path = scope["path"].rstrip("/") or "/"
+    query = parse_qs(scope.get("query_string", b"").decode())
+
+    if path == "/value":
+        if method != "POST":
+            raise HTTPError(405, "Method not allowed")
+        return value_car(await _read_json(receive))
+    if path == "/value/batch":
+        if method != "POST":
+            raise HTTPError(405, "Method not allowed")
+        return value_batch(await _read_json(receive))
+    if path == "/value/summary":
+        if method != "POST":
+            raise HTTPError(405, "Method not allowed")
+        return await value_summary(await _read_json(receive))
+    if path == "/portfolio":
+        if method != "POST":
+            raise HTTPError(405, "Method not allowed")
+        return portfolio(await _read_json(receive))
+    if method != "GET":
+        raise HTTPError(405, "Method not allowed")
+    if path.startswith("/road-tax/"):
+        return road_tax_table(path[len("/road-tax/"):])
+    if path == "/gst/classify":
+        return gst_classify(query)
+    if path == "/health":
+        return {
+            "status": "ok",
+            "version": APP_VERSION,
+            "valuation_cache": VALUATION_CACHE.stats(),
+            "coalescer": SUMMARY_COALESCER.stats(),
+        }
+    raise HTTPError(404, "Not found")
+
+
+async def app(scope: dict, receive: Receive, send: Send) -> None:
+    """ASGI entry point."""
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    if scope["type"] != "http":
+        return
+
+    if scope["path"] == "/metrics" and scope["method"] == "GET":
+        body = METRICS.render_prometheus().encode()
+        await _send(send, 200, body, b"text/plain; version=0.0.4; charset=utf-8")
+        return
+
+    try:
+        payload = await _dispatch(scope, receive)
+    except HTTPError as e:
+        error = {"error": e.message}
+        if e.errors:
+            error["errors"] = e.errors
+        await _send_json(send, e.status, error)
+        return
+
+    await _send_json(send, 200, payload)
@@ -2,6 +2,10 @@ from .on_road_price import calculate_on_road_price
 from .depreciation import calculate_total_depreciation
 from .fair_value import calculate_fair_value, calculate_fair_value_range
 from .verdict import get_verdict, generate_warnings
+from .valuation import calculate_car_value, cached_car_value
+from .surface import fair_value_surface
+from .graph import ValuationGraph
+from .results import OnRoadResult, DepreciationResult, FairValueResult, Verdict
 
 __all__ = [
     "calculate_on_road_price",
@@ -10,4 +14,12 @@ __all__ = [
     "calculate_fair_value_range",
     "get_verdict",
     "generate_warnings",
+    "calculate_car_value",
+    "cached_car_value",
+    "fair_value_surface",
+    "ValuationGraph",
+    "OnRoadResult",
+    "DepreciationResult",
+    "FairValueResult",
+    "Verdict",
 ]
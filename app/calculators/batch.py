@@ -0,0 +1,348 @@
+"""Vectorized batch valuation engine.
+
+Columnar counterpart to calculate_car_value: every stage runs as whole-array
+NumPy operations, so pricing a dealer inventory costs a few array passes
+instead of one Python pipeline per car.
+
+Categorical columns are encoded once into int8 codes (app.data.categories)
+and resolved through its dense lookup tables; callers may pass the codes
+directly. Price-bracket tables are built by calling the scalar calculators
+once per bracket, so the batch path cannot drift from the single-car path.
+"""
+
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from app.data.road_tax import NCR_STATES, lookup_rates
+from app.data.categories import (
+    CATEGORIES,
+    CODE_DTYPE,
+    STATE,
+    FUEL,
+    OWNER,
+    BRAND,
+    TRANSMISSION,
+    BODY_CONDITION,
+    ACCIDENT_HISTORY,
+    SERVICE_HISTORY,
+    INSURANCE_STATUS,
+    OWNERSHIP_PREMIUM_TABLE,
+    BRAND_MULTIPLIER_TABLE,
+    TRANSMISSION_ADJUSTMENT_TABLE,
+    BODY_CONDITION_TABLE,
+    ACCIDENT_HISTORY_TABLE,
+    SERVICE_HISTORY_TABLE,
+)
+from app.data.constants import (
+    CURRENT_YEAR,
+    CAR_LIFE_YEARS,
+    DIESEL_NCR_LIFE_YEARS,
+    MAX_DEPRECIATION,
+    CONDITION_ADJUSTMENTS,
+    EXPECTED_ANNUAL_KM,
+    MILEAGE_THRESHOLDS,
+    MILEAGE_ADJUSTMENTS,
+    FAIR_VALUE_RANGE,
+    VERDICT_THRESHOLDS,
+    TCS_THRESHOLD,
+    TCS_RATE,
+    ADVANCED_DEFAULTS,
+)
+from app.calculators.on_road_price import (
+    calculate_insurance_estimate,
+    calculate_handling_charges,
+    calculate_fixed_charges,
+)
+from app.calculators.fair_value import get_insurance_cost
+from app.calculators.verdict import VERDICTS
+
+# Price boundaries of the scalar category functions (``price < boundary``)
+INSURANCE_BOUNDARIES = [600000, 1000000, 1400000, 1800000, 2500000, 4000000]
+HANDLING_BOUNDARIES = [800000, 1200000, 1800000, 3000000]
+INSURANCE_COST_BOUNDARIES = [1000000, 1500000, 2500000]
+
+MILEAGE_STATUSES = ["normal", "slightly_high", "high", "very_low"]
+_MILEAGE_TABLE = np.array(
+    [0.0, MILEAGE_ADJUSTMENTS["slight_high"], MILEAGE_ADJUSTMENTS["high"], 0.0]
+)
+
+VERDICT_LABELS = VERDICTS
+VERDICT_COLORS = ["success", "success", "warning", "warning", "error"]
+NEGOTIATION_FACTORS = [0.95, 0.95, 0.97, 1.0, 1.0]
+
+REQUIRED_COLUMNS = [
+    "ex_showroom",
+    "year",
+    "km",
+    "fuel_type",
+    "state",
+    "owner",
+    "asking_price",
+    "insurance_status",
+]
+
+# Defaults for optional columns (same as the scalar calculators)
+COLUMN_DEFAULTS = {
+    "custom_road_tax_rate": None,
+    **ADVANCED_DEFAULTS,
+    "use_advanced": False,
+}
+
+
+def _price_table(boundaries: list[int], value_for_price) -> np.ndarray:
+    """Evaluate a scalar price-bracket function once per bracket."""
+    probes = [boundaries[0] - 1] + list(boundaries)
+    return np.array([value_for_price(p) for p in probes], dtype=float)
+
+
+_INSURANCE_TABLE = _price_table(INSURANCE_BOUNDARIES, calculate_insurance_estimate)
+_HANDLING_TABLE = _price_table(HANDLING_BOUNDARIES, calculate_handling_charges)
+_INSURANCE_COST_TABLE = _price_table(INSURANCE_COST_BOUNDARIES, get_insurance_cost)
+
+# All three bracket functions resolved with one binary search per car: the
+# tables are re-indexed by interval of the merged boundaries
+_PRICE_BOUNDARIES = np.array(
+    sorted({*INSURANCE_BOUNDARIES, *HANDLING_BOUNDARIES, *INSURANCE_COST_BOUNDARIES}), dtype=float
+)
+_INTERVAL_PROBES = [_PRICE_BOUNDARIES[0] - 1, *_PRICE_BOUNDARIES]
+_INSURANCE_BY_INTERVAL = _INSURANCE_TABLE[np.searchsorted(INSURANCE_BOUNDARIES, _INTERVAL_PROBES, side="right")]
+_HANDLING_BY_INTERVAL = _HANDLING_TABLE[np.searchsorted(HANDLING_BOUNDARIES, _INTERVAL_PROBES, side="right")]
+_INSURANCE_COST_BY_INTERVAL = _INSURANCE_COST_TABLE[
+    np.searchsorted(INSURANCE_COST_BOUNDARIES, _INTERVAL_PROBES, side="right")
+]
+
+# Indexed by state code; the last slot (unknown states) is False
+_IS_NCR = np.zeros(len(STATE) + 1, dtype=bool)
+_IS_NCR[[STATE.code(state) for state in NCR_STATES if state in STATE.codes]] = True
+_DIESEL_CODE = FUEL.code("Diesel")
+_VALID_CODE = INSURANCE_STATUS.code("Valid")
+
+
+def _column(columns: Mapping, name: str, length: int):
+    """Get a column, broadcasting the (already encoded) default for optional columns."""
+    if name in columns:
+        return columns[name]
+    if name not in COLUMN_DEFAULTS:
+        raise KeyError(f"Missing required column: {name}")
+    default = COLUMN_DEFAULTS[name]
+    if name in CATEGORIES:
+        return np.full(length, CATEGORIES[name].code(default), dtype=CODE_DTYPE)
+    return np.full(length, np.nan if default is None else default)
+
+
+def value_cars(columns: Mapping) -> dict[str, np.ndarray]:
+    """
+    Value many cars at once from columnar inputs.
+
+    Args:
+        columns: Mapping of input name -> column (lists, NumPy arrays or a
+            pandas DataFrame). Uses the same names as the calculate_car_value
+            inputs dict. Optional columns fall back to COLUMN_DEFAULTS;
+            custom_road_tax_rate uses None/NaN for "no custom rate".
+            Categorical columns may be labels or integer codes (see
+            app.data.categories.encode_columns).
+
+    Returns dict of equal-length arrays with on-road price components,
+    basic/advanced depreciation, fair values and ranges, verdicts and
+    negotiation targets. Numeric results are identical to calculate_car_value.
+    """
+    length = len(columns["ex_showroom"])
+
+    def col(name):
+        return _column(columns, name, length)
+
+    ex_showroom = np.asarray(col("ex_showroom"), dtype=float)
+    year = np.asarray(col("year"), dtype=np.int64)
+    km = np.asarray(col("km"), dtype=np.int64)
+    asking_price = np.asarray(col("asking_price"), dtype=float)
+    custom_rate = np.asarray(col("custom_road_tax_rate"), dtype=float)
+    commercial_use = np.asarray(col("commercial_use"), dtype=bool)
+    new_gen_available = np.asarray(col("new_gen_available"), dtype=bool)
+    use_advanced = np.asarray(col("use_advanced"), dtype=bool)
+
+    state_codes = STATE.encode(col("state"))
+    fuel_codes = FUEL.encode(col("fuel_type"))
+    insurance_valid = INSURANCE_STATUS.encode(col("insurance_status")) == _VALID_CODE
+
+    # === ON-ROAD PRICE ===
+    default_rate, _ = lookup_rates(state_codes, fuel_codes, ex_showroom)
+    is_custom_rate = ~np.isnan(custom_rate)
+    road_tax_rate = np.where(is_custom_rate, custom_rate, default_rate)
+    road_tax = ex_showroom * road_tax_rate
+
+    price_interval = np.searchsorted(_PRICE_BOUNDARIES, ex_showroom, side="right")
+    insurance = _INSURANCE_BY_INTERVAL[price_interval]
+    handling_charges = _HANDLING_BY_INTERVAL[price_interval]
+    fixed_charges = np.full(length, float(calculate_fixed_charges(False)))
+    tcs = np.where(ex_showroom > TCS_THRESHOLD, ex_showroom * TCS_RATE, 0.0)
+
+    # Accumulate in place, in the same order as calculate_on_road_price
+    on_road_price = ex_showroom + road_tax
+    on_road_price += insurance
+    on_road_price += fixed_charges
+    on_road_price += handling_charges
+    on_road_price += tcs
+
+    # === BASIC DEPRECIATION ===
+    age = CURRENT_YEAR - year
+    diesel_ncr = (fuel_codes == _DIESEL_CODE) & _IS_NCR[state_codes]
+    life_years = np.where(diesel_ncr, DIESEL_NCR_LIFE_YEARS, CAR_LIFE_YEARS)
+    life_depreciation = age / life_years
+
+    ownership_premium = OWNERSHIP_PREMIUM_TABLE[OWNER.encode(col("owner"))]
+
+    expected_km = np.where(age <= 0, EXPECTED_ANNUAL_KM, age * EXPECTED_ANNUAL_KM)
+    high = km > expected_km * MILEAGE_THRESHOLDS["high"]
+    slight_high = ~high & (km > expected_km * MILEAGE_THRESHOLDS["slight_high"])
+    very_low = ~high & ~slight_high & (km < expected_km * MILEAGE_THRESHOLDS["very_low"])
+    mileage_code = np.select([slight_high, high, very_low], [1, 2, 3], 0)
+    mileage_adjustment = _MILEAGE_TABLE[mileage_code]
+
+    basic_total = life_depreciation + ownership_premium
+    basic_total += mileage_adjustment
+    basic_capped = np.minimum(basic_total, MAX_DEPRECIATION)
+
+    # === ADVANCED ADJUSTMENTS ===
+    brand_multiplier = BRAND_MULTIPLIER_TABLE[BRAND.encode(col("brand"))]
+    brand_adjustment = life_depreciation * (brand_multiplier - 1.0)
+    transmission_adjustment = TRANSMISSION_ADJUSTMENT_TABLE[TRANSMISSION.encode(col("transmission"))]
+
+    condition_total = BODY_CONDITION_TABLE[BODY_CONDITION.encode(col("body_condition"))]
+    condition_total += ACCIDENT_HISTORY_TABLE[ACCIDENT_HISTORY.encode(col("accident_history"))]
+    condition_total += SERVICE_HISTORY_TABLE[SERVICE_HISTORY.encode(col("service_history"))]
+    condition_total += np.where(commercial_use, CONDITION_ADJUSTMENTS["commercial"], 0.0)
+    condition_total += np.where(new_gen_available, CONDITION_ADJUSTMENTS["new_gen_available"], 0.0)
+
+    advanced_adjustments_total = brand_adjustment + transmission_adjustment
+    advanced_adjustments_total += condition_total
+    advanced_total = basic_total + advanced_adjustments_total
+    advanced_capped = np.minimum(advanced_total, MAX_DEPRECIATION)
+
+    # === FAIR VALUE ===
+    insurance_cost = _INSURANCE_COST_BY_INTERVAL[price_interval]
+    insurance_deduction = np.where(insurance_valid, 0.0, insurance_cost)
+
+    basic_fair_value = on_road_price * (1 - basic_capped)
+    basic_adjusted = np.where(insurance_valid, basic_fair_value, basic_fair_value - insurance_cost)
+    advanced_fair_value = on_road_price * (1 - advanced_capped)
+    advanced_adjusted = np.where(insurance_valid, advanced_fair_value, advanced_fair_value - insurance_cost)
+
+    fair_value = np.where(use_advanced, advanced_adjusted, basic_adjusted)
+
+    # === VERDICT ===
+    difference_amount = asking_price - fair_value
+    difference_percent = np.divide(
+        difference_amount,
+        fair_value,
+        out=np.zeros(length),
+        where=fair_value != 0,
+    )
+    thresholds = [
+        VERDICT_THRESHOLDS["great_deal"],
+        VERDICT_THRESHOLDS["good_deal"],
+        VERDICT_THRESHOLDS["fair"],
+        VERDICT_THRESHOLDS["slightly_overpriced"],
+    ]
+    verdict_code = np.searchsorted(thresholds, difference_percent, side="left")
+    negotiation_target = fair_value * np.asarray(NEGOTIATION_FACTORS)[verdict_code]
+
+    return {
+        # On-road price
+        "ex_showroom": ex_showroom,
+        "road_tax_rate": road_tax_rate,
+        "default_road_tax_rate": default_rate,
+        "is_custom_rate": is_custom_rate,
+        "road_tax": road_tax,
+        "insurance": insurance,
+        "fixed_charges": fixed_charges,
+        "handling_charges": handling_charges,
+        "tcs": tcs,
+        "on_road_price": on_road_price,
+        # Basic depreciation
+        "age": age,
+        "life_years": life_years,
+        "life_depreciation": life_depreciation,
+        "ownership_premium": ownership_premium,
+        "mileage_adjustment": mileage_adjustment,
+        "mileage_status": np.asarray(MILEAGE_STATUSES, dtype=object)[mileage_code],
+        "basic_total": basic_total,
+        "basic_capped": basic_capped,
+        # Advanced depreciation
+        "brand_multiplier": brand_multiplier,
+        "brand_adjustment": brand_adjustment,
+        "transmission_adjustment": transmission_adjustment,
+        "condition_total": condition_total,
+        "advanced_adjustments_total": advanced_adjustments_total,
+        "advanced_total": advanced_total,
+        "advanced_capped": advanced_capped,
+        # Fair value
+        "basic_fair_value": basic_fair_value,
+        "basic_adjusted": basic_adjusted,
+        "basic_min": basic_adjusted * (1 - FAIR_VALUE_RANGE),
+        "basic_max": basic_adjusted * (1 + FAIR_VALUE_RANGE),
+        "advanced_fair_value": advanced_fair_value,
+        "advanced_adjusted": advanced_adjusted,
+        "advanced_min": advanced_adjusted * (1 - FAIR_VALUE_RANGE),
+        "advanced_max": advanced_adjusted * (1 + FAIR_VALUE_RANGE),
+        "insurance_deduction": insurance_deduction,
+        "fair_value": fair_value,
+        "fair_value_min": fair_value * (1 - FAIR_VALUE_RANGE),
+        "fair_value_max": fair_value * (1 + FAIR_VALUE_RANGE),
+        "using_advanced": use_advanced,
+        # Verdict
+        "verdict": np.asarray(VERDICT_LABELS, dtype=object)[verdict_code],
+        "verdict_code": verdict_code,
+        "verdict_color": np.asarray(VERDICT_COLORS, dtype=object)[verdict_code],
+        "difference_percent": difference_percent,
+        "difference_amount": difference_amount,
+        "negotiation_target": negotiation_target,
+    }
+
+
+# Per-car result columns emitted by bulk outputs (CLI, API batch endpoint)
+RESULT_FIELDS = [
+    "on_road_price",
+    "road_tax_rate",
+    "age",
+    "mileage_status",
+    "basic_capped",
+    "advanced_capped",
+    "basic_adjusted",
+    "advanced_adjusted",
+    "insurance_deduction",
+    "fair_value",
+    "fair_value_min",
+    "fair_value_max",
+    "verdict",
+    "difference_percent",
+    "difference_amount",
+    "negotiation_target",
+]
+
+
+def rows_to_columns(rows: list[dict]) -> dict[str, list]:
+    """Columns for value_cars from calculate_car_value-style input dicts."""
+    columns = {name: [row[name] for row in rows] for name in REQUIRED_COLUMNS}
+    for name, default in COLUMN_DEFAULTS.items():
+        columns[name] = [row.get(name, default) for row in rows]
+    return columns
+
+
+def value_rows(rows: list[dict], fields: Sequence[str] = RESULT_FIELDS) -> list[dict]:
+    """
+    Value a list of calculate_car_value-style input dicts in one batch.
+
+    Returns one flat dict per row with the input values followed by the
+    selected result fields as plain Python scalars.
+    """
+    if not rows:
+        return []
+
+    result = value_cars(rows_to_columns(rows))
+
+    result_columns = [result[field].tolist() for field in fields]
+    return [
+        {**row, **dict(zip(fields, values))}
+        for row, values in zip(rows, zip(*result_columns))
+    ]
@@ -0,0 +1,106 @@
+"""Bounded, thread-safe LRU cache for valuation results."""
+
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Hashable, Optional
+
+
+def make_key(inputs: dict) -> tuple:
+    """
+    Canonical hashable key for a valuation inputs dict.
+
+    Field order does not matter, and 1500000 and 1500000.0 map to the same
+    key. Nested lists, dicts and result records are frozen into tuples.
+    """
+    return tuple(sorted((name, _freeze(value)) for name, value in inputs.items()))
+
+
+def _freeze(value) -> Hashable:
+    if isinstance(value, (dict, MappingProxyType)):
+        return make_key(value)
+    if hasattr(value, "to_dict"):
+        return make_key(value.to_dict())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, bool):
+        # Keep True distinct from 1 (they hash equal)
+        return ("bool", value)
+    return value
+
+
+class ValuationCache:
+    """
+    Size-bounded LRU cache with per-entry expiry.
+
+    Safe to share across Streamlit script threads. Cached results are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: Optional[float] = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable):
+        """Return the cached value for key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -30,6 +30,7 @@ from app.data.constants import (
     MILEAGE_THRESHOLDS,
     MILEAGE_ADJUSTMENTS,
 )
+from app.calculators.results import DepreciationResult
 
 
 def get_owner_number(owner_str: str) -> int:
@@ -155,13 +156,13 @@ def calculate_total_depreciation(
     service_history: str = "Unknown",
     commercial_use: bool = False,
     new_gen_available: bool = False,
-) -> dict:
+) -> DepreciationResult:
     """
     Calculate total depreciation with full breakdown.
 
     Separates Basic (video formula) vs Advanced (edge case) adjustments.
 
-    Returns dict with all components and final depreciation rates.
+    Returns a DepreciationResult with all components and final depreciation rates.
     """
     owner_number = get_owner_number(owner)
 
@@ -200,30 +201,26 @@ def calculate_total_depreciation(
     advanced_total = basic_total + advanced_adjustments
     advanced_capped = min(advanced_total, MAX_DEPRECIATION)
 
-    return {
-        "age": age,
-        "life_years": life_years,
+    return DepreciationResult(
+        age,
+        life_years,
         # Basic formula components
-        "life_depreciation": life_dep,
-        "ownership_premium": ownership_dep,
-        "mileage_adjustment": mileage_adj,
-        "mileage_status": mileage_status,
+        life_dep,  # life_depreciation
+        ownership_dep,  # ownership_premium
+        mileage_adj,  # mileage_adjustment
+        mileage_status,
         # Basic totals
-        "basic_total": basic_total,
-        "basic_capped": basic_capped,
-        "basic_is_capped": basic_total > MAX_DEPRECIATION,
+        basic_total,
+        basic_capped,
+        basic_total > MAX_DEPRECIATION,  # basic_is_capped
         # Advanced adjustments
-        "brand_adjustment": brand_adj,
-        "brand_multiplier": brand_multiplier,
-        "transmission_adjustment": transmission_adj,
-        "condition_adjustments": condition,
+        brand_adj,  # brand_adjustment
+        brand_multiplier,
+        transmission_adj,  # transmission_adjustment
+        condition,  # condition_adjustments
         # Advanced totals
-        "advanced_adjustments_total": advanced_adjustments,
-        "advanced_total": advanced_total,
-        "advanced_capped": advanced_capped,
-        "advanced_is_capped": advanced_total > MAX_DEPRECIATION,
-        # Legacy fields for backward compatibility
-        "total_raw": advanced_total,
-        "total_capped": advanced_capped,
-        "is_capped": advanced_total > MAX_DEPRECIATION,
-    }
+        advanced_adjustments,  # advanced_adjustments_total
+        advanced_total,
+        advanced_capped,
+        advanced_total > MAX_DEPRECIATION,  # advanced_is_capped
+    )
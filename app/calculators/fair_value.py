@@ -1,6 +1,7 @@
 """Fair value calculation module."""
 
 from app.data.constants import FAIR_VALUE_RANGE, INSURANCE_ESTIMATES
+from app.calculators.results import FairValueResult
 
 
 def get_insurance_cost(ex_showroom: float) -> float:
@@ -69,11 +70,11 @@ def calculate_complete_fair_value(
     insurance_valid: bool,
     ex_showroom: float,
     use_advanced: bool = False,
-) -> dict:
+) -> FairValueResult:
     """
     Calculate complete fair value with both basic and advanced calculations.
 
-    Returns dict with:
+    Returns a FairValueResult with:
     - Basic formula values (video formula)
     - Advanced values (with edge case adjustments)
     - Insurance deduction
@@ -103,26 +104,24 @@ def calculate_complete_fair_value(
         primary_min = basic_min
         primary_max = basic_max
 
-    return {
+    return FairValueResult(
         # Basic formula results
-        "basic_fair_value": basic_fair_value,
-        "basic_adjusted": basic_adjusted,
-        "basic_min": basic_min,
-        "basic_max": basic_max,
+        basic_fair_value,
+        basic_adjusted,
+        basic_min,
+        basic_max,
         # Advanced formula results
-        "advanced_fair_value": advanced_fair_value,
-        "advanced_adjusted": advanced_adjusted,
-        "advanced_min": advanced_min,
-        "advanced_max": advanced_max,
+        advanced_fair_value,
+        advanced_adjusted,
+        advanced_min,
+        advanced_max,
         # Difference between basic and advanced
-        "adjustment_difference": basic_adjusted - advanced_adjusted,
+        basic_adjusted - advanced_adjusted,  # adjustment_difference
         # Insurance
-        "insurance_deduction": insurance_deduction,
+        insurance_deduction,
         # Primary values (selected based on use_advanced)
-        "fair_value": primary_value,
-        "fair_value_min": primary_min,
-        "fair_value_max": primary_max,
-        "using_advanced": use_advanced,
-        # Legacy compatibility
-        "base_fair_value": basic_fair_value if not use_advanced else advanced_fair_value,
-    }
+        primary_value,  # fair_value
+        primary_min,  # fair_value_min
+        primary_max,  # fair_value_max
+        use_advanced,  # using_advanced
+    )
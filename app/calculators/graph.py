@@ -0,0 +1,166 @@
+"""Incremental valuation: the pipeline as a memoized dependency graph.
+
+Each stage of calculate_car_value is a node that declares the input fields
+it reads and the nodes it depends on:
+
+    on_road      <- ex_showroom, state, fuel_type, custom_road_tax_rate, specs
+    depreciation <- year, fuel_type, state, owner, km, brand, transmission,
+                    condition, commercial_use, new_gen_available
+    fair_value   <- on_road, depreciation, insurance_status, ex_showroom, use_advanced
+    verdict      <- fair_value, asking_price
+    warnings     <- depreciation, fuel_type, state, owner, accident_history, ...
+
+A ValuationGraph remembers the last result of every node. On the next
+evaluate() only nodes whose fields (or upstream nodes) changed are
+recomputed, so editing just the asking price reruns the verdict alone.
+
+When nothing can be reused (a new session, or every root input changed),
+the process-wide VALUATION_CACHE is consulted first: another session or an
+API request may already have valued the same car.
+"""
+
+from typing import Any, Callable, NamedTuple, Optional
+
+from app.calculators.cache import ValuationCache
+from app.calculators.valuation import (
+    VALUATION_CACHE,
+    on_road_stage,
+    depreciation_stage,
+    fair_value_stage,
+    verdict_stage,
+    warnings_stage,
+    valuation_key,
+)
+from app.metrics import METRICS
+
+
+class Node(NamedTuple):
+    """A pipeline stage: compute(inputs, *upstream results)."""
+    fields: tuple[str, ...]
+    deps: tuple[str, ...]
+    compute: Callable[..., Any]
+    stage: str  # METRICS stage name, as recorded by calculate_car_value
+
+
+# In topological order
+VALUATION_NODES: dict[str, Node] = {
+    "on_road": Node(
+        ("ex_showroom", "state", "fuel_type", "custom_road_tax_rate", "engine_cc", "length_mm"),
+        (),
+        on_road_stage,
+        "on_road_price",
+    ),
+    "depreciation": Node(
+        (
+            "year", "fuel_type", "state", "owner", "km", "brand", "transmission",
+            "body_condition", "accident_history", "service_history",
+            "commercial_use", "new_gen_available",
+        ),
+        (),
+        depreciation_stage,
+        "depreciation",
+    ),
+    "fair_value": Node(
+        ("insurance_status", "ex_showroom", "use_advanced"),
+        ("on_road", "depreciation"),
+        fair_value_stage,
+        "fair_value",
+    ),
+    "verdict": Node(("asking_price",), ("fair_value",), verdict_stage, "verdict"),
+    "warnings": Node(
+        ("fuel_type", "state", "owner", "accident_history", "commercial_use", "transmission"),
+        ("depreciation",),
+        warnings_stage,
+        "warnings",
+    ),
+}
+
+
+class ValuationGraph:
+    """
+    Per-session incremental calculate_car_value.
+
+    Not thread-safe; keep one instance per user session (or per car in a
+    comparison). Results are shared with later evaluations (and, through
+    cache, with other sessions) and must not be modified. Pass cache=None
+    to skip the process-wide cache.
+    """
+
+    def __init__(
+        self,
+        nodes: dict[str, Node] = VALUATION_NODES,
+        cache: Optional[ValuationCache] = VALUATION_CACHE,
+    ):
+        self.nodes = nodes
+        self.cache = cache
+        self._memo: dict[str, tuple[tuple, Any]] = {}
+        self.recomputed: list[str] = []  # nodes rerun by the last evaluate()
+
+    def clear(self) -> None:
+        self._memo.clear()
+
+    def evaluate(self, inputs: dict) -> dict:
+        """
+        Value a car, reusing every node whose inputs are unchanged.
+
+        Returns the same dict as calculate_car_value(inputs).
+        """
+        # A node's key covers its own fields and, transitively, its upstream keys
+        keys: dict[str, tuple] = {}
+        for name, node in self.nodes.items():
+            keys[name] = (tuple(inputs.get(field) for field in node.fields), tuple(keys[d] for d in node.deps))
+        stale = [
+            name for name in self.nodes
+            if (memo := self._memo.get(name)) is None or memo[0] != keys[name]
+        ]
+
+        cache_key = None
+        if self.cache is not None and len(stale) == len(self.nodes):
+            cache_key = valuation_key(inputs)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                for name, result in self._node_results(cached).items():
+                    self._memo[name] = (keys[name], result)
+                self.recomputed = []
+                return cached
+
+        timer = METRICS.timer()
+        results: dict[str, Any] = {}
+        for name, node in self.nodes.items():
+            if name not in stale:
+                results[name] = self._memo[name][1]
+                continue
+            result = node.compute(inputs, *(results[d] for d in node.deps))
+            self._memo[name] = (keys[name], result)
+            results[name] = result
+            if timer:
+                timer.lap(node.stage)
+        if timer and stale:
+            timer.total("valuation")
+        self.recomputed = stale
+
+        verdict_data, negotiation_target = results["verdict"]
+        valuation = {
+            "inputs": inputs,
+            "on_road_data": results["on_road"],
+            "depreciation_data": results["depreciation"],
+            "fair_value_data": results["fair_value"],
+            "verdict_data": verdict_data,
+            "negotiation_target": negotiation_target,
+            "warnings": results["warnings"],
+            "use_advanced": inputs["use_advanced"],
+        }
+        if cache_key is not None:
+            self.cache.put(cache_key, valuation)
+        return valuation
+
+    @staticmethod
+    def _node_results(valuation: dict) -> dict[str, Any]:
+        """Split a calculate_car_value result back into node results."""
+        return {
+            "on_road": valuation["on_road_data"],
+            "depreciation": valuation["depreciation_data"],
+            "fair_value": valuation["fair_value_data"],
+            "verdict": (valuation["verdict_data"], valuation["negotiation_target"]),
+            "warnings": valuation["warnings"],
+        }
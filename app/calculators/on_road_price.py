@@ -10,6 +10,7 @@ from app.data.constants import (
     TCS_RATE,
 )
 from app.data.gst import classify_gst_category, calculate_gst_component
+from app.calculators.results import OnRoadResult
 
 
 def get_insurance_category(ex_showroom: float) -> str:
@@ -93,7 +94,8 @@ def calculate_on_road_price(
     custom_road_tax_rate: Optional[float] = None,
     engine_cc: Optional[int] = None,
     length_mm: Optional[int] = None,
-) -> dict:
+    explain: bool = True,
+) -> OnRoadResult:
     """
     Calculate complete on-road price breakdown.
 
@@ -105,8 +107,10 @@ def calculate_on_road_price(
         custom_road_tax_rate: Optional custom road tax rate (as decimal, e.g., 0.12 for 12%)
         engine_cc: Optional engine capacity in CC (for GST classification)
         length_mm: Optional vehicle length in mm (for GST classification)
+        explain: Build the human-readable slab and GST text (rate_percent,
+            reason, category_name); machine callers can pass False
 
-    Returns a dict with:
+    Returns an OnRoadResult with:
     - ex_showroom: Original ex-showroom price
     - road_tax: Road tax amount
     - road_tax_rate: Road tax percentage used
@@ -122,7 +126,7 @@ def calculate_on_road_price(
     - gst_breakdown: GST component breakdown (base_price, gst_amount)
     """
     # Get detailed slab info from database
-    slab_info = get_slab_info(state, fuel_type, ex_showroom)
+    slab_info = get_slab_info(state, fuel_type, ex_showroom, explain)
     default_road_tax_rate = slab_info["rate"]
 
     # Use custom rate if provided, otherwise use default
@@ -130,12 +134,10 @@ def calculate_on_road_price(
         road_tax_rate = custom_road_tax_rate
         is_custom_rate = True
         # Update slab_info to reflect custom rate
-        slab_info = {
-            **slab_info,
-            "rate": custom_road_tax_rate,
-            "rate_percent": f"{custom_road_tax_rate * 100:.1f}%",
-            "reason": f"Custom road tax rate of {custom_road_tax_rate * 100:.1f}% applied (default for {state} {fuel_type} in {slab_info['slab_range']} is {default_road_tax_rate * 100:.1f}%)",
-        }
+        slab_info = {**slab_info, "rate": custom_road_tax_rate}
+        if explain:
+            slab_info["rate_percent"] = f"{custom_road_tax_rate * 100:.1f}%"
+            slab_info["reason"] = f"Custom road tax rate of {custom_road_tax_rate * 100:.1f}% applied (default for {state} {fuel_type} in {slab_info['slab_range']} is {default_road_tax_rate * 100:.1f}%)"
     else:
         road_tax_rate = default_road_tax_rate
         is_custom_rate = False
@@ -149,21 +151,21 @@ def calculate_on_road_price(
     on_road_price = ex_showroom + road_tax + insurance + fixed_charges + handling_charges + tcs
 
     # GST classification and breakdown
-    gst_info = classify_gst_category(fuel_type, engine_cc, length_mm)
+    gst_info = classify_gst_category(fuel_type, engine_cc, length_mm, explain)
     gst_breakdown = calculate_gst_component(ex_showroom, gst_info["rate"])
 
-    return {
-        "ex_showroom": ex_showroom,
-        "road_tax": road_tax,
-        "road_tax_rate": road_tax_rate,
-        "default_road_tax_rate": default_road_tax_rate,
-        "is_custom_rate": is_custom_rate,
-        "slab_info": slab_info,
-        "insurance": insurance,
-        "fixed_charges": fixed_charges,
-        "handling_charges": handling_charges,
-        "tcs": tcs,
-        "on_road_price": on_road_price,
-        "gst_info": gst_info,
-        "gst_breakdown": gst_breakdown,
-    }
+    return OnRoadResult(
+        ex_showroom,
+        road_tax,
+        road_tax_rate,
+        default_road_tax_rate,
+        is_custom_rate,
+        slab_info,
+        insurance,
+        fixed_charges,
+        handling_charges,
+        tcs,
+        on_road_price,
+        gst_info,
+        gst_breakdown,
+    )
@@ -0,0 +1,145 @@
+"""Lot-level analytics for a dealer inventory.
+
+Listings are valued chunk by chunk with the batch engine and folded into a
+PortfolioSummary in a single pass. Every group (state, fuel type, brand,
+age) keeps only counts and sums in fixed-size arrays indexed by category
+code, so memory does not grow with the number of listings.
+
+Summaries answer:
+- total fair value versus total asking price for the whole lot
+- verdict mix, fair value and asking price per state, fuel type and brand
+- mean depreciation by age
+"""
+
+from itertools import islice
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from app.data.categories import STATE, FUEL, BRAND, encode_columns
+from app.calculators.batch import VERDICT_LABELS, rows_to_columns, value_cars
+
+DEFAULT_PORTFOLIO_CHUNK_SIZE = 5000
+
+# Input column -> Category for the verdict-mix breakdowns
+GROUP_BY = {"state": STATE, "fuel_type": FUEL, "brand": BRAND}
+
+# Label used for values outside a category's known labels
+UNKNOWN_LABEL = "Unknown"
+
+
+class _GroupTotals:
+    """Counts and sums per category code; the last slot collects unknown labels."""
+
+    __slots__ = ("verdicts", "fair_value", "asking_price")
+
+    def __init__(self, size: int):
+        self.verdicts = np.zeros((size + 1, len(VERDICT_LABELS)), dtype=np.int64)
+        self.fair_value = np.zeros(size + 1)
+        self.asking_price = np.zeros(size + 1)
+
+    def add(self, codes: np.ndarray, verdict_code: np.ndarray, fair_value: np.ndarray, asking_price: np.ndarray):
+        slots = len(self.fair_value)
+        # Unknown codes (-1) land in the last slot
+        index = np.where(codes < 0, slots - 1, codes)
+        self.verdicts += np.bincount(
+            index * len(VERDICT_LABELS) + verdict_code,
+            minlength=self.verdicts.size,
+        ).reshape(self.verdicts.shape)
+        self.fair_value += np.bincount(index, weights=fair_value, minlength=slots)
+        self.asking_price += np.bincount(index, weights=asking_price, minlength=slots)
+
+
+class PortfolioSummary:
+    """Streaming aggregates over valued listings (see add())."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_fair_value = 0.0
+        self.total_asking_price = 0.0
+        self.groups = {name: _GroupTotals(len(category)) for name, category in GROUP_BY.items()}
+        # Indexed by age in years (negative ages count as 0)
+        self.age_count = np.zeros(0, dtype=np.int64)
+        self.age_depreciation = np.zeros(0)
+
+    def add(self, columns: Mapping, result: Mapping) -> None:
+        """
+        Fold one valued chunk into the summary.
+
+        Args:
+            columns: value_cars input columns (labels or int8 codes)
+            result: value_cars(columns)
+        """
+        fair_value = result["fair_value"]
+        asking_price = np.asarray(columns["asking_price"], dtype=float)
+        verdict_code = result["verdict_code"]
+
+        self.count += len(fair_value)
+        self.total_fair_value += float(fair_value.sum())
+        self.total_asking_price += float(asking_price.sum())
+
+        encoded = encode_columns({name: columns[name] for name in GROUP_BY})
+        for name, totals in self.groups.items():
+            totals.add(encoded[name], verdict_code, fair_value, asking_price)
+
+        age = np.maximum(result["age"], 0)
+        depreciation = np.where(result["using_advanced"], result["advanced_capped"], result["basic_capped"])
+        age_count = np.bincount(age)
+        if len(age_count) > len(self.age_count):
+            self.age_count = np.pad(self.age_count, (0, len(age_count) - len(self.age_count)))
+            self.age_depreciation = np.pad(self.age_depreciation, (0, len(age_count) - len(self.age_depreciation)))
+        self.age_count[:len(age_count)] += age_count
+        self.age_depreciation[:len(age_count)] += np.bincount(age, weights=depreciation)
+
+    def _group_rows(self, name: str) -> list[dict]:
+        totals = self.groups[name]
+        labels = [*GROUP_BY[name].labels, UNKNOWN_LABEL]
+        rows = []
+        for code, label in enumerate(labels):
+            count = int(totals.verdicts[code].sum())
+            if not count:
+                continue
+            rows.append({
+                name: label,
+                "count": count,
+                "total_fair_value": float(totals.fair_value[code]),
+                "total_asking_price": float(totals.asking_price[code]),
+                "verdicts": dict(zip(VERDICT_LABELS, totals.verdicts[code].tolist())),
+            })
+        return rows
+
+    def to_dict(self) -> dict:
+        """JSON-friendly summary; groups without listings are left out."""
+        verdicts = self.groups["state"].verdicts.sum(axis=0)
+        return {
+            "count": self.count,
+            "total_fair_value": self.total_fair_value,
+            "total_asking_price": self.total_asking_price,
+            "difference_amount": self.total_asking_price - self.total_fair_value,
+            "verdicts": dict(zip(VERDICT_LABELS, verdicts.tolist())),
+            "by_state": self._group_rows("state"),
+            "by_fuel_type": self._group_rows("fuel_type"),
+            "by_brand": self._group_rows("brand"),
+            "depreciation_by_age": [
+                {
+                    "age": age,
+                    "count": int(count),
+                    "mean_depreciation": float(self.age_depreciation[age] / count),
+                }
+                for age, count in enumerate(self.age_count.tolist())
+                if count
+            ],
+        }
+
+
+def summarize_portfolio(
+    listings: Iterable[dict],
+    chunk_size: int = DEFAULT_PORTFOLIO_CHUNK_SIZE,
+) -> PortfolioSummary:
+    """Value validated calculate_car_value-style inputs and aggregate them in one pass."""
+    summary = PortfolioSummary()
+    iterator = iter(listings)
+    while chunk := list(islice(iterator, chunk_size)):
+        columns = encode_columns(rows_to_columns(chunk))
+        summary.add(columns, value_cars(columns))
+    return summary
@@ -0,0 +1,209 @@
+"""Slotted result records returned by the calculators.
+
+The records replace the large per-call dicts. They also support read-only
+dict-style access (``result["fair_value"]``, ``result.get(...)``, ``in``),
+so existing callers keep working, and to_dict() returns the old dict
+shape including the legacy fields.
+
+Records are shared through the valuation cache, so they are read-only:
+assigning a field raises FrozenInstanceError, and the nested dicts
+(slab_info, gst_info, ...) are stored as read-only mappingproxy views. The
+calculators build them positionally (a keyword call with this many
+arguments costs more than the dict it replaces), so field order matters.
+"""
+
+from collections.abc import Mapping
+from dataclasses import FrozenInstanceError, dataclass, fields
+from types import MappingProxyType
+from typing import Any
+
+from app.data.constants import MAX_DEPRECIATION
+
+
+class _RecordType(type):
+    """
+    Builds read-only records without dataclass(frozen=True)'s overhead.
+
+    A frozen dataclass routes every field through object.__setattr__, which
+    nearly doubles the cost of a valuation. Instead the dataclass __init__
+    fills an instance of a mutable twin class (_mutable), whose nested
+    dicts are then wrapped read-only before the instance is switched over
+    to the public class, whose __setattr__ raises.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        mutable = cls._mutable
+        self = object.__new__(mutable)
+        mutable.__init__(self, *args, **kwargs)
+        for name in cls._mapping_fields:
+            setattr(self, name, MappingProxyType(getattr(self, name)))
+        self.__class__ = cls
+        return self
+
+
+class _Record(metaclass=_RecordType):
+    """Dict-style read access and to_dict() for result dataclasses."""
+
+    __slots__ = ()
+    _mutable: type
+    _legacy_fields: tuple[str, ...] = ()
+    _mapping_fields: tuple[str, ...] = ()
+    _keys: tuple[str, ...] = ()
+    _key_set: frozenset = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._key_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._key_set:
+            return getattr(self, key)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_set
+
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def to_dict(self) -> dict:
+        """The record as a plain dict, in the calculators' original key order."""
+        data = {key: getattr(self, key) for key in self._keys}
+        for name in self._mapping_fields:
+            data[name] = dict(data[name])
+        return data
+
+    def __reduce__(self):
+        return type(self), tuple(self.to_dict()[f.name] for f in fields(self))
+
+
+def _frozen_setattr(self, name: str, value: Any = None) -> None:
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _record(cls: type) -> type:
+    """Make cls a read-only slotted dataclass and index its keys for dict-style access."""
+    mutable = dataclass(slots=True)(cls)
+    record = type(mutable)(cls.__name__, (mutable,), {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        "__setattr__": _frozen_setattr,
+        "__delattr__": _frozen_setattr,
+    })
+    record._mutable = mutable
+    record._mapping_fields = tuple(f.name for f in fields(record) if f.type is Mapping)
+    record._keys = (*(f.name for f in fields(record)), *record._legacy_fields)
+    record._key_set = frozenset(record._keys)
+    return record
+
+
+@_record
+class OnRoadResult(_Record):
+    """On-road price breakdown (see calculate_on_road_price)."""
+    ex_showroom: float
+    road_tax: float
+    road_tax_rate: float
+    default_road_tax_rate: float
+    is_custom_rate: bool
+    slab_info: Mapping
+    insurance: float
+    fixed_charges: float
+    handling_charges: float
+    tcs: float
+    on_road_price: float
+    gst_info: Mapping
+    gst_breakdown: Mapping
+
+
+@_record
+class DepreciationResult(_Record):
+    """Depreciation breakdown (see calculate_total_depreciation)."""
+    age: int
+    life_years: int
+    # Basic formula components
+    life_depreciation: float
+    ownership_premium: float
+    mileage_adjustment: float
+    mileage_status: str
+    # Basic totals
+    basic_total: float
+    basic_capped: float
+    basic_is_capped: bool
+    # Advanced adjustments
+    brand_adjustment: float
+    brand_multiplier: float
+    transmission_adjustment: float
+    condition_adjustments: Mapping
+    # Advanced totals
+    advanced_adjustments_total: float
+    advanced_total: float
+    advanced_capped: float
+    advanced_is_capped: bool
+
+    _legacy_fields = ("total_raw", "total_capped", "is_capped")
+
+    # Legacy fields for backward compatibility
+    @property
+    def total_raw(self) -> float:
+        return self.advanced_total
+
+    @property
+    def total_capped(self) -> float:
+        return self.advanced_capped
+
+    @property
+    def is_capped(self) -> bool:
+        return self.advanced_total > MAX_DEPRECIATION
+
+
+@_record
+class FairValueResult(_Record):
+    """Basic and advanced fair values (see calculate_complete_fair_value)."""
+    # Basic formula results
+    basic_fair_value: float
+    basic_adjusted: float
+    basic_min: float
+    basic_max: float
+    # Advanced formula results
+    advanced_fair_value: float
+    advanced_adjusted: float
+    advanced_min: float
+    advanced_max: float
+    # Difference between basic and advanced
+    adjustment_difference: float
+    # Insurance
+    insurance_deduction: float
+    # Primary values (selected based on use_advanced)
+    fair_value: float
+    fair_value_min: float
+    fair_value_max: float
+    using_advanced: bool
+
+    _legacy_fields = ("base_fair_value",)
+
+    # Legacy compatibility
+    @property
+    def base_fair_value(self) -> float:
+        return self.advanced_fair_value if self.using_advanced else self.basic_fair_value
+
+
+@_record
+class Verdict(_Record):
+    """Deal verdict (see get_verdict)."""
+    verdict: str
+    emoji: str
+    color: str
+    difference_percent: float
+    difference_amount: float
+
+
+def to_plain(value: Any) -> dict:
+    """json.dumps ``default`` hook: convert result records and their mappings to dicts."""
+    if isinstance(value, _Record):
+        return value.to_dict()
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,73 @@
+"""What-if fair value surface over model year and kilometres driven.
+
+The (year, km) grid is flattened into columns, with every other input
+repeated for each cell, and valued in one call to the batch engine
+(app.calculators.batch.value_cars). The valuation rules live only in the
+calculators and the batch engine, so the surface cannot drift from the
+quoted fair value: every cell equals calculate_car_value for those inputs.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from app.data.categories import CATEGORIES, CODE_DTYPE
+from app.calculators.batch import COLUMN_DEFAULTS, REQUIRED_COLUMNS, value_cars
+
+# Inputs that stay fixed across the grid
+_FIXED_COLUMNS = [name for name in (*REQUIRED_COLUMNS, *COLUMN_DEFAULTS) if name not in ("year", "km")]
+
+
+def _repeat(name: str, value, size: int) -> np.ndarray:
+    """value_cars column holding value for every cell (categories pre-encoded)."""
+    if name in CATEGORIES:
+        return np.full(size, CATEGORIES[name].code(value), dtype=CODE_DTYPE)
+    return np.full(size, np.nan if value is None else value)
+
+
+def fair_value_surface(
+    base_inputs: dict,
+    years: Sequence[int],
+    km_grid: Sequence[int],
+) -> dict:
+    """
+    Fair values for every (year, km) combination of an otherwise fixed car.
+
+    Args:
+        base_inputs: calculate_car_value-style inputs; "year" and "km" are
+            ignored in favour of the grid
+        years: Model years (rows of the surface)
+        km_grid: Kilometres driven (columns of the surface)
+
+    Returns dict with:
+    - years, km: the grid axes as arrays
+    - on_road_price, insurance_deduction: shared by every cell
+    - basic_capped, advanced_capped: depreciation, shape (len(years), len(km_grid))
+    - basic_adjusted, advanced_adjusted: fair values after insurance, same shape
+    - fair_value: basic or advanced per use_advanced, same shape
+    """
+    year = np.asarray(years, dtype=np.int64)
+    km = np.asarray(km_grid, dtype=np.int64)
+    shape = (len(year), len(km))
+    size = shape[0] * shape[1]
+
+    columns = {
+        name: _repeat(name, base_inputs[name], size)
+        for name in _FIXED_COLUMNS
+        if name in base_inputs
+    }
+    columns["year"] = np.repeat(year, len(km))
+    columns["km"] = np.tile(km, len(year))
+    results = value_cars(columns)
+
+    surface = {
+        name: results[name].reshape(shape)
+        for name in ("basic_capped", "advanced_capped", "basic_adjusted", "advanced_adjusted", "fair_value")
+    }
+    return {
+        "years": year,
+        "km": km,
+        "on_road_price": float(results["on_road_price"][0]) if size else 0.0,
+        "insurance_deduction": float(results["insurance_deduction"][0]) if size else 0.0,
+        **surface,
+    }
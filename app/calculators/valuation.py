@@ -0,0 +1,154 @@
+"""End-to-end valuation pipeline for a single car."""
+
+from app.calculators.on_road_price import calculate_on_road_price
+from app.calculators.depreciation import calculate_total_depreciation
+from app.calculators.fair_value import calculate_complete_fair_value
+from app.calculators.verdict import get_verdict, get_negotiation_target, generate_warnings
+from app.calculators.cache import ValuationCache, make_key
+from app.calculators.results import OnRoadResult, DepreciationResult, FairValueResult, Verdict
+from app.config import VALUATION_CACHE_SIZE, VALUATION_CACHE_TTL
+from app.metrics import METRICS
+
+# Process-wide cache shared by every Streamlit session and API request
+VALUATION_CACHE = ValuationCache(maxsize=VALUATION_CACHE_SIZE, ttl=VALUATION_CACHE_TTL)
+
+
+def on_road_stage(inputs: dict, explain: bool = True) -> OnRoadResult:
+    """On-road price (ex-showroom, state, fuel and specs only)."""
+    return calculate_on_road_price(
+        ex_showroom=inputs["ex_showroom"],
+        state=inputs["state"],
+        fuel_type=inputs["fuel_type"],
+        custom_road_tax_rate=inputs.get("custom_road_tax_rate"),
+        engine_cc=inputs.get("engine_cc"),
+        length_mm=inputs.get("length_mm"),
+        explain=explain,
+    )
+
+
+def depreciation_stage(inputs: dict) -> DepreciationResult:
+    """Basic and advanced depreciation (age, usage and condition only)."""
+    return calculate_total_depreciation(
+        year=inputs["year"],
+        fuel_type=inputs["fuel_type"],
+        state=inputs["state"],
+        owner=inputs["owner"],
+        km=inputs["km"],
+        brand=inputs["brand"],
+        transmission=inputs["transmission"],
+        body_condition=inputs["body_condition"],
+        accident_history=inputs["accident_history"],
+        service_history=inputs["service_history"],
+        commercial_use=inputs["commercial_use"],
+        new_gen_available=inputs["new_gen_available"],
+    )
+
+
+def fair_value_stage(
+    inputs: dict,
+    on_road_data: OnRoadResult,
+    depreciation_data: DepreciationResult,
+) -> FairValueResult:
+    """Fair value from the on-road price and depreciation."""
+    return calculate_complete_fair_value(
+        on_road_price=on_road_data["on_road_price"],
+        basic_depreciation=depreciation_data["basic_capped"],
+        advanced_depreciation=depreciation_data["advanced_capped"],
+        insurance_valid=inputs["insurance_status"] == "Valid",
+        ex_showroom=inputs["ex_showroom"],
+        use_advanced=inputs["use_advanced"],
+    )
+
+
+def verdict_stage(inputs: dict, fair_value_data: FairValueResult) -> tuple[Verdict, float]:
+    """Verdict and negotiation target for the asking price."""
+    verdict_data = get_verdict(
+        asking_price=inputs["asking_price"],
+        fair_value=fair_value_data["fair_value"],
+    )
+    negotiation_target = get_negotiation_target(
+        fair_value=fair_value_data["fair_value"],
+        verdict_result=verdict_data,
+    )
+    return verdict_data, negotiation_target
+
+
+def warnings_stage(inputs: dict, depreciation_data: DepreciationResult) -> list[dict]:
+    """Buyer warnings (listing details plus age and mileage status)."""
+    return generate_warnings(
+        fuel_type=inputs["fuel_type"],
+        state=inputs["state"],
+        age=depreciation_data["age"],
+        mileage_status=depreciation_data["mileage_status"],
+        owner=inputs["owner"],
+        accident_history=inputs["accident_history"],
+        commercial_use=inputs["commercial_use"],
+        transmission=inputs["transmission"],
+    )
+
+
+def calculate_car_value(inputs: dict, explain: bool = True) -> dict:
+    """
+    Run all calculations for a single car.
+
+    With explain=False the slab and GST info carry numbers only (no
+    rate_percent, reason or category_name), which is cheaper for callers
+    that never display them.
+
+    Returns dict with all calculation results.
+    """
+    timer = METRICS.timer()
+
+    on_road_data = on_road_stage(inputs, explain)
+    if timer:
+        timer.lap("on_road_price")
+
+    depreciation_data = depreciation_stage(inputs)
+    if timer:
+        timer.lap("depreciation")
+
+    fair_value_data = fair_value_stage(inputs, on_road_data, depreciation_data)
+    if timer:
+        timer.lap("fair_value")
+
+    verdict_data, negotiation_target = verdict_stage(inputs, fair_value_data)
+    if timer:
+        timer.lap("verdict")
+
+    warnings = warnings_stage(inputs, depreciation_data)
+    if timer:
+        timer.lap("warnings")
+        timer.total("valuation")
+
+    return {
+        "inputs": inputs,
+        "on_road_data": on_road_data,
+        "depreciation_data": depreciation_data,
+        "fair_value_data": fair_value_data,
+        "verdict_data": verdict_data,
+        "negotiation_target": negotiation_target,
+        "warnings": warnings,
+        "use_advanced": inputs["use_advanced"],
+    }
+
+
+def valuation_key(inputs: dict) -> tuple:
+    """VALUATION_CACHE key for the calculate_car_value(inputs) result."""
+    return make_key(inputs)
+
+
+def cached_car_value(inputs: dict) -> dict:
+    """
+    calculate_car_value through the process-wide LRU cache.
+
+    Identical inputs return the same (read-only) result dict. Entries expire
+    after VALUATION_CACHE_TTL seconds. Ages are computed against
+    CURRENT_YEAR, which is fixed when the process starts (as is the UI's
+    year list), so restart long-running processes after the year changes.
+    """
+    key = valuation_key(inputs)
+    result = VALUATION_CACHE.get(key)
+    if result is None:
+        result = calculate_car_value(inputs)
+        VALUATION_CACHE.put(key, result)
+    return result
@@ -2,6 +2,10 @@
 
 from app.data.constants import VERDICT_THRESHOLDS
 from app.data.road_tax import is_ncr_state
+from app.calculators.results import Verdict
+
+# Every verdict get_verdict can return, best deal first
+VERDICTS = ["Great Deal", "Good Deal", "Fair Price", "Slightly Overpriced", "Overpriced"]
 
 
 def calculate_difference_percent(asking_price: float, fair_value: float) -> float:
@@ -11,11 +15,11 @@ def calculate_difference_percent(asking_price: float, fair_value: float) -> floa
     return (asking_price - fair_value) / fair_value
 
 
-def get_verdict(asking_price: float, fair_value: float) -> dict:
+def get_verdict(asking_price: float, fair_value: float) -> Verdict:
     """
     Determine verdict based on asking price vs fair value.
 
-    Returns dict with:
+    Returns a Verdict with:
     - verdict: Text verdict
     - emoji: Verdict emoji
     - color: CSS color for display
@@ -46,16 +50,16 @@ def get_verdict(asking_price: float, fair_value: float) -> dict:
         emoji = "x-circle"
         color = "error"
 
-    return {
-        "verdict": verdict,
-        "emoji": emoji,
-        "color": color,
-        "difference_percent": diff_percent,
-        "difference_amount": diff_amount,
-    }
+    return Verdict(
+        verdict,
+        emoji,
+        color,
+        diff_percent,  # difference_percent
+        diff_amount,  # difference_amount
+    )
 
 
-def get_negotiation_target(fair_value: float, verdict_result: dict) -> float:
+def get_negotiation_target(fair_value: float, verdict_result: Verdict) -> float:
     """
     Calculate suggested negotiation target price.
 
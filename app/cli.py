@@ -0,0 +1,262 @@
+"""CarWorth command-line interface for bulk valuations.
+
+Usage:
+    python -m app.cli value listings.csv --output results.csv --errors rejected.jsonl
+    cat listings.jsonl | python -m app.cli value --format jsonl > results.jsonl
+    python -m app.cli value inventory.csv -o results.csv --workers 8
+    python -m app.cli value inventory.parquet -o results.parquet --compression zstd
+    python -m app.cli report inventory.csv -o reports.zip
+    python -m app.cli portfolio inventory.csv -o summary.json
+    python -m app.cli snapshot
+
+Listings are read, validated and valued lazily in chunks, so memory stays
+flat regardless of input size. With more than one worker, chunks are
+spread across processes and merged back in input order.
+"""
+
+import argparse
+import json
+import sys
+import time
+from contextlib import ExitStack
+from typing import IO, Iterable, Iterator, Optional
+
+from app.calculators.batch import RESULT_FIELDS, value_rows
+from app.calculators.portfolio import DEFAULT_PORTFOLIO_CHUNK_SIZE, summarize_portfolio
+from app.utils.listings import (
+    LISTING_FIELDS,
+    LISTING_FORMATS,
+    RecordWriter,
+    chunked,
+    detect_format,
+    iter_listings,
+    read_listings,
+)
+from app.utils.parallel import default_workers, iter_parallel_valuations
+from app.data.snapshot import SNAPSHOT_PATH, build, load_tables
+from app.utils.columnar import COLUMNAR_FORMATS, COMPRESSIONS, ColumnarWriter, read_columnar_listings
+from app.utils.bulk_reports import (
+    DEFAULT_REPORT_CHUNK_SIZE,
+    REPORT_OUTPUTS,
+    write_report_pdf,
+    write_report_zip,
+)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+INPUT_FORMATS = [*LISTING_FORMATS, *COLUMNAR_FORMATS]
+
+OUTPUT_FIELDS = ["line", *LISTING_FIELDS, *RESULT_FIELDS]
+
+def iter_valuations(listings: Iterable[dict], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """Value listings chunk by chunk with the batch engine, yielding flat records."""
+    for chunk in chunked(listings, chunk_size):
+        yield from value_rows(chunk)
+
+
+class _ErrorLog:
+    """Error side channel: JSONL records to a file, or short lines to stderr."""
+
+    def __init__(self, stream: Optional[IO[str]]):
+        self.stream = stream
+        self.count = 0
+
+    def __call__(self, line_number: int, errors: list[str], raw) -> None:
+        self.count += 1
+        if self.stream is None:
+            print(f"line {line_number}: {'; '.join(errors)}", file=sys.stderr)
+            return
+        row = raw if isinstance(raw, dict) else None
+        self.stream.write(json.dumps({"line": line_number, "errors": errors, "row": row}))
+        self.stream.write("\n")
+
+
+def _open(stack: ExitStack, path: Optional[str], mode: str, default: IO[str]) -> IO[str]:
+    if path is None or path == "-":
+        return default
+    return stack.enter_context(open(path, mode, newline="", encoding="utf-8"))
+
+
+def _read_rows(stack: ExitStack, args: argparse.Namespace, input_format: str) -> Iterator[tuple[int, object]]:
+    """Raw (line_number, row) pairs from the input file or stdin."""
+    if input_format in COLUMNAR_FORMATS:
+        if args.input is None or args.input == "-":
+            raise SystemExit(f"{input_format} input must be a file, not stdin")
+        return read_columnar_listings(args.input, input_format, batch_size=args.chunk_size)
+    return read_listings(_open(stack, args.input, "r", sys.stdin), input_format)
+
+
+def run_value(args: argparse.Namespace) -> int:
+    """Run the ``value`` subcommand."""
+    input_format = args.format or detect_format(args.input)
+    output_format = args.output_format or detect_format(args.output, default=input_format)
+
+    with ExitStack() as stack:
+        error_log = _ErrorLog(_open(stack, args.errors, "w", None) if args.errors else None)
+
+        if output_format in COLUMNAR_FORMATS:
+            if args.output is None or args.output == "-":
+                raise SystemExit(f"{output_format} output needs --output FILE")
+            if args.compression and args.compression not in COMPRESSIONS[output_format]:
+                raise SystemExit(f"--compression {args.compression} is not supported for {output_format}")
+            writer = stack.enter_context(ColumnarWriter(
+                args.output, output_format, OUTPUT_FIELDS, args.chunk_size, args.compression,
+            ))
+        else:
+            writer = RecordWriter(_open(stack, args.output, "w", sys.stdout), output_format, OUTPUT_FIELDS)
+        start = time.perf_counter()
+        valued = 0
+
+        rows = _read_rows(stack, args, input_format)
+        workers = args.workers or default_workers()
+        if workers > 1:
+            records = iter_parallel_valuations(rows, args.chunk_size, workers, on_error=error_log)
+        else:
+            records = iter_valuations(iter_listings(rows, on_error=error_log), chunk_size=args.chunk_size)
+
+        for record in records:
+            writer.write(record)
+            valued += 1
+
+        elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        total = valued + error_log.count
+        rate = total / elapsed if elapsed > 0 else 0.0
+        print(
+            f"Valued {valued:,} listings ({error_log.count:,} rejected) "
+            f"in {elapsed:.2f}s ({rate:,.0f} rows/s)",
+            file=sys.stderr,
+        )
+    return 0
+
+
+def run_report(args: argparse.Namespace) -> int:
+    """Run the ``report`` subcommand."""
+    input_format = args.format or detect_format(args.input)
+    output_kind = args.output_as or ("zip" if args.output.lower().endswith(".zip") else "pdf")
+
+    with ExitStack() as stack:
+        source = _open(stack, args.input, "r", sys.stdin)
+        if args.output == "-":
+            sink = sys.stdout.buffer
+        else:
+            sink = stack.enter_context(open(args.output, "wb"))
+        error_log = _ErrorLog(_open(stack, args.errors, "w", None) if args.errors else None)
+
+        start = time.perf_counter()
+        rows = read_listings(source, input_format)
+        if output_kind == "zip":
+            written = write_report_zip(rows, sink, args.chunk_size, args.workers, on_error=error_log)
+        else:
+            written = write_report_pdf(rows, sink, on_error=error_log)
+        elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        rate = written / elapsed if elapsed > 0 else 0.0
+        print(
+            f"Rendered {written:,} reports ({error_log.count:,} rejected) "
+            f"in {elapsed:.2f}s ({rate:,.1f} reports/s)",
+            file=sys.stderr,
+        )
+    return 0
+
+
+def run_portfolio(args: argparse.Namespace) -> int:
+    """Run the ``portfolio`` subcommand."""
+    input_format = args.format or detect_format(args.input)
+
+    with ExitStack() as stack:
+        sink = _open(stack, args.output, "w", sys.stdout)
+        error_log = _ErrorLog(_open(stack, args.errors, "w", None) if args.errors else None)
+
+        start = time.perf_counter()
+        listings = iter_listings(_read_rows(stack, args, input_format), on_error=error_log)
+        summary = summarize_portfolio(listings, chunk_size=args.chunk_size).to_dict()
+        summary["rejected"] = error_log.count
+        json.dump(summary, sink, indent=2)
+        sink.write("\n")
+        elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        total = summary["count"] + error_log.count
+        rate = total / elapsed if elapsed > 0 else 0.0
+        print(
+            f"Summarized {summary['count']:,} listings ({error_log.count:,} rejected) "
+            f"in {elapsed:.2f}s ({rate:,.0f} rows/s)",
+            file=sys.stderr,
+        )
+    return 0
+
+
+def run_snapshot(args: argparse.Namespace) -> int:
+    """Run the ``snapshot`` subcommand."""
+    if args.check:
+        if load_tables(args.output) is None:
+            print(f"{args.output} is missing or stale", file=sys.stderr)
+            return 1
+        print(f"{args.output} is up to date", file=sys.stderr)
+        return 0
+
+    path = build(args.output)
+    print(f"Wrote {path} ({path.stat().st_size:,} bytes)", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="CarWorth bulk tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    value = subcommands.add_parser("value", help="Value listings from CSV, JSONL, Parquet or Arrow")
+    value.add_argument("input", nargs="?", help="Input file (default: stdin)")
+    value.add_argument("-f", "--format", choices=INPUT_FORMATS, help="Input format (default: from extension, else csv)")
+    value.add_argument("-o", "--output", help="Output file (default: stdout)")
+    value.add_argument("--output-format", choices=INPUT_FORMATS, help="Output format (default: from extension, else input format)")
+    value.add_argument("--compression", choices=sorted(set(COMPRESSIONS["parquet"]) | set(COMPRESSIONS["arrow"])), help="Parquet/Arrow output compression (default: snappy for Parquet, none for Arrow)")
+    value.add_argument("--errors", help="Write rejected rows as JSONL to this file (default: stderr)")
+    value.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows valued per batch")
+    value.add_argument("-w", "--workers", type=int, help="Worker processes (default: number of cores; 1 disables the pool)")
+    value.add_argument("-q", "--quiet", action="store_true", help="Do not print the throughput summary")
+    value.set_defaults(handler=run_value)
+
+    report = subcommands.add_parser("report", help="Render PDF valuation reports for listings")
+    report.add_argument("input", nargs="?", help="Input file (default: stdin)")
+    report.add_argument("-f", "--format", choices=LISTING_FORMATS, help="Input format (default: from extension, else csv)")
+    report.add_argument("-o", "--output", required=True, help="Output .zip or .pdf file ('-' for stdout)")
+    report.add_argument("--as", dest="output_as", choices=REPORT_OUTPUTS, help="ZIP of per-car PDFs or one multi-page PDF (default: from extension)")
+    report.add_argument("--errors", help="Write rejected rows as JSONL to this file (default: stderr)")
+    report.add_argument("--chunk-size", type=int, default=DEFAULT_REPORT_CHUNK_SIZE, help="Reports rendered per worker task")
+    report.add_argument("-w", "--workers", type=int, help="Worker processes for ZIP output (default: number of cores)")
+    report.add_argument("-q", "--quiet", action="store_true", help="Do not print the throughput summary")
+    report.set_defaults(handler=run_report)
+
+    portfolio = subcommands.add_parser("portfolio", help="Aggregate an inventory: totals, verdict mix, depreciation by age")
+    portfolio.add_argument("input", nargs="?", help="Input file (default: stdin)")
+    portfolio.add_argument("-f", "--format", choices=INPUT_FORMATS, help="Input format (default: from extension, else csv)")
+    portfolio.add_argument("-o", "--output", help="Output JSON file (default: stdout)")
+    portfolio.add_argument("--errors", help="Write rejected rows as JSONL to this file (default: stderr)")
+    portfolio.add_argument("--chunk-size", type=int, default=DEFAULT_PORTFOLIO_CHUNK_SIZE, help="Rows valued per batch")
+    portfolio.add_argument("-q", "--quiet", action="store_true", help="Do not print the throughput summary")
+    portfolio.set_defaults(handler=run_portfolio)
+
+    snapshot = subcommands.add_parser("snapshot", help="Compile the lookup tables into a memory-mappable snapshot")
+    snapshot.add_argument("-o", "--output", default=str(SNAPSHOT_PATH), help="Snapshot path (default: %(default)s)")
+    snapshot.add_argument("--check", action="store_true", help="Only check the snapshot; exit 1 if missing or stale")
+    snapshot.set_defaults(handler=run_snapshot)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point."""
+    args = build_parser().parse_args(argv)
+    if getattr(args, "chunk_size", 1) < 1:
+        raise SystemExit("--chunk-size must be at least 1")
+    if (getattr(args, "workers", None) or 1) < 1:
+        raise SystemExit("--workers must be at least 1")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Micro-batching for concurrent single-item requests.
+
+A Coalescer collects the items submitted on one event loop within a short
+window (max_wait seconds, or until max_batch items are queued), runs them
+through a batch function in one call and resolves every caller's future
+with its own result. The batch function runs on the event loop: it should
+be a vectorized path that takes well under a millisecond per item.
+
+Usage:
+    coalescer = Coalescer(value_rows, max_batch=256, max_wait=0.002)
+    record = await coalescer.submit(inputs)
+"""
+
+import asyncio
+import time
+from typing import Callable, Generic, Optional, Sequence, TypeVar
+
+from app.metrics import Histogram
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Coalescer(Generic[T, R]):
+    """
+    Groups concurrent submit() calls into batch_fn calls.
+
+    batch_fn(items) must return one result per item, in order. If it
+    raises, every caller in that batch gets the exception. Not thread-safe;
+    use from a single event loop at a time.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[T]], Sequence[R]],
+        max_batch: int = 256,
+        max_wait: float = 0.002,
+    ):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: list[tuple[T, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.batches = 0
+        self.items = 0
+        self.full_batches = 0  # flushed by max_batch rather than the timer
+        self.max_batch_size = 0
+        self.queue_wait = Histogram()  # seconds from submit() to batch start
+
+    async def submit(self, item: T) -> R:
+        """Queue item for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pending work from a closed loop can never run; start afresh
+            self._loop = loop
+            self._pending = []
+            self._timer = None
+
+        future = loop.create_future()
+        self._pending.append((item, future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch:
+            self._flush(full=True)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self, full: bool = False) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        for _, _, submitted in batch:
+            self.queue_wait.observe(start - submitted)
+        self.batches += 1
+        self.items += len(batch)
+        self.full_batches += full
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+
+        try:
+            results = self.batch_fn([item for item, _, _ in batch])
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            # A caller that went away (cancelled) no longer wants its result
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        """Batch-size and queue-wait statistics since the last reset."""
+        wait = self.queue_wait
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "full_batches": self.full_batches,
+            "queue_wait_mean": wait.total / wait.count if wait.count else 0.0,
+            "queue_wait_p50": wait.quantile(0.50) if wait.count else 0.0,
+            "queue_wait_p99": wait.quantile(0.99) if wait.count else 0.0,
+        }
@@ -1,8 +1,12 @@
-from .input_form import render_input_form
-from .results_card import render_results_card
-from .breakdown import render_breakdown
-from .warnings import render_warnings
-from .checklist import render_checklist
+# Components are imported on first use, so that importing one of them (e.g.
+# app.components.splash) does not pull in the others and their dependencies
+_LAZY_ATTRIBUTES = {
+    "render_input_form": "input_form",
+    "render_results_card": "results_card",
+    "render_breakdown": "breakdown",
+    "render_warnings": "warnings",
+    "render_checklist": "checklist",
+}
 
 __all__ = [
     "render_input_form",
@@ -11,3 +15,11 @@ __all__ = [
     "render_warnings",
     "render_checklist",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        return getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,6 @@
 """Calculation breakdown component with modern styling."""
 
 import streamlit as st
-import streamlit_shadcn_ui as ui
 from app.utils.formatters import (
     format_currency,
     format_currency_lakhs,
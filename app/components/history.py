@@ -1,19 +1,62 @@
-"""Local history component for storing recent valuations."""
+"""Valuation history component, backed by the durable history store.
+
+Session state only holds this browser's history id, the last submitted
+write and the current page; entries live in app.history_store. The id is
+mirrored in the ``history`` query parameter so reloading or bookmarking
+the page keeps the same history.
+
+The id is a bearer token: anyone with the URL can read and clear that
+history, and it ends up wherever the URL goes (browser history, shared
+links, proxy and access logs). It is a random 128-bit value, never derived
+from the user, and entries expire with the store's retention limits.
+"""
+
+import math
+import re
+import secrets
+import time
+from datetime import datetime
 
 import streamlit as st
-from datetime import datetime
+
+from app.config import HISTORY_PAGE_SIZE
+from app.calculators.verdict import VERDICTS
+from app.data.constants import STATES, FUEL_TYPES
+from app.history_store import HistoryFilter, get_history_writer
 from app.utils.formatters import format_currency_lakhs
 
+ALL = "All"
+
+# Date filter label -> look-back in seconds (None = any time)
+DATE_RANGES = {
+    "Any time": None,
+    "Today": 86400,
+    "Last 7 days": 7 * 86400,
+    "Last 30 days": 30 * 86400,
+}
+
+# Longest a render waits for this session's queued writes to be committed
+WRITE_WAIT_TIMEOUT = 2.0
+
+_HISTORY_ID = re.compile(r"[0-9a-f]{32}")
+
 
 def init_history():
-    """Initialize history in session state."""
-    if "valuation_history" not in st.session_state:
-        st.session_state["valuation_history"] = []
+    """Give this session a history id, reusing the one in the URL if any."""
+    if "history_id" in st.session_state:
+        return
+
+    history_id = st.query_params.get("history", "")
+    if not _HISTORY_ID.fullmatch(history_id):
+        history_id = secrets.token_hex(16)
+        st.query_params["history"] = history_id
+    st.session_state["history_id"] = history_id
+    st.session_state["history_page"] = 0
 
 
 def add_to_history(inputs: dict, fair_value: float, verdict: str):
     """
-    Add a valuation to history.
+    Add a valuation to history (written in the background).
 
     Args:
         inputs: User input values
@@ -22,9 +65,9 @@ def add_to_history(inputs: dict, fair_value: float, verdict: str):
     """
     init_history()
 
-    # Create history entry
     entry = {
-        "timestamp": datetime.now().strftime("%d %b %Y, %I:%M %p"),
+        "session_id": st.session_state["history_id"],
+        "created_at": time.time(),
         "year": inputs["year"],
         "fuel_type": inputs["fuel_type"],
         "ex_showroom": inputs["ex_showroom"],
@@ -35,27 +78,65 @@ def add_to_history(inputs: dict, fair_value: float, verdict: str):
         "verdict": verdict,
     }
 
-    # Add to history (most recent first)
-    st.session_state["valuation_history"].insert(0, entry)
+    st.session_state["history_seq"] = get_history_writer().submit(entry)
+    st.session_state["history_page"] = 0
+
 
-    # Keep only last 10 entries
-    if len(st.session_state["valuation_history"]) > 10:
-        st.session_state["valuation_history"] = st.session_state["valuation_history"][:10]
+def _reset_page():
+    st.session_state["history_page"] = 0
+
+
+def _set_page(page: int):
+    st.session_state["history_page"] = page
+
+
+def _render_filters() -> HistoryFilter:
+    """Filter controls; returns the filter for this session's history."""
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        state = st.selectbox("State", [ALL, *STATES], key="history_state", on_change=_reset_page)
+    with col2:
+        fuel_type = st.selectbox("Fuel", [ALL, *FUEL_TYPES], key="history_fuel", on_change=_reset_page)
+    with col3:
+        verdict = st.selectbox("Verdict", [ALL, *VERDICTS], key="history_verdict", on_change=_reset_page)
+    with col4:
+        date_range = st.selectbox("Date", list(DATE_RANGES), key="history_date", on_change=_reset_page)
+
+    look_back = DATE_RANGES[date_range]
+    return HistoryFilter(
+        session_id=st.session_state["history_id"],
+        state=None if state == ALL else state,
+        fuel_type=None if fuel_type == ALL else fuel_type,
+        verdict=None if verdict == ALL else verdict,
+        since=None if look_back is None else time.time() - look_back,
+    )
 
 
 def render_history():
-    """Render the history section with clean styling."""
+    """Render one page of this session's history with clean styling."""
     init_history()
 
-    history = st.session_state["valuation_history"]
+    writer = get_history_writer()
+    # Make sure the valuation just calculated is visible
+    writer.wait(st.session_state.get("history_seq", 0), timeout=WRITE_WAIT_TIMEOUT)
 
-    if not history:
-        st.caption("No recent valuations. History will appear here after you calculate a car's value.")
+    filters = _render_filters()
+    total = writer.store.count(filters)
+
+    if not total:
+        if filters == HistoryFilter(session_id=filters.session_id):
+            st.caption("No recent valuations. History will appear here after you calculate a car's value.")
+        else:
+            st.caption("No valuations match these filters.")
         return
 
-    st.markdown("**Recent Valuations** (this session)")
+    pages = math.ceil(total / HISTORY_PAGE_SIZE)
+    page = min(st.session_state.get("history_page", 0), pages - 1)
+    entries = writer.store.query(filters, limit=HISTORY_PAGE_SIZE, offset=page * HISTORY_PAGE_SIZE)
+
+    st.markdown(f"**Recent Valuations** ({total} saved)")
 
-    for i, entry in enumerate(history):
+    for i, entry in enumerate(entries):
         # Color based on verdict
         if entry["verdict"] in ["Great Deal", "Good Deal"]:
             verdict_color = "green"
@@ -66,10 +147,10 @@ def render_history():
 
         with st.expander(
             f"{entry['year']} {entry['fuel_type']} - {entry['verdict']}",
-            expanded=(i == 0),
+            expanded=(page == 0 and i == 0),
         ):
             # Use columns for layout instead of HTML
-            st.caption(f"🕐 {entry['timestamp']}")
+            st.caption(f"🕐 {datetime.fromtimestamp(entry['created_at']).strftime('%d %b %Y, %I:%M %p')}")
 
             col1, col2 = st.columns(2)
 
@@ -101,7 +182,22 @@ def render_history():
             else:
                 st.warning(f"**{entry['verdict']}** | 📍 {entry['state']}")
 
+    if pages > 1:
+        col_prev, col_page, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            st.button("← Newer", key="history_prev", disabled=page == 0,
+                      on_click=_set_page, args=(page - 1,), use_container_width=True)
+        with col_page:
+            st.caption(f"Page {page + 1} of {pages}")
+        with col_next:
+            st.button("Older →", key="history_next", disabled=page >= pages - 1,
+                      on_click=_set_page, args=(page + 1,), use_container_width=True)
+
 
 def clear_history():
-    """Clear all history."""
-    st.session_state["valuation_history"] = []
+    """Delete all of this session's history."""
+    init_history()
+    writer = get_history_writer()
+    writer.wait(st.session_state.get("history_seq", 0), timeout=WRITE_WAIT_TIMEOUT)
+    writer.store.delete(HistoryFilter(session_id=st.session_state["history_id"]))
+    st.session_state["history_page"] = 0
@@ -13,21 +13,9 @@ from app.data.constants import (
     SERVICE_OPTIONS,
     INSURANCE_OPTIONS,
     YEARS,
+    ADVANCED_DEFAULTS,
 )
 
-# Default values for advanced options
-ADVANCED_DEFAULTS = {
-    "brand": "Other",
-    "transmission": "Manual",
-    "body_condition": "Good",
-    "accident_history": "None",
-    "service_history": "Unknown",
-    "commercial_use": False,
-    "new_gen_available": False,
-    "engine_cc": None,
-    "length_mm": None,
-}
-
 
 def _render_car_inputs(key_prefix: str = "", label: str = "Car Details") -> dict:
     """
@@ -0,0 +1,96 @@
+"""Portfolio page: lot-level analytics for an uploaded inventory."""
+
+import io
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+from app.calculators.batch import VERDICT_LABELS
+from app.calculators.portfolio import summarize_portfolio
+from app.utils.formatters import format_currency_lakhs, format_lakhs_column
+from app.utils.listings import detect_format, iter_listings, read_listings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+GROUP_TITLES = {
+    "by_state": ("state", "State"),
+    "by_fuel_type": ("fuel_type", "Fuel Type"),
+    "by_brand": ("brand", "Brand"),
+}
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def summarize_upload(data: bytes, name: str) -> dict:
+    """Portfolio summary of an uploaded CSV/JSONL file, plus the rejected row count."""
+    rejected = []
+    rows = read_listings(io.StringIO(data.decode("utf-8-sig")), detect_format(name))
+    listings = iter_listings(rows, on_error=lambda *error: rejected.append(error))
+    return {**summarize_portfolio(listings).to_dict(), "rejected": len(rejected)}
+
+
+def _group_table(rows: list[dict], key: str, title: str) -> "pd.DataFrame":
+    """One row per group with totals and the verdict mix."""
+    import pandas as pd
+
+    rows = sorted(rows, key=lambda row: row["count"], reverse=True)
+    fair_values = format_lakhs_column([row["total_fair_value"] for row in rows])
+    asking_prices = format_lakhs_column([row["total_asking_price"] for row in rows])
+    return pd.DataFrame([
+        {
+            title: row[key],
+            "Cars": row["count"],
+            "Fair Value": fair_value,
+            "Asking": asking_price,
+            **row["verdicts"],
+        }
+        for row, fair_value, asking_price in zip(rows, fair_values, asking_prices)
+    ])
+
+
+def render_portfolio_page():
+    """Render the Portfolio page."""
+    import pandas as pd
+
+    st.markdown("### 📦 Inventory Portfolio")
+    st.caption(
+        "Upload a CSV or JSONL inventory with the same columns as the bulk CLI "
+        "(ex_showroom, year, km, fuel_type, state, owner, asking_price, ...)."
+    )
+
+    upload = st.file_uploader("Inventory file", type=["csv", "jsonl"], key="portfolio_upload")
+    if upload is None:
+        st.info("Upload an inventory to see totals, verdict mix and depreciation by age.")
+        return
+
+    with st.spinner("Valuing inventory..."):
+        summary = summarize_upload(upload.getvalue(), upload.name)
+
+    if summary["rejected"]:
+        st.warning(f"{summary['rejected']:,} rows could not be parsed or failed validation and were skipped.")
+    if not summary["count"]:
+        st.error("No valid listings found in this file.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Cars", f"{summary['count']:,}")
+    col2.metric("Total Fair Value", format_currency_lakhs(summary["total_fair_value"]))
+    col3.metric("Total Asking", format_currency_lakhs(summary["total_asking_price"]))
+    col4.metric("Asking vs Fair", format_currency_lakhs(summary["difference_amount"]))
+
+    st.markdown("#### Verdict Mix")
+    st.bar_chart(
+        pd.DataFrame({"Cars": [summary["verdicts"][label] for label in VERDICT_LABELS]}, index=VERDICT_LABELS),
+        horizontal=True,
+    )
+
+    for section, (key, title) in GROUP_TITLES.items():
+        st.markdown(f"#### By {title}")
+        st.dataframe(_group_table(summary[section], key, title), hide_index=True, use_container_width=True)
+
+    st.markdown("#### Average Depreciation by Age")
+    by_age = pd.DataFrame(summary["depreciation_by_age"])
+    st.line_chart(
+        by_age.assign(**{"Depreciation %": by_age["mean_depreciation"] * 100}).set_index("age")[["Depreciation %"]],
+        x_label="Age (years)",
+    )
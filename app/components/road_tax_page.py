@@ -1,8 +1,9 @@
 """Road Tax Reference page component."""
 
+from typing import TYPE_CHECKING
+
 import streamlit as st
 import streamlit_shadcn_ui as ui
-import pandas as pd
 from app.data.road_tax import (
     STATE_TAX_CONFIG,
     get_state_tax_table,
@@ -14,6 +15,77 @@ from app.data.gst import (
     get_gst_impact_summary,
     SMALL_CAR_THRESHOLDS,
 )
+from app.data.version import TAX_DATA_VERSION
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+REFERENCE_FUEL_TYPES = ["Petrol", "Diesel", "CNG", "Hybrid", "Electric"]
+
+THRESHOLD_ROWS = [
+    {"Fuel Type": "Petrol / CNG / LPG", "Max Engine": "≤ 1200 CC", "Max Length": "≤ 4000 mm"},
+    {"Fuel Type": "Diesel", "Max Engine": "≤ 1500 CC", "Max Length": "≤ 4000 mm"},
+    {"Fuel Type": "Hybrid (Petrol)", "Max Engine": "≤ 1200 CC", "Max Length": "≤ 4000 mm"},
+    {"Fuel Type": "Hybrid (Diesel)", "Max Engine": "≤ 1500 CC", "Max Length": "≤ 4000 mm"},
+    {"Fuel Type": "Electric", "Max Engine": "N/A", "Max Length": "Any (always 5%)"},
+]
+
+
+def _state_table(config: dict) -> "pd.DataFrame":
+    """Fuel type x price slab rate table for one state's config."""
+    import pandas as pd
+
+    slab_names = [s[1] for s in config["slabs"]]
+    slab_ranges = [s[2] for s in config["slabs"]]
+
+    # Create data for each fuel type
+    table_data = []
+    for fuel_type in REFERENCE_FUEL_TYPES:
+        fuel_rates = config["rates"].get(fuel_type, {})
+        row = {"Fuel Type": fuel_type}
+        for i, slab_name in enumerate(slab_names):
+            rate = fuel_rates.get(slab_name, 0)
+            row[slab_ranges[i]] = f"{rate * 100:.1f}%"
+        table_data.append(row)
+
+    return pd.DataFrame(table_data)
+
+
+def build_reference_tables() -> dict:
+    """
+    Build every DataFrame shown on the reference page.
+
+    Returns dict with summary, gst, thresholds and impact DataFrames, and
+    states: state name -> slab rate DataFrame.
+    """
+    import pandas as pd
+
+    df_summary = pd.DataFrame(get_all_states_summary())
+    df_summary.columns = ["State", "Petrol", "Diesel", "Electric", "Slabs"]
+
+    df_gst = pd.DataFrame(get_gst_rates_table())
+    df_gst.columns = ["Category", "Criteria", "New Rate", "Old Rate"]
+
+    df_impact = pd.DataFrame(get_gst_impact_summary())
+    df_impact.columns = ["Car Type", "Old Rate", "New Rate", "Impact"]
+
+    return {
+        "summary": df_summary,
+        "states": {state: _state_table(config) for state, config in STATE_TAX_CONFIG.items()},
+        "gst": df_gst,
+        "thresholds": pd.DataFrame(THRESHOLD_ROWS),
+        "impact": df_impact,
+    }
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def reference_tables(version: str = TAX_DATA_VERSION) -> dict:
+    """
+    build_reference_tables() once per process and tax data version.
+
+    The DataFrames are shared by every session and must not be modified.
+    """
+    return build_reference_tables()
 
 
 def render_road_tax_page() -> None:
@@ -64,15 +136,9 @@ def render_road_tax_page() -> None:
         unsafe_allow_html=True,
     )
 
-    summary = get_all_states_summary()
-
-    # Create DataFrame for display
-    df_summary = pd.DataFrame(summary)
-    df_summary.columns = ["State", "Petrol", "Diesel", "Electric", "Slabs"]
-
     # Style the dataframe
     st.dataframe(
-        df_summary,
+        reference_tables(TAX_DATA_VERSION)["summary"],
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -169,25 +235,9 @@ def render_state_details(state: str) -> None:
         unsafe_allow_html=True,
     )
 
-    # Build table data
-    slab_names = [s[1] for s in slabs]
-    slab_ranges = [s[2] for s in slabs]
-
-    # Create data for each fuel type
-    table_data = []
-    for fuel_type in ["Petrol", "Diesel", "CNG", "Hybrid", "Electric"]:
-        fuel_rates = rates.get(fuel_type, {})
-        row = {"Fuel Type": fuel_type}
-        for i, slab_name in enumerate(slab_names):
-            rate = fuel_rates.get(slab_name, 0)
-            row[slab_ranges[i]] = f"{rate * 100:.1f}%"
-        table_data.append(row)
-
-    df = pd.DataFrame(table_data)
-
     # Display table
     st.dataframe(
-        df,
+        reference_tables(TAX_DATA_VERSION)["states"][state],
         use_container_width=True,
         hide_index=True,
     )
@@ -331,12 +381,10 @@ def render_gst_section() -> None:
     # GST rates table
     st.markdown("#### 📊 GST Rate Structure")
 
-    gst_rates = get_gst_rates_table()
-    df_gst = pd.DataFrame(gst_rates)
-    df_gst.columns = ["Category", "Criteria", "New Rate", "Old Rate"]
+    tables = reference_tables(TAX_DATA_VERSION)
 
     st.dataframe(
-        df_gst,
+        tables["gst"],
         use_container_width=True,
         hide_index=True,
     )
@@ -360,16 +408,7 @@ def render_gst_section() -> None:
         unsafe_allow_html=True,
     )
 
-    threshold_data = [
-        {"Fuel Type": "Petrol / CNG / LPG", "Max Engine": "≤ 1200 CC", "Max Length": "≤ 4000 mm"},
-        {"Fuel Type": "Diesel", "Max Engine": "≤ 1500 CC", "Max Length": "≤ 4000 mm"},
-        {"Fuel Type": "Hybrid (Petrol)", "Max Engine": "≤ 1200 CC", "Max Length": "≤ 4000 mm"},
-        {"Fuel Type": "Hybrid (Diesel)", "Max Engine": "≤ 1500 CC", "Max Length": "≤ 4000 mm"},
-        {"Fuel Type": "Electric", "Max Engine": "N/A", "Max Length": "Any (always 5%)"},
-    ]
-
-    df_thresholds = pd.DataFrame(threshold_data)
-    st.dataframe(df_thresholds, use_container_width=True, hide_index=True)
+    st.dataframe(tables["thresholds"], use_container_width=True, hide_index=True)
 
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -377,11 +416,7 @@ def render_gst_section() -> None:
     st.markdown("---")
     st.markdown("#### 💰 Impact on Car Prices")
 
-    impact_data = get_gst_impact_summary()
-    df_impact = pd.DataFrame(impact_data)
-    df_impact.columns = ["Car Type", "Old Rate", "New Rate", "Impact"]
-
-    st.dataframe(df_impact, use_container_width=True, hide_index=True)
+    st.dataframe(tables["impact"], use_container_width=True, hide_index=True)
 
     # Examples
     st.markdown("---")
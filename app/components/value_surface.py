@@ -0,0 +1,71 @@
+"""What-if heatmap of fair value by model year and kilometres driven.
+
+altair and pandas are imported when the heatmap is first rendered.
+"""
+
+import streamlit as st
+
+from app.calculators.surface import fair_value_surface
+from app.data.constants import YEARS
+from app.utils.formatters import format_km, format_lakhs_column
+
+# Grid around the entered car: +/- YEAR_SPAN model years, KM_STEPS steps of KM_STEP
+YEAR_SPAN = 3
+KM_STEP = 10000
+KM_STEPS = 4
+
+
+def surface_axes(year: int, km: int) -> tuple[list[int], list[int]]:
+    """Model years and km values to explore around the entered car."""
+    years = [y for y in range(year - YEAR_SPAN, year + YEAR_SPAN + 1) if YEARS[-1] <= y <= YEARS[0]]
+    base_km = round(km / KM_STEP) * KM_STEP
+    km_grid = sorted({
+        k for k in (base_km + step * KM_STEP for step in range(-KM_STEPS, KM_STEPS + 1)) if k >= 0
+    } | {km})
+    return years, km_grid
+
+
+def render_value_surface(inputs: dict) -> None:
+    """Render the year x km fair value heatmap for the valued car."""
+    import altair as alt
+    import pandas as pd
+
+    st.markdown("### 🗺️ What If?")
+    st.caption("Fair value if the same car were a different model year or had a different odometer reading.")
+
+    years, km_grid = surface_axes(inputs["year"], inputs["km"])
+    surface = fair_value_surface(inputs, years, km_grid)
+
+    fair_values = surface["fair_value"].tolist()
+    labels = format_lakhs_column(surface["fair_value"].ravel(), 1)
+    km_labels = [format_km(km) for km in km_grid]
+    df = pd.DataFrame([
+        {
+            "Year": year,
+            "Km": km_labels[j],
+            "Fair Value": fair_values[i][j],
+            "Label": labels[i * len(km_grid) + j],
+            "Current": year == inputs["year"] and km == inputs["km"],
+        }
+        for i, year in enumerate(years)
+        for j, km in enumerate(km_grid)
+    ])
+
+    base = alt.Chart(df).encode(
+        x=alt.X("Km:N", sort=km_labels, title="Kilometres driven"),
+        y=alt.Y("Year:O", sort="descending", title="Model year"),
+    )
+    cells = base.mark_rect().encode(
+        color=alt.Color("Fair Value:Q", scale=alt.Scale(scheme="blues"), legend=None),
+        stroke=alt.condition("datum.Current", alt.value("#f59e0b"), alt.value(None)),
+        strokeWidth=alt.condition("datum.Current", alt.value(3), alt.value(0)),
+        tooltip=["Year", "Km", "Label"],
+    )
+    # Light text on the darker (higher value) half of the colour scale
+    midpoint = (df["Fair Value"].min() + df["Fair Value"].max()) / 2
+    labels = base.mark_text(fontSize=11).encode(
+        text="Label:N",
+        color=alt.condition(f"datum['Fair Value'] > {midpoint}", alt.value("#f9fafb"), alt.value("#111827")),
+    )
+
+    st.altair_chart(cells + labels, use_container_width=True)
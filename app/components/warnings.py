@@ -1,7 +1,8 @@
 """Warnings and alerts component with shadcn styling."""
 
+from functools import lru_cache
+
 import streamlit as st
-import streamlit_shadcn_ui as ui
 
 
 def render_warnings(warnings: list[dict]) -> None:
@@ -60,58 +61,62 @@ def render_warnings(warnings: list[dict]) -> None:
         )
 
 
+LIMITATIONS = [
+    ("📊", "No real-time pricing", "Uses estimated ex-showroom prices"),
+    ("📍", "Regional demand", "City-specific demand variations not factored"),
+    ("🔍", "Subjective condition", "Condition assessment is self-reported"),
+    ("📈", "Market fluctuations", "Seasonal price changes not included"),
+    ("⭐", "Special editions", "Limited editions may vary significantly"),
+    ("🔧", "Modifications", "Aftermarket mods not accounted for"),
+    ("🚗", "Rare models", "Discontinued models may command premium"),
+    ("🎨", "Color impact", "Popular colors affect resale (not factored)"),
+]
+
+DISCLAIMER_HTML = """
+<div style="
+    background-color: rgba(75, 85, 99, 0.2);
+    border-radius: 8px;
+    padding: 12px 16px;
+    margin-top: 12px;
+    font-size: 0.85rem;
+    color: #9ca3af;
+">
+    <strong style="color: #d1d5db;">Disclaimer:</strong>
+    CarWorth provides estimated fair values based on standard depreciation formulas.
+    Actual market prices may vary. Always conduct physical inspection and verify
+    service history before purchasing. For informational purposes only.
+</div>
+"""
+
+
+@lru_cache(maxsize=1)
+def _limitations_html() -> str:
+    """All limitation rows as one block of markup (built once per process)."""
+    return "".join(
+        f"""
+        <div style="
+            display: flex;
+            align-items: flex-start;
+            padding: 8px 0;
+            border-bottom: 1px solid #333;
+        ">
+            <span style="font-size: 1.2rem; margin-right: 12px;">{icon}</span>
+            <div>
+                <div style="font-weight: 500; color: #e5e7eb;">{title}</div>
+                <div style="font-size: 0.85rem; color: #9ca3af;">{desc}</div>
+            </div>
+        </div>
+        """
+        for icon, title, desc in LIMITATIONS
+    )
+
+
 def render_limitations() -> None:
     """Render calculator limitations and disclaimer with modern styling."""
     st.markdown("### 📋 Limitations & Disclaimer")
 
-    # Use expander with custom content
     with st.expander("View Limitations", expanded=False):
-        limitations = [
-            ("📊", "No real-time pricing", "Uses estimated ex-showroom prices"),
-            ("📍", "Regional demand", "City-specific demand variations not factored"),
-            ("🔍", "Subjective condition", "Condition assessment is self-reported"),
-            ("📈", "Market fluctuations", "Seasonal price changes not included"),
-            ("⭐", "Special editions", "Limited editions may vary significantly"),
-            ("🔧", "Modifications", "Aftermarket mods not accounted for"),
-            ("🚗", "Rare models", "Discontinued models may command premium"),
-            ("🎨", "Color impact", "Popular colors affect resale (not factored)"),
-        ]
-
-        for icon, title, desc in limitations:
-            st.markdown(
-                f"""
-                <div style="
-                    display: flex;
-                    align-items: flex-start;
-                    padding: 8px 0;
-                    border-bottom: 1px solid #333;
-                ">
-                    <span style="font-size: 1.2rem; margin-right: 12px;">{icon}</span>
-                    <div>
-                        <div style="font-weight: 500; color: #e5e7eb;">{title}</div>
-                        <div style="font-size: 0.85rem; color: #9ca3af;">{desc}</div>
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+        st.markdown(_limitations_html(), unsafe_allow_html=True)
 
     # Disclaimer in a subtle box
-    st.markdown(
-        """
-        <div style="
-            background-color: rgba(75, 85, 99, 0.2);
-            border-radius: 8px;
-            padding: 12px 16px;
-            margin-top: 12px;
-            font-size: 0.85rem;
-            color: #9ca3af;
-        ">
-            <strong style="color: #d1d5db;">Disclaimer:</strong>
-            CarWorth provides estimated fair values based on standard depreciation formulas.
-            Actual market prices may vary. Always conduct physical inspection and verify
-            service history before purchasing. For informational purposes only.
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(DISCLAIMER_HTML, unsafe_allow_html=True)
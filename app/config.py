@@ -1,5 +1,7 @@
 """Application configuration."""
 
+import os
+
 # App metadata
 APP_NAME = "CarWorth"
 APP_TITLE = "CarWorth - Used Car Value Calculator"
@@ -22,5 +24,30 @@ COLORS = {
     "error": "#FF5252",
 }
 
+# Valuation result cache (entries, seconds)
+VALUATION_CACHE_SIZE = 512
+VALUATION_CACHE_TTL = 3600.0
+
+# Rendered PDF report cache (entries, seconds)
+PDF_CACHE_SIZE = 128
+PDF_CACHE_TTL = 600.0
+
+# Per-stage timing instrumentation (opt-in; see app/metrics.py)
+METRICS_ENABLED = os.environ.get("CARWORTH_METRICS", "").lower() in ("1", "true", "yes")
+METRICS_LOG_INTERVAL = float(os.environ.get("CARWORTH_METRICS_LOG_INTERVAL", "0"))  # seconds, 0 = off
+
+# API micro-batching of single valuations (see app/coalescer.py)
+COALESCE_MAX_BATCH = int(os.environ.get("CARWORTH_COALESCE_MAX_BATCH", "256"))
+COALESCE_MAX_WAIT = float(os.environ.get("CARWORTH_COALESCE_MAX_WAIT_MS", "2")) / 1000  # seconds
+
+# Valuation history store (see app/history_store.py)
+HISTORY_BACKEND = os.environ.get("CARWORTH_HISTORY_BACKEND", "sqlite")  # sqlite | file
+HISTORY_DIR = os.path.expanduser(os.environ.get("CARWORTH_HISTORY_DIR", "~/.carworth"))
+HISTORY_RETENTION_DAYS = float(os.environ.get("CARWORTH_HISTORY_RETENTION_DAYS", "90"))  # 0 = keep forever
+HISTORY_MAX_PER_SESSION = int(os.environ.get("CARWORTH_HISTORY_MAX_PER_SESSION", "200"))  # 0 = unlimited
+HISTORY_PAGE_SIZE = 10
+HISTORY_BATCH_SIZE = 64
+HISTORY_FLUSH_INTERVAL = 0.5  # seconds
+
 # URLs
 GITHUB_URL = "https://github.com/mmuteeullah/carworth"
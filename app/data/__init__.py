@@ -1,6 +1,7 @@
-from .road_tax import STATE_TAX_CONFIG, get_road_tax_rate, get_slab_info
+from .road_tax import STATE_TAX_CONFIG, get_road_tax_rate, get_slab_info, lookup_rates
 from .brands import BRAND_MULTIPLIERS, get_brand_multiplier
 from .gst import GST_RATES, classify_gst_category, calculate_gst_component
+from .categories import CATEGORIES, encode_columns
 from .constants import (
     FIXED_CHARGES,
     INSURANCE_ESTIMATES,
@@ -22,11 +23,14 @@ __all__ = [
     "STATE_TAX_CONFIG",
     "get_road_tax_rate",
     "get_slab_info",
+    "lookup_rates",
     "BRAND_MULTIPLIERS",
     "get_brand_multiplier",
     "GST_RATES",
     "classify_gst_category",
     "calculate_gst_component",
+    "CATEGORIES",
+    "encode_columns",
     "FIXED_CHARGES",
     "INSURANCE_ESTIMATES",
     "OWNERSHIP_PREMIUM",
@@ -0,0 +1,142 @@
+"""Integer encoding for the categorical valuation inputs.
+
+Each Category maps the labels of one dropdown list in app.data.constants to
+small int codes (their position in the list) and encodes whole columns as
+int8 arrays. Unknown labels encode as -1.
+
+Lookup tables are dense float arrays indexed by code, with one extra slot at
+the end for the unknown fallback, so ``table[codes]`` resolves a whole column
+(including -1) in one gather. The fallbacks match the dict ``.get()``
+defaults used by the scalar calculators.
+"""
+
+from itertools import repeat
+from typing import Callable, Sequence
+
+import numpy as np
+
+from app.data.brands import BRAND_MULTIPLIERS
+from app.data.snapshot import load_tables
+from app.data.constants import (
+    STATES,
+    FUEL_TYPES,
+    OWNER_OPTIONS,
+    BRAND_OPTIONS,
+    TRANSMISSION_OPTIONS,
+    CONDITION_OPTIONS,
+    ACCIDENT_OPTIONS,
+    SERVICE_OPTIONS,
+    INSURANCE_OPTIONS,
+    OWNERSHIP_PREMIUM,
+    TRANSMISSION_ADJUSTMENT,
+    CONDITION_ADJUSTMENTS,
+)
+
+UNKNOWN_CODE = -1
+CODE_DTYPE = np.int8
+
+
+class Category:
+    """A fixed, ordered set of labels encoded as int8 codes."""
+
+    __slots__ = ("name", "labels", "codes")
+
+    def __init__(self, name: str, labels: Sequence[str]):
+        if len(labels) >= np.iinfo(CODE_DTYPE).max:
+            raise ValueError(f"Too many labels for {name}: {len(labels)}")
+        self.name = name
+        self.labels = tuple(labels)
+        self.codes = {label: code for code, label in enumerate(self.labels)}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def code(self, label: str) -> int:
+        """Code of a single label (UNKNOWN_CODE if not a known label)."""
+        return self.codes.get(label, UNKNOWN_CODE)
+
+    def encode(self, values) -> np.ndarray:
+        """
+        Encode a column of labels as an int8 array.
+
+        Integer arrays are taken to be codes already. Pandas categorical
+        columns are re-coded via their categories without touching
+        individual rows.
+        """
+        cat = getattr(values, "cat", None)
+        if cat is not None:
+            remap = np.array([*map(self.code, cat.categories), UNKNOWN_CODE], dtype=CODE_DTYPE)
+            return remap[np.asarray(cat.codes)]
+
+        dtype = getattr(values, "dtype", None)
+        if dtype is not None and dtype.kind in "iu":
+            return np.asarray(values).astype(CODE_DTYPE, copy=False)
+
+        if not isinstance(values, (list, tuple)):
+            values = np.asarray(values, dtype=object)
+        return np.fromiter(
+            map(self.codes.get, values, repeat(UNKNOWN_CODE)),
+            dtype=CODE_DTYPE,
+            count=len(values),
+        )
+
+    def decode(self, codes) -> np.ndarray:
+        """Labels for an array of codes (None for UNKNOWN_CODE)."""
+        return np.array([*self.labels, None], dtype=object)[np.asarray(codes)]
+
+    def table(self, value_for_label: Callable[[str], float], fallback: float) -> np.ndarray:
+        """Dense lookup table: value per code, with fallback in the last slot."""
+        return np.array([*map(value_for_label, self.labels), fallback], dtype=float)
+
+
+STATE = Category("state", STATES)
+FUEL = Category("fuel_type", FUEL_TYPES)
+OWNER = Category("owner", OWNER_OPTIONS)
+BRAND = Category("brand", BRAND_OPTIONS)
+TRANSMISSION = Category("transmission", TRANSMISSION_OPTIONS)
+BODY_CONDITION = Category("body_condition", CONDITION_OPTIONS)
+ACCIDENT_HISTORY = Category("accident_history", ACCIDENT_OPTIONS)
+SERVICE_HISTORY = Category("service_history", SERVICE_OPTIONS)
+INSURANCE_STATUS = Category("insurance_status", INSURANCE_OPTIONS)
+
+# Input name -> Category, for encoding whole input tables
+CATEGORIES = {
+    category.name: category
+    for category in (
+        STATE, FUEL, OWNER, BRAND, TRANSMISSION,
+        BODY_CONDITION, ACCIDENT_HISTORY, SERVICE_HISTORY, INSURANCE_STATUS,
+    )
+}
+
+def build_adjustment_tables() -> dict[str, np.ndarray]:
+    """Dense adjustment lookup tables, keyed as in the table snapshot."""
+    return {
+        # Owner labels are ordered 1st..4th+, so the owner number is code + 1.
+        # Unknown owners are treated as 2nd owner (see get_owner_number).
+        "ownership_premium": OWNER.table(
+            lambda label: OWNERSHIP_PREMIUM[OWNER.code(label) + 1], OWNERSHIP_PREMIUM[2]
+        ),
+        "brand_multiplier": BRAND.table(lambda label: BRAND_MULTIPLIERS.get(label, 1.0), 1.0),
+        "transmission_adjustment": TRANSMISSION.table(lambda label: TRANSMISSION_ADJUSTMENT.get(label, 0.0), 0.0),
+        "body_condition": BODY_CONDITION.table(lambda label: CONDITION_ADJUSTMENTS["body"].get(label, 0.0), 0.0),
+        "accident_history": ACCIDENT_HISTORY.table(lambda label: CONDITION_ADJUSTMENTS["accident"].get(label, 0.0), 0.0),
+        "service_history": SERVICE_HISTORY.table(lambda label: CONDITION_ADJUSTMENTS["service"].get(label, 0.0), 0.0),
+    }
+
+
+# Mapped from the table snapshot when it is up to date, else built here
+_tables = load_tables() or build_adjustment_tables()
+OWNERSHIP_PREMIUM_TABLE = _tables["ownership_premium"]
+BRAND_MULTIPLIER_TABLE = _tables["brand_multiplier"]
+TRANSMISSION_ADJUSTMENT_TABLE = _tables["transmission_adjustment"]
+BODY_CONDITION_TABLE = _tables["body_condition"]
+ACCIDENT_HISTORY_TABLE = _tables["accident_history"]
+SERVICE_HISTORY_TABLE = _tables["service_history"]
+
+
+def encode_columns(columns: dict) -> dict:
+    """Copy of columns with every categorical input encoded as int8 codes."""
+    return {
+        name: CATEGORIES[name].encode(values) if name in CATEGORIES else values
+        for name, values in columns.items()
+    }
@@ -143,5 +143,18 @@ SERVICE_OPTIONS = ["Full Authorized", "Partial", "Unknown"]
 
 INSURANCE_OPTIONS = ["Valid", "Expired"]
 
+# Default values for advanced options
+ADVANCED_DEFAULTS = {
+    "brand": "Other",
+    "transmission": "Manual",
+    "body_condition": "Good",
+    "accident_history": "None",
+    "service_history": "Unknown",
+    "commercial_use": False,
+    "new_gen_available": False,
+    "engine_cc": None,
+    "length_mm": None,
+}
+
 # Year options (last 15 years)
 YEARS = list(range(CURRENT_YEAR, CURRENT_YEAR - 16, -1))
@@ -1,18 +1,18 @@
 """GST rates and classification logic for cars in India (September 2025 onwards)."""
 
-from typing import Literal, TypedDict, Optional
+from typing import Literal, NotRequired, TypedDict, Optional
 
 FuelType = Literal["Petrol", "Diesel", "CNG", "Electric", "Hybrid"]
 GSTCategory = Literal["small", "large", "electric"]
 
 
 class GSTInfo(TypedDict):
-    """GST classification information."""
+    """GST classification information (text fields only when explained)."""
     category: GSTCategory
-    category_name: str
+    category_name: NotRequired[str]
     rate: float
-    rate_percent: str
-    reason: str
+    rate_percent: NotRequired[str]
+    reason: NotRequired[str]
     meets_engine_criteria: Optional[bool]
     meets_length_criteria: Optional[bool]
 
@@ -46,6 +46,7 @@ def classify_gst_category(
     fuel_type: str,
     engine_cc: Optional[int] = None,
     length_mm: Optional[int] = None,
+    explain: bool = True,
 ) -> GSTInfo:
     """
     Classify a car's GST category based on fuel type, engine CC, and length.
@@ -54,72 +55,75 @@ def classify_gst_category(
         fuel_type: Fuel type of the car
         engine_cc: Engine capacity in CC (optional for EVs)
         length_mm: Vehicle length in mm (optional for EVs)
+        explain: Include category_name, rate_percent and reason; pass False
+            when only the numbers are needed
 
     Returns:
         GSTInfo with category, rate, and explanation
     """
-    # Electric vehicles always get 5%
+    thresholds = SMALL_CAR_THRESHOLDS.get(fuel_type, SMALL_CAR_THRESHOLDS["Petrol"])
+
     if fuel_type == "Electric":
+        # Electric vehicles always get 5%
+        category, meets_engine, meets_length = "electric", None, None
+    elif engine_cc is None or length_mm is None:
+        # Can't classify without specs: default to large car for safety (higher tax estimate)
+        category, meets_engine, meets_length = "large", None, None
+    else:
+        # Small car only if BOTH conditions are met
+        meets_engine = engine_cc <= thresholds["max_engine_cc"]
+        meets_length = length_mm <= thresholds["max_length_mm"]
+        category = "small" if meets_engine and meets_length else "large"
+
+    rate = GST_RATES[category]
+    if not explain:
         return GSTInfo(
-            category="electric",
-            category_name=CATEGORY_NAMES["electric"],
-            rate=GST_RATES["electric"],
-            rate_percent="5%",
-            reason="Electric vehicles are charged concessional 5% GST to promote EV adoption",
-            meets_engine_criteria=None,
-            meets_length_criteria=None,
+            category=category,
+            rate=rate,
+            meets_engine_criteria=meets_engine,
+            meets_length_criteria=meets_length,
         )
 
+    return GSTInfo(
+        category=category,
+        category_name=CATEGORY_NAMES[category],
+        rate=rate,
+        rate_percent=f"{rate:.0%}",
+        reason=_gst_reason(fuel_type, engine_cc, length_mm, category, meets_engine, meets_length),
+        meets_engine_criteria=meets_engine,
+        meets_length_criteria=meets_length,
+    )
+
+
+def _gst_reason(
+    fuel_type: str,
+    engine_cc: Optional[int],
+    length_mm: Optional[int],
+    category: GSTCategory,
+    meets_engine: Optional[bool],
+    meets_length: Optional[bool],
+) -> str:
+    """Explain why a car falls in its GST category."""
+    if category == "electric":
+        return "Electric vehicles are charged concessional 5% GST to promote EV adoption"
+    if meets_engine is None:
+        return "Classification requires engine CC and length. Defaulting to 40% (provide specs for accurate rate)"
+
     thresholds = SMALL_CAR_THRESHOLDS.get(fuel_type, SMALL_CAR_THRESHOLDS["Petrol"])
     max_engine = thresholds["max_engine_cc"]
     max_length = thresholds["max_length_mm"]
 
-    # If no engine/length provided, we can't classify accurately
-    if engine_cc is None or length_mm is None:
-        # Default to large car assumption for safety (higher tax estimate)
-        return GSTInfo(
-            category="large",
-            category_name=CATEGORY_NAMES["large"],
-            rate=GST_RATES["large"],
-            rate_percent="40%",
-            reason=f"Classification requires engine CC and length. Defaulting to 40% (provide specs for accurate rate)",
-            meets_engine_criteria=None,
-            meets_length_criteria=None,
-        )
-
-    # Check if meets small car criteria (BOTH conditions must be met)
-    meets_engine = engine_cc <= max_engine
-    meets_length = length_mm <= max_length
-    is_small_car = meets_engine and meets_length
-
-    if is_small_car:
+    if category == "small":
         fuel_label = "Petrol/CNG/LPG" if fuel_type in ["Petrol", "CNG"] else fuel_type
-        return GSTInfo(
-            category="small",
-            category_name=CATEGORY_NAMES["small"],
-            rate=GST_RATES["small"],
-            rate_percent="18%",
-            reason=f"Qualifies as small car: {fuel_label} ≤{max_engine}cc AND length ≤{max_length}mm",
-            meets_engine_criteria=meets_engine,
-            meets_length_criteria=meets_length,
-        )
-    else:
-        # Determine why it doesn't qualify
-        reasons = []
-        if not meets_engine:
-            reasons.append(f"engine {engine_cc}cc > {max_engine}cc limit")
-        if not meets_length:
-            reasons.append(f"length {length_mm}mm > {max_length}mm limit")
+        return f"Qualifies as small car: {fuel_label} ≤{max_engine}cc AND length ≤{max_length}mm"
 
-        return GSTInfo(
-            category="large",
-            category_name=CATEGORY_NAMES["large"],
-            rate=GST_RATES["large"],
-            rate_percent="40%",
-            reason=f"Exceeds small car threshold: {' and '.join(reasons)}",
-            meets_engine_criteria=meets_engine,
-            meets_length_criteria=meets_length,
-        )
+    # Determine why it doesn't qualify
+    reasons = []
+    if not meets_engine:
+        reasons.append(f"engine {engine_cc}cc > {max_engine}cc limit")
+    if not meets_length:
+        reasons.append(f"length {length_mm}mm > {max_length}mm limit")
+    return f"Exceeds small car threshold: {' and '.join(reasons)}"
 
 
 def calculate_gst_component(ex_showroom: float, gst_rate: float) -> dict:
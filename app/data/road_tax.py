@@ -1,17 +1,23 @@
 """State-wise road tax data for India with accurate state-specific slabs."""
 
-from typing import Literal, TypedDict
+from bisect import bisect_left
+from typing import Literal, NotRequired, TypedDict
+
+import numpy as np
+
+from app.data.categories import STATE, FUEL
+from app.data.snapshot import load_tables
 
 FuelType = Literal["Petrol", "Diesel", "CNG", "Electric", "Hybrid"]
 
 
 class SlabInfo(TypedDict):
-    """Information about the applied tax slab."""
+    """Information about the applied tax slab (text fields only when explained)."""
     slab_name: str
     slab_range: str
     rate: float
-    rate_percent: str
-    reason: str
+    rate_percent: NotRequired[str]
+    reason: NotRequired[str]
 
 
 class StateSlabConfig(TypedDict):
@@ -368,7 +374,132 @@ NCR_STATES = ["Delhi", "Haryana", "Uttar Pradesh", "Rajasthan"]
 DEFAULT_STATE = "Maharashtra"
 
 
-def get_slab_info(state: str, fuel_type: str, ex_showroom: float) -> SlabInfo:
+# === Precompiled slab index ===
+# STATE_TAX_CONFIG compiled once at import so slab resolution is one binary
+# search instead of a scan plus dict lookups. Rows follow the STATE and FUEL
+# codes from app.data.categories; the extra last state row holds DEFAULT_STATE
+# and the extra last fuel row holds Petrol rates, so an unknown label encoded
+# as -1 picks the same fallback as the dict lookups did.
+TAX_STATES = list(STATE.labels)
+STATE_CODES = STATE.codes
+FUEL_CODES = FUEL.codes
+
+
+def _build_slab_index() -> tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compile STATE_TAX_CONFIG into boundary arrays and a rate matrix.
+
+    Returns:
+        tuple: (state_limits, slab_limits, slab_of_interval, rate_matrix)
+        - state_limits: per-state tuple of slab upper limits (for bisect)
+        - slab_limits: sorted union of every finite slab upper limit
+        - slab_of_interval: state x interval -> slab index, where interval is
+          the searchsorted position of a price in slab_limits
+        - rate_matrix: state x fuel x slab -> rate
+    """
+    states = TAX_STATES + [DEFAULT_STATE]
+    fuels = list(FUEL.labels) + [None]
+    state_limits = [tuple(slab[0] for slab in STATE_TAX_CONFIG[s]["slabs"]) for s in states]
+
+    slab_limits = sorted({limit for limits in state_limits for limit in limits if limit != float("inf")})
+    # Representative price for each interval (slab_limits[i-1], slab_limits[i]]
+    probes = slab_limits + [slab_limits[-1] + 1]
+    max_slabs = max(len(limits) for limits in state_limits)
+
+    slab_of_interval = np.zeros((len(states), len(probes)), dtype=np.intp)
+    rate_matrix = np.zeros((len(states), len(fuels), max_slabs))
+
+    for s, state in enumerate(states):
+        limits = state_limits[s]
+        slab_of_interval[s] = [min(bisect_left(limits, price), len(limits) - 1) for price in probes]
+
+        rates = STATE_TAX_CONFIG[state]["rates"]
+        for f, fuel in enumerate(fuels):
+            fuel_rates = rates.get(fuel, rates["Petrol"])
+            for k, (_, slab_name, _) in enumerate(STATE_TAX_CONFIG[state]["slabs"]):
+                rate_matrix[s, f, k] = fuel_rates.get(slab_name, 0.10)
+
+    return state_limits, np.array(slab_limits, dtype=float), slab_of_interval, rate_matrix
+
+
+def build_slab_tables() -> dict[str, np.ndarray]:
+    """The slab index as flat arrays, as stored in the table snapshot."""
+    state_limits, slab_limits, slab_of_interval, rate_matrix = _build_slab_index()
+    padded = np.full((len(state_limits), max(map(len, state_limits))), np.inf)
+    for s, limits in enumerate(state_limits):
+        padded[s, :len(limits)] = limits
+    return {
+        "state_limits": padded,
+        "state_slab_counts": np.array([len(limits) for limits in state_limits], dtype=np.int64),
+        "slab_limits": slab_limits,
+        "slab_of_interval": slab_of_interval.astype(np.int64),
+        "rate_matrix": rate_matrix,
+    }
+
+
+# Map the prebuilt index from the table snapshot when it is up to date
+_snapshot = load_tables()
+if _snapshot is not None:
+    SLAB_LIMITS = _snapshot["slab_limits"]
+    SLAB_OF_INTERVAL = _snapshot["slab_of_interval"]
+    RATE_MATRIX = _snapshot["rate_matrix"]
+    _STATE_LIMITS = [
+        tuple(limits[:count]) for limits, count in zip(_snapshot["state_limits"].tolist(), _snapshot["state_slab_counts"].tolist())
+    ]
+else:
+    _STATE_LIMITS, SLAB_LIMITS, SLAB_OF_INTERVAL, RATE_MATRIX = _build_slab_index()
+
+# Plain-float copy of RATE_MATRIX for the scalar path
+_RATE_TABLE = RATE_MATRIX.tolist()
+
+
+def encode_states(states) -> np.ndarray:
+    """Encode state names as int8 STATE codes (-1 for unknown states)."""
+    return STATE.encode(states)
+
+
+def encode_fuels(fuels) -> np.ndarray:
+    """Encode fuel types as int8 FUEL codes (-1 for unknown fuels)."""
+    return FUEL.encode(fuels)
+
+
+def lookup_rates(states, fuels, prices) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Resolve road tax rates for whole columns at once.
+
+    Args:
+        states: State names, or integer codes from encode_states
+        fuels: Fuel types, or integer codes from encode_fuels
+        prices: Ex-showroom prices
+
+    Returns:
+        tuple: (rates, slab_indices) as arrays aligned with the inputs.
+        slab_indices index into the (possibly defaulted) state's slabs list.
+
+    Costs one binary search per row and allocates no per-row objects.
+    """
+    state_codes = np.asarray(states)
+    if state_codes.dtype.kind not in "iu":
+        state_codes = encode_states(state_codes)
+    fuel_codes = np.asarray(fuels)
+    if fuel_codes.dtype.kind not in "iu":
+        fuel_codes = encode_fuels(fuel_codes)
+
+    interval = np.searchsorted(SLAB_LIMITS, np.asarray(prices, dtype=float), side="left")
+    slab_indices = SLAB_OF_INTERVAL[state_codes, interval]
+    return RATE_MATRIX[state_codes, fuel_codes, slab_indices], slab_indices
+
+
+def _resolve_slab(state: str, fuel_type: str, ex_showroom: float) -> tuple[int, int, float]:
+    """Resolve (state_code, slab_index, rate) for a single car."""
+    state_code = STATE_CODES.get(state, -1)
+    limits = _STATE_LIMITS[state_code]
+    slab = min(bisect_left(limits, ex_showroom), len(limits) - 1)
+    rate = _RATE_TABLE[state_code][FUEL_CODES.get(fuel_type, -1)][slab]
+    return state_code, slab, rate
+
+
+def get_slab_info(state: str, fuel_type: str, ex_showroom: float, explain: bool = True) -> SlabInfo:
     """
     Get detailed slab information for the given parameters.
 
@@ -376,34 +507,17 @@ def get_slab_info(state: str, fuel_type: str, ex_showroom: float) -> SlabInfo:
     - slab_name: Internal slab identifier
     - slab_range: Human-readable price range
     - rate: Decimal rate (e.g., 0.11 for 11%)
-    - rate_percent: Formatted percentage string
-    - reason: Explanation of why this rate applies
+    - rate_percent: Formatted percentage string (only if explain)
+    - reason: Explanation of why this rate applies (only if explain)
     """
     if state not in STATE_TAX_CONFIG:
         state = DEFAULT_STATE
 
-    config = STATE_TAX_CONFIG[state]
-    slabs = config["slabs"]
-    rates = config["rates"]
-
-    # Find applicable slab
-    applied_slab_name = None
-    applied_slab_range = None
-
-    for upper_limit, slab_name, slab_range in slabs:
-        if ex_showroom <= upper_limit:
-            applied_slab_name = slab_name
-            applied_slab_range = slab_range
-            break
-
-    # If no slab found (shouldn't happen), use the last one
-    if applied_slab_name is None:
-        applied_slab_name = slabs[-1][1]
-        applied_slab_range = slabs[-1][2]
+    _, slab, rate = _resolve_slab(state, fuel_type, ex_showroom)
+    _, applied_slab_name, applied_slab_range = STATE_TAX_CONFIG[state]["slabs"][slab]
 
-    # Get fuel-specific rates, fallback to Petrol
-    fuel_rates = rates.get(fuel_type, rates["Petrol"])
-    rate = fuel_rates.get(applied_slab_name, 0.10)
+    if not explain:
+        return SlabInfo(slab_name=applied_slab_name, slab_range=applied_slab_range, rate=rate)
 
     rate_percent = f"{rate * 100:.1f}%"
 
@@ -421,8 +535,7 @@ def get_slab_info(state: str, fuel_type: str, ex_showroom: float) -> SlabInfo:
 
 def get_road_tax_rate(state: str, fuel_type: str, ex_showroom: float) -> float:
     """Get road tax rate for given state, fuel type and ex-showroom price."""
-    slab_info = get_slab_info(state, fuel_type, ex_showroom)
-    return slab_info["rate"]
+    return _resolve_slab(state, fuel_type, ex_showroom)[2]
 
 
 def is_ncr_state(state: str) -> bool:
@@ -0,0 +1,147 @@
+"""Precompiled, memory-mappable snapshot of the derived lookup tables.
+
+The road tax slab index (app.data.road_tax) and the adjustment lookup tables
+(app.data.categories) are derived from the Python data modules at import.
+``python -m app.cli snapshot`` compiles them once into a single binary
+file; importing processes then map it read-only instead of rebuilding, so
+forked or spawned workers share one physical copy through the page cache.
+
+The snapshot records a content hash of its source modules. If any of them
+has changed since the build, the snapshot is ignored (with a warning) and
+the tables are rebuilt in-process as before.
+
+File layout (little-endian):
+    MAGIC, uint32 header length, JSON header, then each array's raw bytes
+    at a DATA_ALIGNMENT-aligned offset. The header holds the format
+    version, the source hash, and each array's dtype, shape and offset.
+
+Usage:
+    python -m app.cli snapshot [-o PATH]      # build
+    python -m app.cli snapshot --check [-o PATH]
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CWSNAP\x00\x00"
+FORMAT_VERSION = 1
+DATA_ALIGNMENT = 64
+
+DATA_DIR = Path(__file__).parent
+SNAPSHOT_PATH = Path(os.environ.get("CARWORTH_SNAPSHOT", DATA_DIR / "tables.snapshot"))
+
+# Modules the snapshot is derived from; editing any of them makes it stale
+SOURCE_FILES = ["road_tax.py", "gst.py", "brands.py", "constants.py", "categories.py"]
+
+
+def source_hash() -> str:
+    """Content hash of the snapshot's source modules and format version."""
+    digest = hashlib.sha256(f"{FORMAT_VERSION}:{sys.byteorder}".encode())
+    for name in SOURCE_FILES:
+        digest.update(name.encode())
+        digest.update((DATA_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def _align(offset: int) -> int:
+    return -(-offset // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+
+def write_snapshot(path, arrays: dict[str, np.ndarray], content_hash: str) -> None:
+    """Write arrays to path as a snapshot tagged with content_hash (atomically)."""
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        entries[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps({"version": FORMAT_VERSION, "source_hash": content_hash, "arrays": entries}).encode()
+    data_start = _align(len(MAGIC) + 4 + len(header))
+
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + entries[name]["offset"])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path) -> tuple[dict, dict[str, np.ndarray]]:
+    """
+    Map a snapshot read-only; returns (header, arrays).
+
+    The arrays are read-only views into the shared mapping. Raises
+    ValueError if the file is not a snapshot of this format version.
+    """
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mapping[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a CarWorth snapshot")
+    (header_length,) = struct.unpack_from("<I", mapping, len(MAGIC))
+    header_start = len(MAGIC) + 4
+    header = json.loads(mapping[header_start:header_start + header_length])
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path} has snapshot format {header.get('version')}, expected {FORMAT_VERSION}")
+
+    data_start = _align(header_start + header_length)
+    arrays = {}
+    for name, entry in header["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        count = int(np.prod(entry["shape"]))
+        arrays[name] = np.frombuffer(
+            mapping, dtype=dtype, count=count, offset=data_start + entry["offset"]
+        ).reshape(entry["shape"])
+    return header, arrays
+
+
+@lru_cache(maxsize=None)
+def load_tables(path=SNAPSHOT_PATH) -> Optional[dict[str, np.ndarray]]:
+    """
+    The snapshot's arrays, or None if there is no usable, up-to-date snapshot.
+
+    Callers fall back to building their tables when this returns None.
+    """
+    if not Path(path).exists():
+        return None
+    try:
+        header, arrays = read_snapshot(path)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring table snapshot: %s", e)
+        return None
+    if header["source_hash"] != source_hash():
+        logger.warning("Ignoring stale table snapshot %s; rebuild with python -m app.cli snapshot", path)
+        return None
+    return arrays
+
+
+def build_tables() -> dict[str, np.ndarray]:
+    """Compute every snapshotted array from the Python sources."""
+    from app.data import categories, road_tax
+
+    return {**road_tax.build_slab_tables(), **categories.build_adjustment_tables()}
+
+
+def build(path=SNAPSHOT_PATH) -> Path:
+    """Build the snapshot at path."""
+    write_snapshot(path, build_tables(), source_hash())
+    return Path(path)
+
@@ -0,0 +1,26 @@
+"""Content version of the tax tables.
+
+Derived data (reference page tables, exported snapshots) is cached under
+tax_data_version() so it is rebuilt only when the underlying tables change.
+"""
+
+import hashlib
+import json
+
+from app.data.road_tax import STATE_TAX_CONFIG
+from app.data.gst import GST_RATES, SMALL_CAR_THRESHOLDS
+
+
+def tax_data_version() -> str:
+    """Short content hash of STATE_TAX_CONFIG, GST_RATES and SMALL_CAR_THRESHOLDS."""
+    payload = json.dumps(
+        [STATE_TAX_CONFIG, GST_RATES, SMALL_CAR_THRESHOLDS],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+# The tables are module constants, so the version is fixed for the process
+# (Streamlit's reloader re-imports this module when they are edited).
+TAX_DATA_VERSION = tax_data_version()
@@ -0,0 +1,447 @@
+"""Durable valuation history.
+
+Each valuation is stored as one flat entry (see HISTORY_FIELDS) tagged with
+the id of the history it belongs to, usually one per browser session. Two
+interchangeable backends implement the same query interface:
+
+    SQLiteHistoryStore   default; WAL journal, shared read and write connections,
+                         indexes for every filter the UI offers
+    FileHistoryStore     JSON lines file, scanned on every query; for tests
+                         and read-only inspection
+
+Writes never block the caller: HistoryWriter queues entries and a single
+background thread commits them in batches. submit() returns a sequence
+number that a reader can wait() on to see its own writes.
+
+Retention is applied by the store's prune(), which the writer runs at most
+once per PRUNE_INTERVAL: entries older than retention_days are dropped, and
+each history keeps at most max_per_session entries.
+"""
+
+import abc
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from app.config import (
+    HISTORY_BACKEND,
+    HISTORY_DIR,
+    HISTORY_RETENTION_DAYS,
+    HISTORY_MAX_PER_SESSION,
+    HISTORY_BATCH_SIZE,
+    HISTORY_FLUSH_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+HISTORY_BACKENDS = ["sqlite", "file"]
+
+# Stored fields, in column order; created_at is a Unix timestamp
+HISTORY_FIELDS = (
+    "session_id",
+    "created_at",
+    "year",
+    "fuel_type",
+    "state",
+    "ex_showroom",
+    "asking_price",
+    "km",
+    "fair_value",
+    "verdict",
+)
+
+# Seconds between retention passes run by HistoryWriter
+PRUNE_INTERVAL = 3600.0
+
+_DAY = 86400.0
+
+
+class HistoryFilter(NamedTuple):
+    """Which entries a query returns; None matches everything."""
+    session_id: Optional[str] = None
+    state: Optional[str] = None
+    fuel_type: Optional[str] = None
+    verdict: Optional[str] = None
+    since: Optional[float] = None  # created_at >= since
+    until: Optional[float] = None  # created_at < until
+
+
+class HistoryStore(abc.ABC):
+    """Interface shared by the history backends."""
+
+    def __init__(self, retention_days: float = 0, max_per_session: int = 0):
+        self.retention_days = retention_days
+        self.max_per_session = max_per_session
+
+    @abc.abstractmethod
+    def add_many(self, entries: list[dict]) -> None:
+        """Store entries (dicts with HISTORY_FIELDS)."""
+
+    @abc.abstractmethod
+    def query(self, filters: HistoryFilter = HistoryFilter(), limit: int = 10, offset: int = 0) -> list[dict]:
+        """Matching entries, newest first."""
+
+    @abc.abstractmethod
+    def count(self, filters: HistoryFilter = HistoryFilter()) -> int:
+        """Number of matching entries."""
+
+    @abc.abstractmethod
+    def delete(self, filters: HistoryFilter) -> int:
+        """Delete matching entries; returns how many were deleted."""
+
+    @abc.abstractmethod
+    def prune(self, now: Optional[float] = None) -> int:
+        """Apply the retention limits; returns how many entries were deleted."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Release the store's resources."""
+
+    def _cutoff(self, now: Optional[float]) -> Optional[float]:
+        """created_at before which entries are past retention, or None to keep all."""
+        if not self.retention_days:
+            return None
+        return (time.time() if now is None else now) - self.retention_days * _DAY
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS valuation_history (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    year INTEGER,
+    fuel_type TEXT,
+    state TEXT,
+    ex_showroom REAL,
+    asking_price REAL,
+    km INTEGER,
+    fair_value REAL,
+    verdict TEXT
+);
+CREATE INDEX IF NOT EXISTS history_by_session ON valuation_history (session_id, created_at);
+CREATE INDEX IF NOT EXISTS history_by_state ON valuation_history (session_id, state, created_at);
+CREATE INDEX IF NOT EXISTS history_by_fuel ON valuation_history (session_id, fuel_type, created_at);
+CREATE INDEX IF NOT EXISTS history_by_verdict ON valuation_history (session_id, verdict, created_at);
+CREATE INDEX IF NOT EXISTS history_by_date ON valuation_history (created_at);
+"""
+
+_COLUMNS = ", ".join(HISTORY_FIELDS)
+_INSERT = f"INSERT INTO valuation_history ({_COLUMNS}) VALUES ({', '.join('?' * len(HISTORY_FIELDS))})"
+
+
+def _where(filters: HistoryFilter) -> tuple[str, list]:
+    """SQL WHERE clause (or "") and parameters for filters."""
+    clauses, params = [], []
+    for name in ("session_id", "state", "fuel_type", "verdict"):
+        value = getattr(filters, name)
+        if value is not None:
+            clauses.append(f"{name} = ?")
+            params.append(value)
+    if filters.since is not None:
+        clauses.append("created_at >= ?")
+        params.append(filters.since)
+    if filters.until is not None:
+        clauses.append("created_at < ?")
+        params.append(filters.until)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+class SQLiteHistoryStore(HistoryStore):
+    """
+    History in a SQLite database in WAL mode.
+
+    The store holds two connections shared by every thread: one for writes
+    and one for reads, each serialized by its own lock. In WAL mode reads
+    run concurrently with the writer. Streamlit runs each rerun on a new
+    thread, so per-thread connections would pile up until close().
+    """
+
+    def __init__(self, path, retention_days: float = 0, max_per_session: int = 0):
+        super().__init__(retention_days, max_per_session)
+        self.path = str(path)
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._write_conn = self._connect()
+        with self._write_conn as conn:
+            conn.executescript(_SCHEMA)
+        self._read_conn = self._connect()
+        self._connections = [self._write_conn, self._read_conn]
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def add_many(self, entries: list[dict]) -> None:
+        rows = [tuple(entry.get(name) for name in HISTORY_FIELDS) for entry in entries]
+        with self._write_lock, self._write_conn as conn:
+            conn.executemany(_INSERT, rows)
+
+    def query(self, filters: HistoryFilter = HistoryFilter(), limit: int = 10, offset: int = 0) -> list[dict]:
+        where, params = _where(filters)
+        with self._read_lock:
+            rows = self._read_conn.execute(
+                f"SELECT id, {_COLUMNS} FROM valuation_history{where}"
+                " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, filters: HistoryFilter = HistoryFilter()) -> int:
+        where, params = _where(filters)
+        with self._read_lock:
+            return self._read_conn.execute(f"SELECT COUNT(*) FROM valuation_history{where}", params).fetchone()[0]
+
+    def delete(self, filters: HistoryFilter) -> int:
+        where, params = _where(filters)
+        with self._write_lock, self._write_conn as conn:
+            return conn.execute(f"DELETE FROM valuation_history{where}", params).rowcount
+
+    def prune(self, now: Optional[float] = None) -> int:
+        deleted = 0
+        with self._write_lock, self._write_conn as conn:
+            cutoff = self._cutoff(now)
+            if cutoff is not None:
+                deleted += conn.execute("DELETE FROM valuation_history WHERE created_at < ?", (cutoff,)).rowcount
+            if self.max_per_session:
+                over = conn.execute(
+                    "SELECT session_id FROM valuation_history GROUP BY session_id HAVING COUNT(*) > ?",
+                    (self.max_per_session,),
+                ).fetchall()
+                for (session_id,) in over:
+                    deleted += conn.execute(
+                        "DELETE FROM valuation_history WHERE id IN ("
+                        " SELECT id FROM valuation_history WHERE session_id = ?"
+                        " ORDER BY created_at DESC, id DESC LIMIT -1 OFFSET ?)",
+                        (session_id, self.max_per_session),
+                    ).rowcount
+        return deleted
+
+    def close(self) -> None:
+        with self._write_lock, self._read_lock:
+            for conn in self._connections:
+                conn.close()
+
+
+class FileHistoryStore(HistoryStore):
+    """
+    History in a JSON lines file.
+
+    Appends are cheap; queries read the whole file. Meant for tests and
+    small local setups, not for a shared server.
+    """
+
+    def __init__(self, path, retention_days: float = 0, max_per_session: int = 0):
+        super().__init__(retention_days, max_per_session)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._next_id = max((entry["id"] for entry in self._load()), default=0) + 1
+
+    def _load(self) -> list[dict]:
+        if not self.path.exists():
+            return []
+        with open(self.path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _rewrite(self, entries: list[dict]) -> None:
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in entries)
+        os.replace(tmp_path, self.path)
+
+    def _matching(self, filters: HistoryFilter) -> list[dict]:
+        """Matching entries, newest first (caller holds the lock)."""
+        entries = [entry for entry in self._load() if _matches(entry, filters)]
+        entries.sort(key=lambda entry: (entry["created_at"], entry["id"]), reverse=True)
+        return entries
+
+    def add_many(self, entries: list[dict]) -> None:
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for entry in entries:
+                    record = {"id": self._next_id, **{name: entry.get(name) for name in HISTORY_FIELDS}}
+                    self._next_id += 1
+                    f.write(json.dumps(record) + "\n")
+
+    def query(self, filters: HistoryFilter = HistoryFilter(), limit: int = 10, offset: int = 0) -> list[dict]:
+        with self._lock:
+            return self._matching(filters)[offset:offset + limit]
+
+    def count(self, filters: HistoryFilter = HistoryFilter()) -> int:
+        with self._lock:
+            return len(self._matching(filters))
+
+    def delete(self, filters: HistoryFilter) -> int:
+        with self._lock:
+            entries = self._load()
+            kept = [entry for entry in entries if not _matches(entry, filters)]
+            if len(kept) < len(entries):
+                self._rewrite(kept)
+            return len(entries) - len(kept)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        with self._lock:
+            entries = self._load()
+            cutoff = self._cutoff(now)
+            kept = [entry for entry in entries if cutoff is None or entry["created_at"] >= cutoff]
+            if self.max_per_session:
+                kept.sort(key=lambda entry: (entry["created_at"], entry["id"]), reverse=True)
+                per_session: dict[str, int] = {}
+                newest = []
+                for entry in kept:
+                    seen = per_session.get(entry["session_id"], 0)
+                    if seen < self.max_per_session:
+                        per_session[entry["session_id"]] = seen + 1
+                        newest.append(entry)
+                kept = sorted(newest, key=lambda entry: entry["id"])
+            if len(kept) < len(entries):
+                self._rewrite(kept)
+            return len(entries) - len(kept)
+
+    def close(self) -> None:
+        pass  # the file is only open during each call
+
+
+def _matches(entry: dict, filters: HistoryFilter) -> bool:
+    for name in ("session_id", "state", "fuel_type", "verdict"):
+        value = getattr(filters, name)
+        if value is not None and entry.get(name) != value:
+            return False
+    if filters.since is not None and entry["created_at"] < filters.since:
+        return False
+    if filters.until is not None and entry["created_at"] >= filters.until:
+        return False
+    return True
+
+
+class HistoryWriter:
+    """
+    Commits submitted entries to a store from one background thread.
+
+    Entries are written once batch_size are queued, when flush_interval
+    seconds have passed since the first queued entry, or when a reader
+    waits for them. A failed batch is logged and dropped.
+    """
+
+    def __init__(
+        self,
+        store: HistoryStore,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+        prune_interval: float = PRUNE_INTERVAL,
+    ):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.prune_interval = prune_interval
+        self._queue: list[dict] = []
+        self._cond = threading.Condition()
+        self._submitted = 0
+        self._committed = 0
+        self._flush_requested = False
+        self._closed = False
+        self._last_prune = float("-inf")
+        self._thread = threading.Thread(target=self._run, name="carworth-history", daemon=True)
+        self._thread.start()
+
+    def submit(self, entry: dict) -> int:
+        """Queue an entry; returns its sequence number for wait()."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("HistoryWriter is closed")
+            self._queue.append(entry)
+            self._submitted += 1
+            if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+            return self._submitted
+
+    def wait(self, seq: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Block until entry seq (default: everything submitted so far) is
+        committed. Returns False on timeout.
+        """
+        with self._cond:
+            target = self._submitted if seq is None else seq
+            if self._committed >= target:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._committed >= target, timeout)
+
+    def close(self) -> None:
+        """Commit everything queued and stop the writer thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self.store.close()
+
+    def _ready(self) -> bool:
+        return self._closed or len(self._queue) >= self.batch_size or (self._flush_requested and bool(self._queue))
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                self._cond.wait_for(self._ready, self.flush_interval)
+                batch, self._queue = self._queue, []
+                self._flush_requested = False
+                closed = self._closed
+
+            if batch:
+                try:
+                    self.store.add_many(batch)
+                except Exception:
+                    logger.exception("Failed to write %d history entries", len(batch))
+                with self._cond:
+                    self._committed += len(batch)
+                    self._cond.notify_all()
+                self._maybe_prune()
+
+            if closed:
+                return
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = now
+        try:
+            self.store.prune()
+        except Exception:
+            logger.exception("Failed to prune history")
+
+
+def open_history_store(
+    backend: str = HISTORY_BACKEND,
+    directory=HISTORY_DIR,
+    retention_days: float = HISTORY_RETENTION_DAYS,
+    max_per_session: int = HISTORY_MAX_PER_SESSION,
+) -> HistoryStore:
+    """Open (creating if needed) the history store in directory."""
+    if backend not in HISTORY_BACKENDS:
+        raise ValueError(f"Unknown history backend: {backend!r} (expected one of {HISTORY_BACKENDS})")
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    if backend == "sqlite":
+        return SQLiteHistoryStore(directory / "history.db", retention_days, max_per_session)
+    return FileHistoryStore(directory / "history.jsonl", retention_days, max_per_session)
+
+
+@lru_cache(maxsize=1)
+def get_history_writer() -> HistoryWriter:
+    """Process-wide writer for the configured store, flushed at exit."""
+    writer = HistoryWriter(open_history_store(), HISTORY_BATCH_SIZE, HISTORY_FLUSH_INTERVAL)
+    atexit.register(writer.close)
+    return writer
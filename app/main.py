@@ -1,6 +1,7 @@
 """CarWorth - Used Car Value Calculator main entry point."""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -10,270 +11,220 @@ import streamlit as st
 import streamlit_shadcn_ui as ui
 
 from app.config import APP_TITLE, APP_DESCRIPTION, PAGE_LAYOUT, APP_VERSION
-from app.components.input_form import render_input_form, render_comparison_form
-from app.components.results_card import render_results_card
-from app.components.breakdown import render_breakdown
 from app.components.warnings import render_warnings, render_limitations
 from app.components.checklist import render_checklist
-from app.components.comparison_results import render_comparison_results
 from app.components.history import init_history, add_to_history, render_history
 from app.components.splash import show_splash_screen
-from app.components.road_tax_page import render_road_tax_page
-from app.calculators.on_road_price import calculate_on_road_price
-from app.calculators.depreciation import calculate_total_depreciation
-from app.calculators.fair_value import calculate_complete_fair_value
-from app.calculators.verdict import get_verdict, get_negotiation_target, generate_warnings
+from app.calculators.graph import ValuationGraph
 from app.utils.validators import validate_inputs
-from app.utils.pdf_generator import generate_valuation_report
 
+# Page-specific components (and their pandas, altair and fpdf dependencies)
+# are imported inside the fragments that render them, so a cold start only
+# loads what the first page needs.
 
-def calculate_car_value(inputs: dict) -> dict:
-    """
-    Run all calculations for a single car.
-
-    Returns dict with all calculation results.
-    """
-    on_road_data = calculate_on_road_price(
-        ex_showroom=inputs["ex_showroom"],
-        state=inputs["state"],
-        fuel_type=inputs["fuel_type"],
-        custom_road_tax_rate=inputs.get("custom_road_tax_rate"),
-        engine_cc=inputs.get("engine_cc"),
-        length_mm=inputs.get("length_mm"),
-    )
 
-    depreciation_data = calculate_total_depreciation(
-        year=inputs["year"],
-        fuel_type=inputs["fuel_type"],
-        state=inputs["state"],
-        owner=inputs["owner"],
-        km=inputs["km"],
-        brand=inputs["brand"],
-        transmission=inputs["transmission"],
-        body_condition=inputs["body_condition"],
-        accident_history=inputs["accident_history"],
-        service_history=inputs["service_history"],
-        commercial_use=inputs["commercial_use"],
-        new_gen_available=inputs["new_gen_available"],
-    )
+# Viewport and security meta tags
+# Note: PWA meta tags (apple-touch-icon, manifest) are injected via Dockerfile
+META_TAGS = """
+<meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
+<meta name="referrer" content="strict-origin-when-cross-origin">
+<meta http-equiv="X-Content-Type-Options" content="nosniff">
+"""
 
-    insurance_valid = inputs["insurance_status"] == "Valid"
-    use_advanced = inputs["use_advanced"]
-    fair_value_data = calculate_complete_fair_value(
-        on_road_price=on_road_data["on_road_price"],
-        basic_depreciation=depreciation_data["basic_capped"],
-        advanced_depreciation=depreciation_data["advanced_capped"],
-        insurance_valid=insurance_valid,
-        ex_showroom=inputs["ex_showroom"],
-        use_advanced=use_advanced,
-    )
+ASSETS_DIR = Path(__file__).parent / "assets"
 
-    verdict_data = get_verdict(
-        asking_price=inputs["asking_price"],
-        fair_value=fair_value_data["fair_value"],
-    )
 
-    negotiation_target = get_negotiation_target(
-        fair_value=fair_value_data["fair_value"],
-        verdict_result=verdict_data,
-    )
+@lru_cache(maxsize=1)
+def _page_styles() -> str:
+    """Meta tags plus style.css, read from disk once per process."""
+    css_path = ASSETS_DIR / "style.css"
+    if not css_path.exists():
+        return META_TAGS
+    return f"{META_TAGS}<style>{css_path.read_text()}</style>"
 
-    warnings = generate_warnings(
-        fuel_type=inputs["fuel_type"],
-        state=inputs["state"],
-        age=depreciation_data["age"],
-        mileage_status=depreciation_data["mileage_status"],
-        owner=inputs["owner"],
-        accident_history=inputs["accident_history"],
-        commercial_use=inputs["commercial_use"],
-        transmission=inputs["transmission"],
-    )
 
-    return {
-        "inputs": inputs,
-        "on_road_data": on_road_data,
-        "depreciation_data": depreciation_data,
-        "fair_value_data": fair_value_data,
-        "verdict_data": verdict_data,
-        "negotiation_target": negotiation_target,
-        "warnings": warnings,
-        "use_advanced": use_advanced,
-    }
+@lru_cache(maxsize=1)
+def _logo_bytes() -> bytes | None:
+    """Header logo, read from disk once per process."""
+    logo_path = ASSETS_DIR / "logo.png"
+    return logo_path.read_bytes() if logo_path.exists() else None
 
 
 def load_css():
     """Load custom CSS styles and security meta tags."""
-    # Add viewport and security meta tags
-    # Note: PWA meta tags (apple-touch-icon, manifest) are injected via Dockerfile
-    st.markdown(
-        """
-        <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
-        <meta name="referrer" content="strict-origin-when-cross-origin">
-        <meta http-equiv="X-Content-Type-Options" content="nosniff">
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_page_styles(), unsafe_allow_html=True)
+
+
+def get_valuation_graph(name: str) -> ValuationGraph:
+    """
+    This session's incremental valuation graph for one form.
+
+    Re-calculating after editing a few fields only recomputes the stages
+    those fields feed (e.g. a new asking price reruns just the verdict).
+    """
+    graphs = st.session_state.setdefault("valuation_graphs", {})
+    if name not in graphs:
+        graphs[name] = ValuationGraph()
+    return graphs[name]
+
 
-    css_path = Path(__file__).parent / "assets" / "style.css"
-    if css_path.exists():
-        with open(css_path) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+def _pdf_report(report: dict) -> bytes:
+    """Render (or fetch the cached) PDF report; fpdf is loaded on first download."""
+    from app.utils.pdf_generator import cached_valuation_report
+
+    return cached_valuation_report(**report)
 
 
 def render_header():
     """Render the app header with logo."""
     col1, col2 = st.columns([1, 5])
 
-    logo_path = Path(__file__).parent / "assets" / "logo.png"
+    logo = _logo_bytes()
     with col1:
-        if logo_path.exists():
-            st.image(str(logo_path), width=80)
+        if logo is not None:
+            st.image(logo, width=80)
 
     with col2:
         st.title(APP_TITLE)
         st.caption(APP_DESCRIPTION)
 
 
-def main():
-    """Main application entry point."""
-    # Page configuration
-    st.set_page_config(
-        page_title=APP_TITLE,
-        page_icon="🚗",
-        layout=PAGE_LAYOUT,
-        initial_sidebar_state="collapsed",
-    )
+# Each mode's form and results run as a fragment: editing an input reruns
+# only that fragment, not the header, styles, history or limitations.
+@st.fragment
+def road_tax_fragment():
+    """Road Tax Reference page."""
+    from app.components.road_tax_page import render_road_tax_page
 
-    # Show splash screen on first load
-    show_splash_screen()
+    render_road_tax_page()
 
-    # Initialize history
-    init_history()
 
-    # Load custom styles
-    load_css()
+@st.fragment
+def portfolio_fragment():
+    """Portfolio analytics for an uploaded inventory."""
+    from app.components.portfolio import render_portfolio_page
 
-    # Header
-    render_header()
+    render_portfolio_page()
 
-    st.divider()
 
-    # Mode toggle using shadcn tabs
-    mode = ui.tabs(
-        options=["Single Car", "Compare Two Cars", "Road Tax Rates"],
-        default_value="Single Car",
-        key="mode_selector",
-    )
+@st.fragment
+def comparison_fragment():
+    """Comparison form and results."""
+    from app.components.input_form import render_comparison_form
+    from app.components.comparison_results import render_comparison_results
 
-    comparison_mode = mode == "Compare Two Cars"
-    road_tax_mode = mode == "Road Tax Rates"
+    car1_inputs, car2_inputs = render_comparison_form()
 
     st.markdown("")  # Spacer
+    calculate_clicked = st.button(
+        "🔍 Compare Cars",
+        type="primary",
+        use_container_width=True,
+        key="compare_btn",
+    )
 
-    if road_tax_mode:
-        # Road Tax Reference page
-        render_road_tax_page()
-
-    elif comparison_mode:
-        # Comparison mode
-        car1_inputs, car2_inputs = render_comparison_form()
+    st.divider()
 
-        st.markdown("")  # Spacer
-        calculate_clicked = st.button(
-            "🔍 Compare Cars",
-            type="primary",
-            use_container_width=True,
-            key="compare_btn",
-        )
+    if calculate_clicked:
+        # Validate both cars
+        car1_valid, car1_errors = validate_inputs(car1_inputs)
+        car2_valid, car2_errors = validate_inputs(car2_inputs)
 
-        st.divider()
+        if not car1_valid or not car2_valid:
+            if car1_errors:
+                st.error(f"**Car 1:** {', '.join(car1_errors)}")
+            if car2_errors:
+                st.error(f"**Car 2:** {', '.join(car2_errors)}")
+        else:
+            with st.spinner("Calculating..."):
+                car1_data = get_valuation_graph("car1").evaluate(car1_inputs)
+                car2_data = get_valuation_graph("car2").evaluate(car2_inputs)
 
-        if calculate_clicked:
-            # Validate both cars
-            car1_valid, car1_errors = validate_inputs(car1_inputs)
-            car2_valid, car2_errors = validate_inputs(car2_inputs)
-
-            if not car1_valid or not car2_valid:
-                if car1_errors:
-                    st.error(f"**Car 1:** {', '.join(car1_errors)}")
-                if car2_errors:
-                    st.error(f"**Car 2:** {', '.join(car2_errors)}")
-            else:
-                with st.spinner("Calculating..."):
-                    car1_data = calculate_car_value(car1_inputs)
-                    car2_data = calculate_car_value(car2_inputs)
-
-                render_comparison_results(car1_data, car2_data)
-
-                # Store in session
-                st.session_state["comparison_mode"] = True
-                st.session_state["car1_data"] = car1_data
-                st.session_state["car2_data"] = car2_data
-                st.session_state["calculated"] = True
+            render_comparison_results(car1_data, car2_data)
 
-        else:
-            st.info("Enter details for both cars and click **Compare Cars** to see results.")
+            # Store in session
+            st.session_state["comparison_mode"] = True
+            st.session_state["car1_data"] = car1_data
+            st.session_state["car2_data"] = car2_data
+            st.session_state["calculated"] = True
 
     else:
-        # Single car mode
-        inputs = render_input_form()
+        st.info("Enter details for both cars and click **Compare Cars** to see results.")
 
-        st.markdown("")  # Spacer
-        calculate_clicked = st.button(
-            "💰 Calculate Fair Value",
-            type="primary",
-            use_container_width=True,
-            key="calculate_btn",
-        )
 
-        st.divider()
+@st.fragment
+def single_car_fragment():
+    """Single car form, results and the sections derived from them."""
+    from app.components.input_form import render_input_form
+    from app.components.results_card import render_results_card
+
+    inputs = render_input_form()
+
+    st.markdown("")  # Spacer
+    calculate_clicked = st.button(
+        "💰 Calculate Fair Value",
+        type="primary",
+        use_container_width=True,
+        key="calculate_btn",
+    )
+
+    st.divider()
 
-        if calculate_clicked:
-            is_valid, errors = validate_inputs(inputs)
-
-            if not is_valid:
-                for error in errors:
-                    st.error(error)
-            else:
-                with st.spinner("Calculating..."):
-                    result = calculate_car_value(inputs)
-
-                # Display results
-                render_results_card(
-                    fair_value=result["fair_value_data"]["fair_value"],
-                    fair_value_min=result["fair_value_data"]["fair_value_min"],
-                    fair_value_max=result["fair_value_data"]["fair_value_max"],
-                    asking_price=inputs["asking_price"],
-                    verdict_data=result["verdict_data"],
-                    negotiation_target=result["negotiation_target"],
-                    fair_value_data=result["fair_value_data"],
-                    use_advanced=result["use_advanced"],
-                )
-
-                # Store in session for breakdown
-                st.session_state["on_road_data"] = result["on_road_data"]
-                st.session_state["depreciation_data"] = result["depreciation_data"]
-                st.session_state["fair_value_data"] = result["fair_value_data"]
-                st.session_state["warnings"] = result["warnings"]
-                st.session_state["calculated"] = True
-                st.session_state["comparison_mode"] = False
-                st.session_state["use_advanced"] = result["use_advanced"]
-                st.session_state["inputs"] = inputs
-                st.session_state["verdict_data"] = result["verdict_data"]
-                st.session_state["negotiation_target"] = result["negotiation_target"]
-
-                # Add to history
-                add_to_history(
-                    inputs=inputs,
-                    fair_value=result["fair_value_data"]["fair_value"],
-                    verdict=result["verdict_data"]["verdict"],
-                )
+    if calculate_clicked:
+        is_valid, errors = validate_inputs(inputs)
 
+        if not is_valid:
+            for error in errors:
+                st.error(error)
         else:
-            st.info("Enter car details and click **Calculate Fair Value** to see results.")
+            with st.spinner("Calculating..."):
+                result = get_valuation_graph("single").evaluate(inputs)
+
+            # Store in session for results and breakdown
+            st.session_state["on_road_data"] = result["on_road_data"]
+            st.session_state["depreciation_data"] = result["depreciation_data"]
+            st.session_state["fair_value_data"] = result["fair_value_data"]
+            st.session_state["warnings"] = result["warnings"]
+            st.session_state["calculated"] = True
+            st.session_state["comparison_mode"] = False
+            st.session_state["use_advanced"] = result["use_advanced"]
+            st.session_state["inputs"] = inputs
+            st.session_state["verdict_data"] = result["verdict_data"]
+            st.session_state["negotiation_target"] = result["negotiation_target"]
+
+            # Add to history
+            add_to_history(
+                inputs=inputs,
+                fair_value=result["fair_value_data"]["fair_value"],
+                verdict=result["verdict_data"]["verdict"],
+            )
+
+            # History and checklist live outside this fragment: rerun the
+            # whole page once, showing the results card on that run
+            st.session_state["show_results"] = True
+            st.rerun(scope="app")
+
+    elif st.session_state.pop("show_results", False):
+        fair_value_data = st.session_state["fair_value_data"]
+        render_results_card(
+            fair_value=fair_value_data["fair_value"],
+            fair_value_min=fair_value_data["fair_value_min"],
+            fair_value_max=fair_value_data["fair_value_max"],
+            asking_price=st.session_state["inputs"]["asking_price"],
+            verdict_data=st.session_state["verdict_data"],
+            negotiation_target=st.session_state["negotiation_target"],
+            fair_value_data=fair_value_data,
+            use_advanced=st.session_state["use_advanced"],
+        )
+
+    else:
+        st.info("Enter car details and click **Calculate Fair Value** to see results.")
+
+    # Below the main columns - additional sections
+    if st.session_state.get("calculated") and not st.session_state.get("comparison_mode"):
+        from app.components.breakdown import render_breakdown
+        from app.components.value_surface import render_value_surface
 
-    # Below the main columns - additional sections (single car mode only)
-    if st.session_state.get("calculated") and not st.session_state.get("comparison_mode") and not road_tax_mode:
         st.divider()
 
         # Warnings section
@@ -281,19 +232,19 @@ def main():
             render_warnings(st.session_state["warnings"])
             st.divider()
 
-        # PDF Download button
-        pdf_bytes = generate_valuation_report(
-            inputs=st.session_state["inputs"],
-            on_road_data=st.session_state["on_road_data"],
-            depreciation_data=st.session_state["depreciation_data"],
-            fair_value_data=st.session_state["fair_value_data"],
-            verdict_data=st.session_state["verdict_data"],
-            negotiation_target=st.session_state["negotiation_target"],
-            warnings=st.session_state.get("warnings", []),
-        )
+        # PDF Download button (rendered only when clicked, then cached)
+        report = {
+            "inputs": st.session_state["inputs"],
+            "on_road_data": st.session_state["on_road_data"],
+            "depreciation_data": st.session_state["depreciation_data"],
+            "fair_value_data": st.session_state["fair_value_data"],
+            "verdict_data": st.session_state["verdict_data"],
+            "negotiation_target": st.session_state["negotiation_target"],
+            "warnings": st.session_state.get("warnings", []),
+        }
         st.download_button(
             label="Download PDF Report",
-            data=pdf_bytes,
+            data=lambda: _pdf_report(report),  # built on click; needs Streamlit >= 1.52
             file_name=f"carworth_report_{st.session_state['inputs']['year']}_{st.session_state['inputs']['fuel_type'].lower()}.pdf",
             mime="application/pdf",
             use_container_width=True,
@@ -310,15 +261,82 @@ def main():
 
         st.divider()
 
-        # Checklist
-        render_checklist()
+        # What-if heatmap (year x km)
+        render_value_surface(st.session_state["inputs"])
 
         st.divider()
 
-    # History section (not shown on road tax page)
-    if not road_tax_mode:
-        with st.expander("Recent Valuations", expanded=False):
-            render_history()
+
+@st.fragment
+def checklist_fragment():
+    """Due diligence checklist; ticking an item reruns only the checklist."""
+    render_checklist()
+
+
+@st.fragment
+def history_fragment():
+    """Recent valuations."""
+    with st.expander("Recent Valuations", expanded=False):
+        render_history()
+
+
+def main():
+    """Main application entry point."""
+    # Page configuration
+    st.set_page_config(
+        page_title=APP_TITLE,
+        page_icon="🚗",
+        layout=PAGE_LAYOUT,
+        initial_sidebar_state="collapsed",
+    )
+
+    # Show splash screen on first load
+    show_splash_screen()
+
+    # Initialize history
+    init_history()
+
+    # Load custom styles
+    load_css()
+
+    # Header
+    render_header()
+
+    st.divider()
+
+    # Mode toggle using shadcn tabs
+    mode = ui.tabs(
+        options=["Single Car", "Compare Two Cars", "Portfolio", "Road Tax Rates"],
+        default_value="Single Car",
+        key="mode_selector",
+    )
+
+    comparison_mode = mode == "Compare Two Cars"
+    road_tax_mode = mode == "Road Tax Rates"
+    portfolio_mode = mode == "Portfolio"
+
+    st.markdown("")  # Spacer
+
+    if road_tax_mode:
+        # Road Tax Reference page
+        road_tax_fragment()
+
+    elif portfolio_mode:
+        portfolio_fragment()
+
+    elif comparison_mode:
+        comparison_fragment()
+
+    else:
+        single_car_fragment()
+
+        if st.session_state.get("calculated") and not st.session_state.get("comparison_mode"):
+            checklist_fragment()
+            st.divider()
+
+    # History section (not shown on road tax or portfolio pages)
+    if not road_tax_mode and not portfolio_mode:
+        history_fragment()
 
         st.divider()
 
@@ -0,0 +1,166 @@
+"""Opt-in per-stage timing for the valuation and report pipelines.
+
+Disabled by default. Enable with CARWORTH_METRICS=1 (or METRICS.enable()).
+When disabled, METRICS.timer() returns None and instrumented code skips
+all timing behind a single ``if timer:`` check per stage.
+
+Usage in a pipeline:
+    timer = METRICS.timer()
+    result = stage_one()
+    if timer:
+        timer.lap("stage_one")
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Optional
+
+from app.config import METRICS_ENABLED, METRICS_LOG_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds (10 us .. 1 s)
+BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+METRIC_NAME = "carworth_stage_duration_seconds"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (not thread-safe; guarded by Metrics)."""
+
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class StageTimer:
+    """Times consecutive stages of one pipeline run."""
+
+    __slots__ = ("_metrics", "_start", "_last")
+
+    def __init__(self, metrics: "Metrics"):
+        self._metrics = metrics
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """Record the time since the previous lap (or start) under stage."""
+        now = time.perf_counter()
+        self._metrics.observe(stage, now - self._last)
+        self._last = now
+
+    def total(self, stage: str) -> None:
+        """Record the time since the timer started under stage."""
+        self._metrics.observe(stage, time.perf_counter() - self._start)
+
+
+class Metrics:
+    """Process-wide registry of per-stage histograms."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._reporter: Optional[threading.Thread] = None
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def timer(self) -> Optional[StageTimer]:
+        """Start timing a pipeline run, or None when metrics are disabled."""
+        if not self.enabled:
+            return None
+        return StageTimer(self)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram()
+            histogram.observe(seconds)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-stage call count, mean, and approximate p50/p99 in seconds."""
+        with self._lock:
+            return {
+                stage: {
+                    "count": h.count,
+                    "sum": h.total,
+                    "mean": h.total / h.count if h.count else 0.0,
+                    "p50": h.quantile(0.50),
+                    "p99": h.quantile(0.99),
+                }
+                for stage, h in sorted(self._histograms.items())
+            }
+
+    def render_prometheus(self) -> str:
+        """All histograms in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {METRIC_NAME} Wall time per valuation/report pipeline stage.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for stage, h in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip((*BUCKETS, "+Inf"), h.counts):
+                    cumulative += count
+                    lines.append(f'{METRIC_NAME}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_NAME}_sum{{stage="{stage}"}} {h.total}')
+                lines.append(f'{METRIC_NAME}_count{{stage="{stage}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+    def format_summary(self) -> str:
+        """One log line summarising every stage."""
+        parts = [
+            f"{stage} n={s['count']} mean={s['mean'] * 1000:.3f}ms p99<={s['p99'] * 1000:.3f}ms"
+            for stage, s in self.snapshot().items()
+        ]
+        return "stage timings: " + ("; ".join(parts) if parts else "no samples")
+
+    def start_log_reporter(self, interval: float) -> None:
+        """Log format_summary() every interval seconds from a daemon thread."""
+        if self._reporter is not None:
+            return
+
+        def report():
+            while True:
+                time.sleep(interval)
+                logger.info(self.format_summary())
+
+        self._reporter = threading.Thread(target=report, name="carworth-metrics", daemon=True)
+        self._reporter.start()
+
+
+METRICS = Metrics(enabled=METRICS_ENABLED)
+
+if METRICS_ENABLED and METRICS_LOG_INTERVAL > 0:
+    METRICS.start_log_reporter(METRICS_LOG_INTERVAL)
@@ -1,6 +1,8 @@
 from .formatters import (
     format_currency,
+    format_currency_column,
     format_currency_lakhs,
+    format_lakhs_column,
     format_percentage,
     format_number,
 )
@@ -9,15 +11,32 @@ from .validators import (
     validate_km,
     validate_inputs,
 )
-from .pdf_generator import generate_valuation_report
+
+# fpdf is slow to import and only needed for reports: load pdf_generator on
+# first use of its names
+_LAZY_ATTRIBUTES = {
+    "generate_valuation_report": "pdf_generator",
+    "cached_valuation_report": "pdf_generator",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        return getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "format_currency",
+    "format_currency_column",
     "format_currency_lakhs",
+    "format_lakhs_column",
     "format_percentage",
     "format_number",
     "validate_ex_showroom",
     "validate_km",
     "validate_inputs",
     "generate_valuation_report",
+    "cached_valuation_report",
 ]
@@ -0,0 +1,125 @@
+"""Bulk PDF valuation reports.
+
+Renders one report per listing either as a ZIP of per-car PDFs, streamed
+to the output as chunks come back from worker processes, or as a single
+multi-page PDF document.
+
+fpdf is imported by the rendering functions rather than at module level, so
+the CLI can build its parser without paying for it.
+"""
+
+import re
+import zipfile
+from datetime import datetime
+from typing import BinaryIO, Iterable, Optional
+
+from app.calculators.valuation import calculate_car_value
+from app.utils.listings import ErrorHandler, chunked, iter_listings
+from app.utils.parallel import imap_chunks
+
+REPORT_OUTPUTS = ["pdf", "zip"]
+
+DEFAULT_REPORT_CHUNK_SIZE = 50
+
+_REPORT_SECTIONS = [
+    "inputs",
+    "on_road_data",
+    "depreciation_data",
+    "fair_value_data",
+    "verdict_data",
+    "negotiation_target",
+    "warnings",
+]
+
+
+def report_sections(result: dict) -> dict:
+    """Pick the generate_valuation_report arguments out of a calculate_car_value result."""
+    return {name: result[name] for name in _REPORT_SECTIONS}
+
+
+def _slug(value: str) -> str:
+    """Lower-case letters, digits and dashes only, safe in a file name."""
+    return re.sub(r"[^a-z0-9]+", "-", str(value).lower()).strip("-") or "unknown"
+
+
+def report_filename(listing: dict) -> str:
+    """
+    Archive member name for a listing's report, unique per source line.
+
+    Free-text fields are slugified, so a listing cannot choose a path
+    (e.g. a fuel_type of "../../evil") inside or outside the archive.
+    """
+    return f"carworth_report_{int(listing['line'])}_{int(listing['year'])}_{_slug(listing['fuel_type'])}.pdf"
+
+
+def _render_chunk(rows: list[tuple[int, object]]) -> tuple[list[tuple[str, bytes]], list[tuple]]:
+    """Parse, value and render one chunk; returns ([(filename, pdf_bytes)], rejected rows)."""
+    from app.utils.pdf_generator import generate_valuation_report
+
+    rejected = []
+    reports = []
+    # Every report in the chunk shares one timestamp (and header stamp)
+    generated_on = datetime.now()
+    for listing in iter_listings(rows, on_error=lambda *error: rejected.append(error)):
+        result = calculate_car_value(listing)
+        pdf_bytes = generate_valuation_report(**report_sections(result), generated_on=generated_on)
+        reports.append((report_filename(listing), pdf_bytes))
+    return reports, rejected
+
+
+def write_report_zip(
+    rows: Iterable[tuple[int, object]],
+    stream: BinaryIO,
+    chunk_size: int = DEFAULT_REPORT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    on_error: Optional[ErrorHandler] = None,
+) -> int:
+    """
+    Write a ZIP archive with one PDF report per valid listing.
+
+    Rows are raw (line_number, row) pairs as from read_listings. Reports are
+    rendered in worker processes and each chunk is written to the archive as
+    soon as it is ready, so memory stays bounded; the stream does not need to
+    be seekable.
+
+    Returns:
+        Number of reports written
+    """
+    count = 0
+    chunks = chunked(rows, chunk_size)
+    # PDF content streams are already compressed
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED) as archive:
+        for reports, rejected in imap_chunks(_render_chunk, chunks, workers):
+            if on_error:
+                for error in rejected:
+                    on_error(*error)
+            for name, pdf_bytes in reports:
+                archive.writestr(name, pdf_bytes)
+            count += len(reports)
+    return count
+
+
+def write_report_pdf(
+    rows: Iterable[tuple[int, object]],
+    stream: BinaryIO,
+    on_error: Optional[ErrorHandler] = None,
+) -> int:
+    """
+    Write every valid listing's report into one multi-page PDF.
+
+    All cars share a single document, so page setup and fonts are done once.
+    fpdf2 assembles the file in memory, so use write_report_zip for very
+    large lots.
+
+    Returns:
+        Number of reports written
+    """
+    from app.utils.pdf_generator import CarWorthPDF, render_valuation
+
+    pdf = CarWorthPDF()
+    count = 0
+    for listing in iter_listings(rows, on_error=on_error):
+        render_valuation(pdf, **report_sections(calculate_car_value(listing)))
+        count += 1
+    stream.write(pdf.output())
+    return count
@@ -0,0 +1,235 @@
+"""Parquet and Arrow IPC input/output for bulk valuations.
+
+Results are written with a flat, typed schema (COLUMN_TYPES): one column per
+input and result field, numbers as int/float columns, flags as booleans and
+categorical labels (state, fuel, brand, verdict, ...) dictionary-encoded.
+Warehouses can load the files directly, with no per-row parsing.
+
+Listings are read one record batch (Parquet row group) at a time and records
+are written in row groups of row_group_size rows, so memory stays bounded.
+
+pyarrow is optional: it is imported on first use, and only the Parquet/Arrow
+paths need it.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+from app.calculators.batch import MILEAGE_STATUSES, VERDICT_LABELS
+from app.data.categories import CATEGORIES
+
+COLUMNAR_FORMATS = ["parquet", "arrow"]
+
+DEFAULT_ROW_GROUP_SIZE = 5000
+
+# Supported codecs per format; None uses the format's default
+# (snappy for Parquet, uncompressed for Arrow IPC)
+COMPRESSIONS = {
+    "parquet": ["none", "snappy", "zstd", "gzip", "lz4", "brotli"],
+    "arrow": ["none", "zstd", "lz4"],
+}
+
+# Output column -> type; "category" columns are dictionary-encoded strings
+COLUMN_TYPES = {
+    "line": "int64",
+    # Inputs
+    "ex_showroom": "float64",
+    "year": "int32",
+    "km": "int64",
+    "fuel_type": "category",
+    "state": "category",
+    "owner": "category",
+    "asking_price": "float64",
+    "insurance_status": "category",
+    "custom_road_tax_rate": "float64",
+    "brand": "category",
+    "transmission": "category",
+    "body_condition": "category",
+    "accident_history": "category",
+    "service_history": "category",
+    "commercial_use": "bool",
+    "new_gen_available": "bool",
+    "use_advanced": "bool",
+    "engine_cc": "int32",
+    "length_mm": "int32",
+    # Results
+    "on_road_price": "float64",
+    "road_tax_rate": "float64",
+    "age": "int32",
+    "mileage_status": "category",
+    "basic_capped": "float64",
+    "advanced_capped": "float64",
+    "basic_adjusted": "float64",
+    "advanced_adjusted": "float64",
+    "insurance_deduction": "float64",
+    "fair_value": "float64",
+    "fair_value_min": "float64",
+    "fair_value_max": "float64",
+    "verdict": "category",
+    "difference_percent": "float64",
+    "difference_amount": "float64",
+    "negotiation_target": "float64",
+}
+
+# Dictionary of each categorical column, in code order; other labels are
+# appended as they are seen
+CATEGORY_LABELS = {
+    **{name: category.labels for name, category in CATEGORIES.items()},
+    "mileage_status": tuple(MILEAGE_STATUSES),
+    "verdict": tuple(VERDICT_LABELS),
+}
+
+
+def _pyarrow():
+    """Import pyarrow, with an actionable error when it is missing."""
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError("Parquet/Arrow support needs pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def result_schema(fields: Iterable[str]):
+    """pyarrow schema for the given output fields."""
+    pa = _pyarrow()
+    types = {
+        "int32": pa.int32(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+    }
+    return pa.schema([(name, types[COLUMN_TYPES[name]]) for name in fields])
+
+
+def read_columnar_listings(path: str, fmt: str, batch_size: int = DEFAULT_ROW_GROUP_SIZE) -> Iterator[tuple[int, dict]]:
+    """
+    Lazily read raw listings from a Parquet or Arrow IPC (file or stream) file.
+
+    Yields (row_number, raw_row) pairs like read_listings, numbering rows
+    from 1. Column names are the listing field names.
+    """
+    pa = _pyarrow()
+    if fmt == "parquet":
+        batches = pa.parquet.ParquetFile(path).iter_batches(batch_size=batch_size)
+    elif fmt == "arrow":
+        batches = _iter_ipc_batches(pa, path)
+    else:
+        raise ValueError(f"Unsupported columnar format: {fmt}")
+
+    row_number = 0
+    for batch in batches:
+        for raw in batch.to_pylist():
+            row_number += 1
+            yield row_number, raw
+
+
+def _iter_ipc_batches(pa, path: str):
+    with pa.memory_map(path) as source:
+        try:
+            reader = pa.ipc.open_file(source)
+        except pa.ArrowInvalid:
+            source.seek(0)
+            yield from pa.ipc.open_stream(source)
+            return
+        for index in range(reader.num_record_batches):
+            yield reader.get_batch(index)
+
+
+class _DictionaryEncoder:
+    """Append-only dictionary for one column, so batches only ever add labels."""
+
+    def __init__(self, labels: Iterable[str]):
+        self.labels = list(labels)
+        self.codes = {label: code for code, label in enumerate(self.labels)}
+
+    def encode(self, pa, values: list):
+        indices = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.labels)
+                self.labels.append(value)
+            indices.append(code)
+        return pa.DictionaryArray.from_arrays(pa.array(indices, pa.int32()), pa.array(self.labels, pa.string()))
+
+
+class ColumnarWriter:
+    """
+    Incrementally write flat records to a Parquet or Arrow IPC file.
+
+    Records are buffered and written as one row group (record batch) per
+    row_group_size records. Close the writer (or use it as a context
+    manager) to flush the last group and finish the file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: str,
+        fields: list[str],
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: Optional[str] = None,
+    ):
+        if fmt not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported output format: {fmt}")
+        if compression is not None and compression not in COMPRESSIONS[fmt]:
+            raise ValueError(f"Unsupported compression for {fmt}: {compression}")
+
+        pa = self._pa = _pyarrow()
+        self.fields = fields
+        self.schema = result_schema(fields)
+        self.row_group_size = row_group_size
+        self._encoders = {
+            name: _DictionaryEncoder(CATEGORY_LABELS.get(name, ()))
+            for name in fields
+            if COLUMN_TYPES[name] == "category"
+        }
+        self._buffer: list[dict] = []
+
+        if fmt == "parquet":
+            self._writer = pa.parquet.ParquetWriter(path, self.schema, compression=compression or "snappy")
+        else:
+            options = pa.ipc.IpcWriteOptions(
+                compression=None if compression in (None, "none") else compression,
+                emit_dictionary_deltas=True,
+            )
+            self._writer = pa.ipc.new_file(path, self.schema, options=options)
+
+    def write(self, record: dict) -> None:
+        """Buffer a single record; it must contain every output field."""
+        self._buffer.append(record)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[dict]) -> None:
+        """Write several records."""
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """Write the buffered records as one row group."""
+        if not self._buffer:
+            return
+        pa = self._pa
+        arrays = []
+        for field in self.schema:
+            values = [record[field.name] for record in self._buffer]
+            encoder = self._encoders.get(field.name)
+            arrays.append(encoder.encode(pa, values) if encoder else pa.array(values, field.type))
+        self._writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,15 +1,12 @@
 """Formatting utilities for currency and numbers."""
 
-import locale
+from functools import lru_cache
+from typing import Iterable
 
-# Set locale for Indian number formatting
-try:
-    locale.setlocale(locale.LC_ALL, 'en_IN.UTF-8')
-except locale.Error:
-    try:
-        locale.setlocale(locale.LC_ALL, 'en_IN')
-    except locale.Error:
-        pass  # Fall back to default
+import numpy as np
+
+# Memo size for formatted values; bulk exports repeat many (rounded) amounts
+FORMAT_CACHE_SIZE = 4096
 
 
 def format_currency(amount: float, include_symbol: bool = True) -> str:
@@ -20,34 +17,47 @@ def format_currency(amount: float, include_symbol: bool = True) -> str:
         1500000 -> "Rs. 15,00,000"
         1234567 -> "Rs. 12,34,567"
     """
-    try:
-        formatted = locale.format_string('%d', int(amount), grouping=True)
-    except (ValueError, locale.Error):
-        formatted = format_indian_number(int(amount))
-
+    formatted = format_indian_number(int(amount))
     if include_symbol:
         return f"Rs. {formatted}"
     return formatted
 
 
-def format_indian_number(num: int) -> str:
-    """Format number with Indian comma notation (lakhs, crores)."""
-    s = str(num)
-    if len(s) <= 3:
-        return s
-
-    # Last 3 digits
-    result = s[-3:]
-    s = s[:-3]
-
-    # Rest in groups of 2
-    while s:
-        result = s[-2:] + ',' + result
-        s = s[:-2]
+def format_currency_column(amounts: Iterable[float], include_symbol: bool = True) -> list[str]:
+    """
+    Format a whole column of amounts as Indian currency.
 
-    return result
+    Equivalent to [format_currency(a, include_symbol) for a in amounts], but
+    each distinct whole-rupee value is formatted only once.
+    """
+    values = np.asarray(amounts, dtype=float)
+    if values.size == 0:
+        return []
+    unique, inverse = np.unique(values.astype(np.int64), return_inverse=True)
+    prefix = "Rs. " if include_symbol else ""
+    formatted = np.array([prefix + format_indian_number(v) for v in unique.tolist()], dtype=object)
+    return formatted[inverse.reshape(-1)].tolist()
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def format_indian_number(num: int) -> str:
+    """Format number with Indian comma notation (lakhs, crores)."""
+    if num < 0:
+        return "-" + format_indian_number(-num)
+    if num < 1000:
+        return str(num)
+
+    # Last 3 digits, then the rest in groups of 2
+    rest, last = divmod(num, 1000)
+    groups = [f"{last:03d}"]
+    while rest >= 100:
+        rest, pair = divmod(rest, 100)
+        groups.append(f"{pair:02d}")
+    groups.append(str(rest))
+    return ",".join(reversed(groups))
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
 def format_currency_lakhs(amount: float, decimal_places: int = 2) -> str:
     """
     Format amount in lakhs with specified decimal places.
@@ -60,6 +70,21 @@ def format_currency_lakhs(amount: float, decimal_places: int = 2) -> str:
     return f"{lakhs:,.{decimal_places}f} L"
 
 
+def format_lakhs_column(amounts: Iterable[float], decimal_places: int = 2) -> list[str]:
+    """
+    Format a whole column of amounts in lakhs.
+
+    Equivalent to [format_currency_lakhs(a, decimal_places) for a in amounts],
+    but each distinct amount is formatted only once.
+    """
+    values = np.asarray(amounts, dtype=float)
+    if values.size == 0:
+        return []
+    unique, inverse = np.unique(values, return_inverse=True)
+    formatted = np.array([format_currency_lakhs(v, decimal_places) for v in unique.tolist()], dtype=object)
+    return formatted[inverse.reshape(-1)].tolist()
+
+
 def format_percentage(value: float, decimal_places: int = 1) -> str:
     """
     Format decimal as percentage.
@@ -0,0 +1,274 @@
+"""Reading, parsing and writing car listings for bulk valuation."""
+
+import csv
+import json
+import math
+from itertools import islice
+from operator import itemgetter
+from typing import Callable, IO, Iterable, Iterator, Optional
+
+from app.data.constants import ADVANCED_DEFAULTS
+from app.utils.validators import validate_inputs
+
+LISTING_FORMATS = ["csv", "jsonl"]
+
+# Input fields in output column order
+LISTING_FIELDS = [
+    "ex_showroom",
+    "year",
+    "km",
+    "fuel_type",
+    "state",
+    "owner",
+    "asking_price",
+    "insurance_status",
+    "custom_road_tax_rate",
+    "brand",
+    "transmission",
+    "body_condition",
+    "accident_history",
+    "service_history",
+    "commercial_use",
+    "new_gen_available",
+    "use_advanced",
+    "engine_cc",
+    "length_mm",
+]
+
+REQUIRED_FIELDS = [
+    "ex_showroom",
+    "year",
+    "km",
+    "fuel_type",
+    "state",
+    "owner",
+    "asking_price",
+]
+
+_TRUE_VALUES = {"true", "yes", "y", "1"}
+_FALSE_VALUES = {"false", "no", "n", "0", ""}
+
+
+class ListingError(ValueError):
+    """Raised when a listing row cannot be parsed."""
+
+    def __init__(self, errors: list[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+    def __reduce__(self):
+        return type(self), (self.errors,)
+
+
+def _is_blank(value) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _to_float(value) -> float:
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+    value = float(value)
+    # "nan" and "inf" parse as floats but pass range checks and break JSON output
+    if not math.isfinite(value):
+        raise ValueError(f"expected a finite number, got {value}")
+    return value
+
+
+def _to_int(value) -> int:
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+        try:
+            return int(value)
+        except ValueError:
+            value = float(value)
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"expected a whole number, got {value}")
+        return int(value)
+    return int(value)
+
+
+def _to_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"expected true/false, got {value!r}")
+
+
+def _to_str(value) -> str:
+    return str(value).strip()
+
+
+_PARSERS = {
+    "ex_showroom": _to_float,
+    "year": _to_int,
+    "km": _to_int,
+    "asking_price": _to_float,
+    "custom_road_tax_rate": _to_float,
+    "engine_cc": _to_int,
+    "length_mm": _to_int,
+    "commercial_use": _to_bool,
+    "new_gen_available": _to_bool,
+    "use_advanced": _to_bool,
+}
+
+
+def uses_advanced_options(listing: dict) -> bool:
+    """Check if any advanced option differs from its default (as the input form does)."""
+    return any(
+        listing[field] != default
+        for field, default in ADVANCED_DEFAULTS.items()
+        if field not in ("engine_cc", "length_mm")
+    )
+
+
+def parse_listing(raw: dict) -> dict:
+    """
+    Convert a raw listing (CSV strings or JSON values) to a valuation inputs dict.
+
+    Missing optional fields take the input form defaults. When use_advanced
+    is not given it is derived from the advanced options, like the form does.
+
+    Raises:
+        ListingError: with one message per missing or malformed field
+    """
+    errors = []
+    listing = {}
+
+    for field in LISTING_FIELDS:
+        value = raw.get(field)
+        if _is_blank(value):
+            if field in REQUIRED_FIELDS:
+                errors.append(f"Missing required field: {field}")
+            elif field == "insurance_status":
+                listing[field] = "Valid"
+            else:
+                listing[field] = ADVANCED_DEFAULTS.get(field)
+            continue
+
+        parser = _PARSERS.get(field, _to_str)
+        try:
+            listing[field] = parser(value)
+        except (TypeError, ValueError):
+            errors.append(f"Invalid value for {field}: {value!r}")
+
+    if errors:
+        raise ListingError(errors)
+
+    if listing["use_advanced"] is None:
+        listing["use_advanced"] = uses_advanced_options(listing)
+
+    return listing
+
+
+def detect_format(path: Optional[str], default: str = "csv") -> str:
+    """Guess the listing format from a file extension."""
+    if path and path.lower().endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    if path and path.lower().endswith((".parquet", ".pq")):
+        return "parquet"
+    if path and path.lower().endswith((".arrow", ".feather", ".ipc", ".arrows")):
+        return "arrow"
+    if path and path.lower().endswith(".csv"):
+        return "csv"
+    return default
+
+
+def read_listings(stream: IO[str], fmt: str) -> Iterator[tuple[int, dict]]:
+    """
+    Lazily read raw listings from a CSV or JSONL text stream.
+
+    Yields (line_number, raw_row) pairs; JSONL lines that are not valid JSON
+    objects are yielded as ListingError instances instead of rows.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ListingError([f"Invalid JSON: {e.msg}"])
+                continue
+            if not isinstance(row, dict):
+                yield line_number, ListingError(["Expected a JSON object"])
+                continue
+            yield line_number, row
+    else:
+        raise ValueError(f"Unsupported listing format: {fmt}")
+
+
+ErrorHandler = Callable[[int, list[str], object], None]
+
+
+def iter_listings(
+    rows: Iterable[tuple[int, object]],
+    on_error: Optional[ErrorHandler] = None,
+) -> Iterator[dict]:
+    """
+    Parse and validate raw listings, skipping (and reporting) bad rows.
+
+    Yields valuation input dicts tagged with their source line number.
+    """
+    for line_number, raw in rows:
+        try:
+            if isinstance(raw, ListingError):
+                raise raw
+            listing = parse_listing(raw)
+        except ListingError as e:
+            if on_error:
+                on_error(line_number, e.errors, raw)
+            continue
+
+        is_valid, errors = validate_inputs(listing)
+        if not is_valid:
+            if on_error:
+                on_error(line_number, errors, raw)
+            continue
+
+        yield {"line": line_number, **listing}
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most ``size`` items."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class RecordWriter:
+    """Incrementally write flat records as CSV or JSONL."""
+
+    def __init__(self, stream: IO[str], fmt: str, fields: list[str]):
+        if fmt not in LISTING_FORMATS:
+            raise ValueError(f"Unsupported output format: {fmt}")
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = fields
+        self._values = itemgetter(*fields)
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.writer(stream)
+            self._csv.writerow(fields)
+
+    def write(self, record: dict) -> None:
+        """Write a single record; it must contain every output field."""
+        values = self._values(record)
+        if self._csv is not None:
+            self._csv.writerow(values)
+        else:
+            self.stream.write(json.dumps(dict(zip(self.fields, values))))
+            self.stream.write("\n")
+
+    def write_many(self, records: Iterable[dict]) -> None:
+        """Write several records."""
+        for record in records:
+            self.write(record)
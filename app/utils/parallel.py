@@ -0,0 +1,108 @@
+"""Multi-process bulk valuation.
+
+Raw listing rows are sharded into chunks and fanned out to a process pool.
+Each worker parses, validates and values its chunk with the batch engine,
+and chunks are merged back in submission order, so output matches the
+single-process path row for row. imap_chunks is the shared ordered fan-out
+used by other bulk jobs as well.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+from app.calculators.batch import value_rows
+from app.utils.listings import ErrorHandler, chunked, iter_listings
+
+T = TypeVar("T")
+
+# Chunks in flight per worker; bounds memory while keeping workers busy
+PREFETCH_PER_WORKER = 2
+
+_WARMUP_LISTING = {
+    "ex_showroom": 1000000.0,
+    "year": 2020,
+    "km": 50000,
+    "fuel_type": "Petrol",
+    "state": "Maharashtra",
+    "owner": "1st Owner",
+    "asking_price": 700000.0,
+    "insurance_status": "Valid",
+}
+
+
+def default_workers() -> int:
+    """Number of cores available to this process."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _init_worker() -> None:
+    """
+    Build per-worker state once.
+
+    Importing the batch engine builds the road tax index and the brand,
+    ownership and condition tables; valuing one listing warms the rest of
+    the pipeline so the first real chunk does not pay for it.
+    """
+    value_rows([_WARMUP_LISTING])
+
+
+def _value_chunk(rows: list[tuple[int, object]]) -> tuple[list[dict], list[tuple]]:
+    """Parse, validate and value one chunk; returns (records, rejected rows)."""
+    rejected = []
+    listings = list(iter_listings(rows, on_error=lambda *error: rejected.append(error)))
+    return value_rows(listings), rejected
+
+
+def imap_chunks(
+    func: Callable[[list], T],
+    chunks: Iterable[list],
+    workers: Optional[int] = None,
+    initializer: Optional[Callable[[], None]] = None,
+) -> Iterator[T]:
+    """
+    Apply func to each chunk in worker processes, yielding results in order.
+
+    At most PREFETCH_PER_WORKER chunks per worker are in flight. With a
+    single worker, chunks are processed in this process instead.
+    """
+    workers = workers or default_workers()
+    if workers == 1:
+        if initializer:
+            initializer()
+        yield from map(func, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= workers * PREFETCH_PER_WORKER:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_parallel_valuations(
+    rows: Iterable[tuple[int, object]],
+    chunk_size: int,
+    workers: Optional[int] = None,
+    on_error: Optional[ErrorHandler] = None,
+) -> Iterator[dict]:
+    """
+    Value raw (line_number, row) pairs across worker processes.
+
+    Records are yielded in input order as soon as each chunk (and every
+    chunk before it) is done. Rejected rows are reported through on_error
+    in the same order.
+    """
+    results = imap_chunks(_value_chunk, chunked(rows, chunk_size), workers, initializer=_init_worker)
+    for records, rejected in results:
+        if on_error:
+            for error in rejected:
+                on_error(*error)
+        yield from records
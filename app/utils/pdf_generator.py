@@ -2,8 +2,13 @@
 
 from io import BytesIO
 from datetime import datetime
+from typing import Optional
+
 from fpdf import FPDF
 
+from app.calculators.cache import ValuationCache, make_key
+from app.config import PDF_CACHE_SIZE, PDF_CACHE_TTL
+from app.metrics import METRICS
 from app.utils.formatters import (
     format_currency_lakhs,
     format_percentage,
@@ -11,13 +16,18 @@ from app.utils.formatters import (
     format_currency,
 )
 
+# Rendered reports keyed on their inputs and results; the TTL keeps the
+# "Generated on" timestamp reasonably fresh
+REPORT_CACHE = ValuationCache(maxsize=PDF_CACHE_SIZE, ttl=PDF_CACHE_TTL)
+
 
 class CarWorthPDF(FPDF):
     """Custom PDF class for CarWorth reports."""
 
-    def __init__(self):
+    def __init__(self, generated_on: Optional[datetime] = None):
         super().__init__()
         self.set_auto_page_break(auto=True, margin=15)
+        self.generated_on = (generated_on or datetime.now()).strftime('%d %b %Y, %I:%M %p')
 
     def header(self):
         """Add header to each page."""
@@ -25,7 +35,7 @@ class CarWorthPDF(FPDF):
         self.cell(0, 10, "CarWorth - Valuation Report", align="C", new_x="LMARGIN", new_y="NEXT")
         self.set_font("Helvetica", "", 9)
         self.set_text_color(128, 128, 128)
-        self.cell(0, 5, f"Generated on {datetime.now().strftime('%d %b %Y, %I:%M %p')}", align="C", new_x="LMARGIN", new_y="NEXT")
+        self.cell(0, 5, f"Generated on {self.generated_on}", align="C", new_x="LMARGIN", new_y="NEXT")
         self.set_text_color(0, 0, 0)
         self.ln(5)
 
@@ -66,6 +76,7 @@ def generate_valuation_report(
     verdict_data: dict,
     negotiation_target: float,
     warnings: list,
+    generated_on: Optional[datetime] = None,
 ) -> bytes:
     """
     Generate a PDF valuation report.
@@ -78,11 +89,48 @@ def generate_valuation_report(
         verdict_data: Verdict determination data
         negotiation_target: Suggested negotiation price
         warnings: List of warning messages
+        generated_on: Timestamp printed in the header (default: now)
 
     Returns:
         PDF file as bytes
     """
-    pdf = CarWorthPDF()
+    timer = METRICS.timer()
+    pdf = CarWorthPDF(generated_on)
+    render_valuation(
+        pdf,
+        inputs=inputs,
+        on_road_data=on_road_data,
+        depreciation_data=depreciation_data,
+        fair_value_data=fair_value_data,
+        verdict_data=verdict_data,
+        negotiation_target=negotiation_target,
+        warnings=warnings,
+    )
+    if timer:
+        timer.lap("pdf_render")
+    pdf_bytes = bytes(pdf.output())
+    if timer:
+        timer.lap("pdf_output")
+        timer.total("pdf_report")
+    return pdf_bytes
+
+
+def render_valuation(
+    pdf: CarWorthPDF,
+    inputs: dict,
+    on_road_data: dict,
+    depreciation_data: dict,
+    fair_value_data: dict,
+    verdict_data: dict,
+    negotiation_target: float,
+    warnings: list,
+) -> None:
+    """
+    Add one valuation report, starting on a new page, to a PDF document.
+
+    Takes the same values as generate_valuation_report; several cars can be
+    rendered into one document this way.
+    """
     pdf.add_page()
 
     use_advanced = fair_value_data.get("using_advanced", False)
@@ -291,5 +339,17 @@ def generate_valuation_report(
         "and consult with professionals before making a purchase decision."
     )
 
-    # Output to bytes
-    return bytes(pdf.output())
+
+def cached_valuation_report(**report) -> bytes:
+    """
+    generate_valuation_report through the report cache.
+
+    Takes the same keyword arguments. Repeated downloads of the same
+    valuation return the already rendered bytes.
+    """
+    key = make_key(report)
+    pdf_bytes = REPORT_CACHE.get(key)
+    if pdf_bytes is None:
+        pdf_bytes = generate_valuation_report(**report)
+        REPORT_CACHE.put(key, pdf_bytes)
+    return pdf_bytes
@@ -0,0 +1 @@
+"""Performance benchmarks for CarWorth calculators, formatters and reports."""
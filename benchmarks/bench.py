@@ -0,0 +1,417 @@
+"""CarWorth benchmark runner.
+
+Usage:
+    python -m benchmarks.bench run -o benchmarks/results/baseline.json
+    python -m benchmarks.bench run --baseline benchmarks/results/baseline.json
+    python -m benchmarks.bench compare benchmarks/results/baseline.json benchmarks/results/latest.json
+
+``run`` times each hot path over a realistic input mix and writes the
+results as JSON. ``compare`` (or ``run --baseline``) flags benchmarks whose
+throughput dropped or p99 latency rose beyond a threshold, and exits with
+status 1 so it can gate upgrades in CI.
+
+No baseline is committed: timings only compare on the same machine. Record
+one with ``run -o`` before the change under test (benchmarks/results/ is
+git-ignored), and re-record it whenever the machine or baseline commit
+changes.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+from app.config import APP_VERSION
+from app.calculators.on_road_price import calculate_on_road_price
+from app.calculators.depreciation import calculate_total_depreciation
+from app.calculators.fair_value import calculate_complete_fair_value
+from app.calculators.verdict import get_verdict, generate_warnings
+from app.calculators.valuation import calculate_car_value
+from app.calculators.surface import fair_value_surface
+from app.calculators.batch import rows_to_columns, value_cars, value_rows
+from app.data.categories import encode_columns
+from app.data.road_tax import get_slab_info
+from app.utils.formatters import (
+    format_currency,
+    format_currency_column,
+    format_currency_lakhs,
+    format_indian_number,
+)
+from app.utils.pdf_generator import generate_valuation_report
+from benchmarks.workloads import sample_results
+
+RESULTS_VERSION = 1
+
+DEFAULT_SAMPLES = 2000
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_LATENCY_THRESHOLD = 0.25
+
+
+class Benchmark(NamedTuple):
+    """A function and how to build its keyword arguments from a sample valuation."""
+    name: str
+    func: Callable[..., object]
+    arguments: Callable[[dict], dict]
+    samples: Optional[int] = None  # None: use the run's sample count
+    batch: bool = False  # arguments() takes every sample; one call values them all
+    reset: Optional[Callable[[], None]] = None  # run before each timed pass, e.g. to clear a cache
+
+
+def _batch_inputs(results: list[dict]) -> list[dict]:
+    return [r["inputs"] for r in results]
+
+
+def _encoded_columns(results: list[dict]) -> dict:
+    """value_cars columns as NumPy arrays with categorical labels pre-encoded."""
+    columns = encode_columns(rows_to_columns(_batch_inputs(results)))
+    columns["custom_road_tax_rate"] = [float("nan") if rate is None else rate for rate in columns["custom_road_tax_rate"]]
+    return {name: np.asarray(values) for name, values in columns.items()}
+
+
+def _pick(section: str, *names: str) -> Callable[[dict], dict]:
+    return lambda r: {name: r[section][name] for name in names}
+
+
+BENCHMARKS = [
+    Benchmark("get_slab_info", get_slab_info, _pick("inputs", "state", "fuel_type", "ex_showroom")),
+    Benchmark(
+        "calculate_on_road_price",
+        calculate_on_road_price,
+        _pick("inputs", "ex_showroom", "state", "fuel_type", "custom_road_tax_rate", "engine_cc", "length_mm"),
+    ),
+    Benchmark(
+        "calculate_on_road_price_numeric",
+        calculate_on_road_price,
+        lambda r: {
+            **_pick("inputs", "ex_showroom", "state", "fuel_type", "custom_road_tax_rate", "engine_cc", "length_mm")(r),
+            "explain": False,
+        },
+    ),
+    Benchmark(
+        "calculate_total_depreciation",
+        calculate_total_depreciation,
+        _pick(
+            "inputs", "year", "fuel_type", "state", "owner", "km", "brand", "transmission",
+            "body_condition", "accident_history", "service_history", "commercial_use", "new_gen_available",
+        ),
+    ),
+    Benchmark(
+        "calculate_complete_fair_value",
+        calculate_complete_fair_value,
+        lambda r: {
+            "on_road_price": r["on_road_data"]["on_road_price"],
+            "basic_depreciation": r["depreciation_data"]["basic_capped"],
+            "advanced_depreciation": r["depreciation_data"]["advanced_capped"],
+            "insurance_valid": r["inputs"]["insurance_status"] == "Valid",
+            "ex_showroom": r["inputs"]["ex_showroom"],
+            "use_advanced": r["use_advanced"],
+        },
+    ),
+    Benchmark(
+        "get_verdict",
+        get_verdict,
+        lambda r: {"asking_price": r["inputs"]["asking_price"], "fair_value": r["fair_value_data"]["fair_value"]},
+    ),
+    Benchmark(
+        "generate_warnings",
+        generate_warnings,
+        lambda r: {
+            **_pick("inputs", "fuel_type", "state", "owner", "accident_history", "commercial_use", "transmission")(r),
+            "age": r["depreciation_data"]["age"],
+            "mileage_status": r["depreciation_data"]["mileage_status"],
+        },
+    ),
+    Benchmark("calculate_car_value", calculate_car_value, lambda r: {"inputs": r["inputs"]}),
+    Benchmark(
+        "fair_value_surface",
+        fair_value_surface,
+        lambda r: {
+            "base_inputs": r["inputs"],
+            "years": range(r["inputs"]["year"] - 3, r["inputs"]["year"] + 4),
+            "km_grid": range(0, 160000, 20000),
+        },
+        samples=500,
+    ),
+    Benchmark(
+        "value_cars",
+        value_cars,
+        lambda rs: {"columns": _encoded_columns(rs)},
+        batch=True,
+    ),
+    Benchmark(
+        "value_cars_labels",
+        value_cars,
+        lambda rs: {"columns": rows_to_columns(_batch_inputs(rs))},
+        batch=True,
+    ),
+    Benchmark("value_rows", value_rows, lambda rs: {"rows": _batch_inputs(rs)}, batch=True),
+    # The formatters are memoized; clearing the memo before each pass times
+    # formatting rather than cache hits
+    Benchmark(
+        "format_currency",
+        format_currency,
+        lambda r: {"amount": r["fair_value_data"]["fair_value"]},
+        reset=format_indian_number.cache_clear,
+    ),
+    Benchmark(
+        "format_currency_lakhs",
+        format_currency_lakhs,
+        lambda r: {"amount": r["fair_value_data"]["fair_value"]},
+        reset=format_currency_lakhs.cache_clear,
+    ),
+    Benchmark(
+        "format_currency_column",
+        format_currency_column,
+        lambda rs: {"amounts": [r["fair_value_data"]["fair_value"] for r in rs]},
+        batch=True,
+        reset=format_indian_number.cache_clear,
+    ),
+    Benchmark(
+        "generate_valuation_report",
+        generate_valuation_report,
+        lambda r: {
+            name: r[name]
+            for name in (
+                "inputs", "on_road_data", "depreciation_data", "fair_value_data",
+                "verdict_data", "negotiation_target", "warnings",
+            )
+        },
+        samples=50,
+    ),
+]
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> float:
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def time_batch_benchmark(benchmark: Benchmark, samples: list[dict], repeat: int) -> dict:
+    """
+    Time a batch benchmark: one call values every sample.
+
+    Throughput is cars per second over the best pass; latencies are the
+    per-car share of each pass, so they compare directly with the scalar
+    benchmarks.
+    """
+    reset = benchmark.reset or (lambda: None)
+    kwargs = benchmark.arguments(samples)
+    benchmark.func(**kwargs)  # warm-up
+
+    passes = []
+    for _ in range(max(repeat, 5)):
+        reset()
+        start = time.perf_counter_ns()
+        benchmark.func(**kwargs)
+        passes.append((time.perf_counter_ns() - start) / len(samples))
+    passes.sort()
+
+    return {
+        "calls": len(samples),
+        "ops_per_sec": 1e9 / passes[0],
+        "mean_us": sum(passes) / len(passes) / 1000,
+        "p50_us": _percentile(passes, 0.50) / 1000,
+        "p95_us": _percentile(passes, 0.95) / 1000,
+        "p99_us": _percentile(passes, 0.99) / 1000,
+    }
+
+
+def time_benchmark(benchmark: Benchmark, samples: list[dict], repeat: int) -> dict:
+    """
+    Time one benchmark.
+
+    Arguments are prepared up front so only the call itself is timed.
+    Throughput is the best of ``repeat`` untimed-per-call passes; latency
+    percentiles come from one extra pass timing every call.
+    """
+    if benchmark.batch:
+        return time_batch_benchmark(benchmark, samples, repeat)
+
+    func = benchmark.func
+    reset = benchmark.reset or (lambda: None)
+    calls = [benchmark.arguments(sample) for sample in samples]
+    for kwargs in calls:  # warm-up
+        func(**kwargs)
+
+    best = float("inf")
+    for _ in range(repeat):
+        reset()
+        start = time.perf_counter()
+        for kwargs in calls:
+            func(**kwargs)
+        best = min(best, time.perf_counter() - start)
+
+    clock = time.perf_counter_ns
+    latencies = []
+    reset()
+    for kwargs in calls:
+        start = clock()
+        func(**kwargs)
+        latencies.append(clock() - start)
+    latencies.sort()
+
+    return {
+        "calls": len(samples),
+        "ops_per_sec": len(samples) / best,
+        "mean_us": sum(latencies) / len(latencies) / 1000,
+        "p50_us": _percentile(latencies, 0.50) / 1000,
+        "p95_us": _percentile(latencies, 0.95) / 1000,
+        "p99_us": _percentile(latencies, 0.99) / 1000,
+    }
+
+
+def run_benchmarks(
+    sample_count: int = DEFAULT_SAMPLES,
+    repeat: int = DEFAULT_REPEAT,
+    only: Optional[list[str]] = None,
+    seed: int = 2024,
+) -> dict:
+    """Run the suite and return the results document."""
+    results = sample_results(sample_count, seed)
+    benchmarks = {}
+    for benchmark in BENCHMARKS:
+        if only and not any(name in benchmark.name for name in only):
+            continue
+        samples = results[:benchmark.samples] if benchmark.samples else results
+        benchmarks[benchmark.name] = time_benchmark(benchmark, samples, repeat)
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "app_version": APP_VERSION,
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "settings": {"samples": sample_count, "repeat": repeat, "seed": seed},
+        "benchmarks": benchmarks,
+    }
+
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    latency_threshold: float = DEFAULT_LATENCY_THRESHOLD,
+) -> list[dict]:
+    """
+    Compare two results documents benchmark by benchmark.
+
+    A benchmark regresses when its throughput drops by more than threshold
+    or its p99 latency grows by more than latency_threshold (as fractions).
+    Benchmarks missing from either side are skipped.
+    """
+    rows = []
+    for name, base in baseline["benchmarks"].items():
+        cur = current["benchmarks"].get(name)
+        if cur is None:
+            continue
+        throughput_change = cur["ops_per_sec"] / base["ops_per_sec"] - 1
+        p99_change = cur["p99_us"] / base["p99_us"] - 1 if base["p99_us"] else 0.0
+        rows.append({
+            "name": name,
+            "throughput_change": throughput_change,
+            "p99_change": p99_change,
+            "regressed": throughput_change < -threshold or p99_change > latency_threshold,
+        })
+    return rows
+
+
+def print_results(results: dict) -> None:
+    print(f"{'benchmark':<32}{'ops/s':>14}{'mean us':>11}{'p50 us':>11}{'p99 us':>11}")
+    for name, r in results["benchmarks"].items():
+        print(f"{name:<32}{r['ops_per_sec']:>14,.0f}{r['mean_us']:>11.1f}{r['p50_us']:>11.1f}{r['p99_us']:>11.1f}")
+
+
+def print_comparison(rows: list[dict]) -> None:
+    print(f"{'benchmark':<32}{'throughput':>12}{'p99':>10}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(f"{row['name']:<32}{row['throughput_change']:>+12.1%}{row['p99_change']:>+10.1%}{flag}")
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _report_regressions(rows: list[dict]) -> int:
+    print_comparison(rows)
+    regressed = [row["name"] for row in rows if row["regressed"]]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s): {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Run the ``run`` subcommand."""
+    results = run_benchmarks(args.samples, args.repeat, args.only)
+    print_results(results)
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        print()
+        rows = compare_results(_load(args.baseline), results, args.threshold, args.latency_threshold)
+        return _report_regressions(rows)
+    return 0
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    """Run the ``compare`` subcommand."""
+    rows = compare_results(_load(args.baseline), _load(args.current), args.threshold, args.latency_threshold)
+    return _report_regressions(rows)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench", description="CarWorth benchmarks")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    thresholds = argparse.ArgumentParser(add_help=False)
+    thresholds.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed throughput drop (fraction)")
+    thresholds.add_argument("--latency-threshold", type=float, default=DEFAULT_LATENCY_THRESHOLD, help="Allowed p99 increase (fraction)")
+
+    run = subcommands.add_parser("run", parents=[thresholds], help="Run the benchmarks")
+    run.add_argument("-o", "--output", help="Write results JSON to this file")
+    run.add_argument("--baseline", help="Compare against this results JSON and fail on regressions")
+    run.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Sample valuations per benchmark")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed passes per benchmark")
+    run.add_argument("--only", nargs="+", help="Run only benchmarks whose name contains one of these")
+    run.set_defaults(handler=run_command)
+
+    compare = subcommands.add_parser("compare", parents=[thresholds], help="Compare two results files")
+    compare.add_argument("baseline", help="Baseline results JSON")
+    compare.add_argument("current", help="Current results JSON")
+    compare.set_defaults(handler=compare_command)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Benchmark entry point."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    for path in (args.baseline, getattr(args, "current", None)):
+        if path and not Path(path).exists():
+            parser.error(f"results file not found: {path} (record one with: python -m benchmarks.bench run -o {path})")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
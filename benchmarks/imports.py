@@ -0,0 +1,139 @@
+"""Cold-start import cost report.
+
+Usage:
+    python -m benchmarks.imports app.main
+    python -m benchmarks.imports app.calculators app.cli --top 15
+    python -m benchmarks.imports app.calculators --budget-ms 500
+
+Each module is imported in a fresh interpreter with ``python -X importtime``,
+so nothing is already cached in sys.modules. The report shows the total
+import time, the time per top-level package and the slowest individual
+modules (self time, excluding their own imports). With --budget-ms, exits
+with status 1 when any module's total exceeds the budget.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_TOP = 10
+
+# Printed to stderr after interpreter startup, so site imports are excluded
+_MARKER = "-- carworth import report --"
+
+
+class ImportTime(NamedTuple):
+    """One line of ``-X importtime`` output."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 0 for modules imported directly by the measured statement
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    """Parse the ``-X importtime`` lines after the startup marker."""
+    lines = stderr.splitlines()
+    if _MARKER in lines:
+        lines = lines[lines.index(_MARKER) + 1:]
+
+    entries = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # column header
+        module = name.strip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append(ImportTime(module, int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def measure_import(module: str) -> dict:
+    """
+    Import module in a fresh interpreter and break down where the time went.
+
+    Returns a dict with total_ms, the imported module names, per_package
+    (top-level package -> self time in ms) and modules (ImportTime entries,
+    slowest self time first).
+    """
+    code = f"import sys; print({_MARKER!r}, file=sys.stderr, flush=True); import {module}"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr.strip().splitlines()[-1]}")
+
+    entries = parse_importtime(completed.stderr)
+    per_package = defaultdict(int)
+    for entry in entries:
+        per_package[entry.module.split(".")[0]] += entry.self_us
+
+    return {
+        "module": module,
+        "total_ms": sum(entry.cumulative_us for entry in entries if entry.depth == 0) / 1000,
+        "imported": [entry.module for entry in entries],
+        "per_package": {
+            package: us / 1000 for package, us in sorted(per_package.items(), key=lambda item: -item[1])
+        },
+        "modules": sorted(entries, key=lambda entry: -entry.self_us),
+    }
+
+
+def print_report(report: dict, top: int = DEFAULT_TOP) -> None:
+    print(f"import {report['module']}: {report['total_ms']:,.1f} ms, {len(report['imported'])} modules")
+    print(f"\n{'package':<32}{'ms':>10}")
+    for package, ms in list(report["per_package"].items())[:top]:
+        print(f"{package:<32}{ms:>10.1f}")
+    print(f"\n{'module (self time)':<48}{'self ms':>10}{'cum ms':>10}")
+    for entry in report["modules"][:top]:
+        print(f"{entry.module:<48}{entry.self_us / 1000:>10.1f}{entry.cumulative_us / 1000:>10.1f}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.imports", description="CarWorth import cost report")
+    parser.add_argument("modules", nargs="+", help="Modules to import, e.g. app.main")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Packages and modules to list (default: %(default)s)")
+    parser.add_argument("--budget-ms", type=float, help="Fail if any module takes longer than this to import")
+    parser.add_argument("-o", "--output", help="Write the reports as JSON to this file")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Import report entry point."""
+    args = build_parser().parse_args(argv)
+    reports = [measure_import(module) for module in args.modules]
+    for i, report in enumerate(reports):
+        if i:
+            print()
+        print_report(report, args.top)
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                [{**report, "modules": [entry._asdict() for entry in report["modules"]]} for report in reports],
+                f,
+                indent=2,
+            )
+
+    if args.budget_ms is not None:
+        over = [report for report in reports if report["total_ms"] > args.budget_ms]
+        for report in over:
+            print(f"\nimport {report['module']} took {report['total_ms']:,.1f} ms (budget {args.budget_ms:,.0f} ms)", file=sys.stderr)
+        return 1 if over else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
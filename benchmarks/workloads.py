@@ -0,0 +1,67 @@
+"""Realistic, reproducible input distributions for the benchmarks."""
+
+import random
+
+from app.calculators.valuation import calculate_car_value
+from app.data.constants import (
+    YEARS,
+    OWNER_OPTIONS,
+    BRAND_OPTIONS,
+    TRANSMISSION_OPTIONS,
+    CONDITION_OPTIONS,
+    ACCIDENT_OPTIONS,
+    SERVICE_OPTIONS,
+)
+from app.data.road_tax import get_all_states
+
+# Rough used-car market mix
+FUEL_WEIGHTS = {"Petrol": 50, "Diesel": 30, "CNG": 10, "Electric": 6, "Hybrid": 4}
+OWNER_WEIGHTS = [60, 28, 9, 3]
+
+
+def _ex_showroom(rng: random.Random) -> float:
+    # Log-normal around 9 L, clamped to 4 L - 2 Cr, rounded to 1,000
+    price = rng.lognormvariate(13.7, 0.55)
+    return float(round(min(max(price, 400000), 20000000), -3))
+
+
+def sample_inputs(count: int, seed: int = 2024) -> list[dict]:
+    """Valuation inputs dicts as the input form would produce them."""
+    rng = random.Random(seed)
+    states = get_all_states()
+    fuels = list(FUEL_WEIGHTS)
+    fuel_weights = list(FUEL_WEIGHTS.values())
+
+    samples = []
+    for _ in range(count):
+        ex_showroom = _ex_showroom(rng)
+        year = rng.choice(YEARS)
+        age = max(YEARS[0] - year, 1)
+        use_advanced = rng.random() < 0.3
+        samples.append({
+            "ex_showroom": ex_showroom,
+            "year": year,
+            "km": int(age * rng.uniform(5000, 18000)),
+            "fuel_type": rng.choices(fuels, fuel_weights)[0],
+            "state": rng.choice(states),
+            "owner": rng.choices(OWNER_OPTIONS, OWNER_WEIGHTS)[0],
+            "asking_price": float(round(ex_showroom * rng.uniform(0.3, 0.9), -3)),
+            "insurance_status": "Valid" if rng.random() < 0.8 else "Expired",
+            "custom_road_tax_rate": None,
+            "brand": rng.choice(BRAND_OPTIONS) if use_advanced else "Other",
+            "transmission": rng.choice(TRANSMISSION_OPTIONS) if use_advanced else "Manual",
+            "body_condition": rng.choice(CONDITION_OPTIONS) if use_advanced else "Good",
+            "accident_history": rng.choice(ACCIDENT_OPTIONS) if use_advanced else "None",
+            "service_history": rng.choice(SERVICE_OPTIONS) if use_advanced else "Unknown",
+            "commercial_use": use_advanced and rng.random() < 0.1,
+            "new_gen_available": use_advanced and rng.random() < 0.2,
+            "use_advanced": use_advanced,
+            "engine_cc": None,
+            "length_mm": None,
+        })
+    return samples
+
+
+def sample_results(count: int, seed: int = 2024) -> list[dict]:
+    """calculate_car_value results for sample_inputs, used as stage arguments."""
+    return [calculate_car_value(inputs) for inputs in sample_inputs(count, seed)]
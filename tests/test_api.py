@@ -0,0 +1,173 @@
+"""Tests for the headless JSON API."""
+
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api import app, SUMMARY_COALESCER
+from app.metrics import METRICS
+from app.calculators.valuation import calculate_car_value
+from app.data.road_tax import get_state_tax_table
+from app.utils.listings import parse_listing
+
+LISTING = {
+    "ex_showroom": 1500000,
+    "year": 2020,
+    "km": 60000,
+    "fuel_type": "Petrol",
+    "state": "Maharashtra",
+    "owner": "1st Owner",
+    "asking_price": 900000,
+}
+
+
+def raw_request(method: str, path: str, payload: bytes = b"", query: str = ""):
+    """Drive the ASGI app directly; returns (status, body bytes)."""
+    scope = {"type": "http", "method": method, "path": path, "query_string": query.encode()}
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent[0]["status"], sent[1]["body"]
+
+
+def request(method: str, path: str, body=None, query: str = ""):
+    """Send a JSON request; returns (status, decoded JSON body)."""
+    payload = b"" if body is None else json.dumps(body).encode()
+    status, body = raw_request(method, path, payload, query)
+    return status, json.loads(body)
+
+
+class TestValueEndpoints:
+    """Tests for single and batch valuation."""
+
+    def test_value_matches_calculator(self):
+        status, body = request("POST", "/value", LISTING)
+        expected = calculate_car_value(parse_listing(LISTING))
+        assert status == 200
+        assert body["fair_value_data"]["fair_value"] == expected["fair_value_data"]["fair_value"]
+        assert body["verdict_data"]["verdict"] == expected["verdict_data"]["verdict"]
+
+    def test_value_rejects_invalid_listing(self):
+        status, body = request("POST", "/value", {**LISTING, "km": -5})
+        assert status == 400
+        assert body["errors"]
+
+    def test_value_rejects_non_finite_numbers(self):
+        payload = json.dumps({**LISTING, "asking_price": float("nan")}).encode()
+        status, body = raw_request("POST", "/value", payload)
+        assert status == 400
+        assert "NaN" not in body.decode()
+
+    def test_value_rejects_bad_json(self):
+        assert raw_request("POST", "/value", b"{not json")[0] == 400
+
+    def test_batch_preserves_order_and_reports_errors(self):
+        listings = [LISTING, {**LISTING, "ex_showroom": "abc"}, {**LISTING, "year": 2015}]
+        status, body = request("POST", "/value/batch", {"listings": listings})
+        assert status == 200
+        assert body["count"] == 3
+        assert body["valued"] == 2
+        results = body["results"]
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert "errors" in results[1]
+        expected = calculate_car_value(parse_listing(listings[2]))
+        assert results[2]["fair_value"] == expected["fair_value_data"]["fair_value"]
+
+    def test_summary_matches_batch_record(self):
+        status, body = request("POST", "/value/summary", LISTING)
+        _, batch = request("POST", "/value/batch", [LISTING])
+        record = batch["results"][0]
+        del record["index"]
+        assert status == 200
+        assert body == record
+
+    def test_summary_coalesces_concurrent_requests(self):
+        listings = [{**LISTING, "km": 1000 * i} for i in range(20)] + [{**LISTING, "km": -5}]
+        responses = []
+
+        async def one(listing):
+            messages = [{"type": "http.request", "body": json.dumps(listing).encode()}]
+            sent = []
+
+            async def receive():
+                return messages.pop(0)
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "method": "POST", "path": "/value/summary", "query_string": b""}
+            await app(scope, receive, send)
+            responses.append((sent[0]["status"], json.loads(sent[1]["body"])))
+
+        async def all_at_once():
+            await asyncio.gather(*(one(listing) for listing in listings))
+
+        SUMMARY_COALESCER.reset_stats()
+        asyncio.run(all_at_once())
+
+        assert sorted(status for status, _ in responses) == [200] * 20 + [400]
+        assert sorted(body["km"] for status, body in responses if status == 200) == [1000 * i for i in range(20)]
+        stats = SUMMARY_COALESCER.stats()
+        assert stats["items"] == 20
+        assert stats["batches"] == 1
+
+    def test_portfolio(self):
+        listings = [LISTING, {**LISTING, "ex_showroom": "abc"}, {**LISTING, "state": "Delhi", "asking_price": 500000}]
+        status, body = request("POST", "/portfolio", {"listings": listings})
+        assert status == 200
+        assert body["count"] == 2
+        assert body["total_asking_price"] == 1400000.0
+        assert [r["index"] for r in body["rejected"]] == [1]
+        assert sum(body["verdicts"].values()) == 2
+
+    def test_batch_requires_list(self):
+        status, _ = request("POST", "/value/batch", {"listings": "nope"})
+        assert status == 400
+
+
+class TestLookupEndpoints:
+    """Tests for road tax, GST and routing."""
+
+    def test_road_tax_table(self):
+        status, body = request("GET", "/road-tax/Tamil Nadu")
+        assert status == 200
+        assert body == get_state_tax_table("Tamil Nadu")
+
+    def test_road_tax_unknown_state(self):
+        status, _ = request("GET", "/road-tax/Atlantis")
+        assert status == 404
+
+    def test_gst_classify(self):
+        status, body = request("GET", "/gst/classify", query="fuel_type=Petrol&engine_cc=1197&length_mm=3995")
+        assert status == 200
+        assert body["rate"] == pytest.approx(0.18)
+
+    def test_gst_requires_fuel_type(self):
+        status, _ = request("GET", "/gst/classify")
+        assert status == 400
+
+    def test_unknown_route_and_method(self):
+        assert request("GET", "/nope")[0] == 404
+        assert request("GET", "/value")[0] == 405
+
+    def test_metrics_endpoint(self):
+        METRICS.reset()
+        METRICS.enable()
+        try:
+            request("POST", "/value", {**LISTING, "km": 61234})  # not cached yet
+            status, body = raw_request("GET", "/metrics")
+        finally:
+            METRICS.disable()
+        assert status == 200
+        assert 'carworth_stage_duration_seconds_count{stage="on_road_price"} 1' in body.decode()
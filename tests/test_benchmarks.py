@@ -0,0 +1,54 @@
+"""Tests for the benchmark runner."""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.formatters import format_currency_lakhs
+from benchmarks.bench import compare_results, main, run_benchmarks
+
+
+def _results(ops_per_sec: float, p99_us: float) -> dict:
+    return {"benchmarks": {"calculate_car_value": {"ops_per_sec": ops_per_sec, "p99_us": p99_us}}}
+
+
+class TestBenchmarks:
+    """Tests for running and comparing benchmarks."""
+
+    def test_run_produces_metrics(self):
+        results = run_benchmarks(sample_count=20, repeat=1, only=["get_verdict"])
+        assert list(results["benchmarks"]) == ["get_verdict"]
+        metrics = results["benchmarks"]["get_verdict"]
+        assert metrics["calls"] == 20
+        assert metrics["ops_per_sec"] > 0
+        assert metrics["p50_us"] <= metrics["p99_us"]
+
+    def test_batch_benchmark_counts_cars(self):
+        results = run_benchmarks(sample_count=20, repeat=1, only=["value_rows"])
+        metrics = results["benchmarks"]["value_rows"]
+        assert metrics["calls"] == 20
+        assert metrics["ops_per_sec"] > 0
+
+    def test_memoized_formatter_is_timed_cold(self):
+        run_benchmarks(sample_count=20, repeat=2, only=["format_currency_lakhs"])
+        # The memo is cleared before each timed pass, so the last pass misses
+        assert format_currency_lakhs.cache_info().hits < 20
+
+    @pytest.mark.parametrize("ops, p99, regressed", [
+        (950, 10.0, False),   # within threshold
+        (850, 10.0, True),    # throughput dropped 15%
+        (1000, 13.0, True),   # p99 grew 30%
+        (1500, 5.0, False),   # faster
+    ])
+    def test_compare_flags_regressions(self, ops, p99, regressed):
+        rows = compare_results(_results(1000, 10.0), _results(ops, p99), threshold=0.10, latency_threshold=0.25)
+        assert rows[0]["regressed"] is regressed
+
+    def test_missing_baseline_is_a_usage_error(self, tmp_path, capsys):
+        missing = tmp_path / "baseline.json"
+        with pytest.raises(SystemExit) as exc_info:
+            main(["compare", str(missing), str(missing)])
+        assert exc_info.value.code == 2
+        assert f"run -o {missing}" in capsys.readouterr().err
@@ -1,5 +1,8 @@
 """Tests for calculator modules."""
 
+import dataclasses
+import json
+import pickle
 import pytest
 import sys
 from pathlib import Path
@@ -29,6 +32,54 @@ from app.calculators.verdict import (
     calculate_difference_percent,
     get_negotiation_target,
 )
+from app.calculators.valuation import calculate_car_value, cached_car_value, VALUATION_CACHE
+from app.calculators.cache import ValuationCache, make_key
+from app.calculators.results import to_plain
+from app.calculators.batch import value_cars
+from app.calculators.surface import fair_value_surface
+from app.calculators.graph import ValuationGraph, VALUATION_NODES
+from app.metrics import METRICS
+from app.data.constants import (
+    CURRENT_YEAR,
+    MAX_DEPRECIATION,
+    STATES,
+    FUEL_TYPES,
+    OWNER_OPTIONS,
+    BRAND_OPTIONS,
+    TRANSMISSION_OPTIONS,
+    CONDITION_OPTIONS,
+    ACCIDENT_OPTIONS,
+    SERVICE_OPTIONS,
+)
+
+
+def _sample_inputs(count: int) -> list[dict]:
+    """Build deterministic inputs that cycle through every option and price bracket."""
+    prices = [100000, 599999, 600000, 800000, 1000000, 1000001, 1499999, 1800000, 2500000, 4500000]
+    inputs = []
+    for i in range(count):
+        inputs.append({
+            "ex_showroom": prices[i % len(prices)] + (i % 3) * 12345,
+            "year": CURRENT_YEAR - (i % 17),
+            "km": (i * 7919) % 250000,
+            "fuel_type": (FUEL_TYPES + ["LPG"])[i % 6],
+            "state": (STATES + ["Unknown State"])[i % 24],
+            "owner": OWNER_OPTIONS[i % 4],
+            "asking_price": 300000 + (i * 104729) % 3000000,
+            "insurance_status": "Valid" if i % 5 else "Expired",
+            "custom_road_tax_rate": 0.09 if i % 7 == 0 else None,
+            "brand": (BRAND_OPTIONS + ["Unknown Brand"])[i % 26],
+            "transmission": TRANSMISSION_OPTIONS[i % 5],
+            "body_condition": CONDITION_OPTIONS[i % 4],
+            "accident_history": ACCIDENT_OPTIONS[i % 3],
+            "service_history": SERVICE_OPTIONS[i % 3],
+            "commercial_use": i % 11 == 0,
+            "new_gen_available": i % 13 == 0,
+            "use_advanced": i % 2 == 0,
+            "engine_cc": None,
+            "length_mm": None,
+        })
+    return inputs
 
 
 class TestOnRoadPrice:
@@ -69,6 +120,23 @@ class TestOnRoadPrice:
         assert "on_road_price" in result
         assert result["on_road_price"] > result["ex_showroom"]
 
+    @pytest.mark.parametrize("custom_rate", [None, 0.12])
+    def test_numeric_mode_matches_explained(self, custom_rate):
+        kwargs = dict(
+            ex_showroom=1500000, state="Delhi", fuel_type="Diesel",
+            custom_road_tax_rate=custom_rate, engine_cc=1493, length_mm=4300,
+        )
+        full = calculate_on_road_price(**kwargs)
+        numeric = calculate_on_road_price(**kwargs, explain=False)
+
+        assert numeric["on_road_price"] == full["on_road_price"]
+        assert numeric["slab_info"]["rate"] == full["slab_info"]["rate"]
+        assert numeric["gst_info"]["rate"] == full["gst_info"]["rate"]
+        for key in ("rate_percent", "reason"):
+            assert key not in numeric["slab_info"]
+        for key in ("category_name", "rate_percent", "reason"):
+            assert key not in numeric["gst_info"]
+
 
 class TestDepreciation:
     """Tests for depreciation calculations."""
@@ -264,3 +332,298 @@ class TestIntegration:
 
         # Toyota holds value well, should be ~25-27L
         assert 2300000 < fair_value["fair_value"] < 3000000
+
+
+class TestResultRecords:
+    """Tests for the read-only result records."""
+
+    def test_to_dict_keeps_original_key_order(self):
+        on_road = calculate_on_road_price(ex_showroom=1000000, state="Maharashtra", fuel_type="Petrol")
+        assert list(on_road.to_dict()) == [
+            "ex_showroom", "road_tax", "road_tax_rate", "default_road_tax_rate", "is_custom_rate",
+            "slab_info", "insurance", "fixed_charges", "handling_charges", "tcs", "on_road_price",
+            "gst_info", "gst_breakdown",
+        ]
+        depreciation = calculate_total_depreciation(
+            year=2020, fuel_type="Petrol", state="Maharashtra", owner="1st Owner", km=50000
+        )
+        assert list(depreciation.to_dict()) == [
+            "age", "life_years", "life_depreciation", "ownership_premium", "mileage_adjustment",
+            "mileage_status", "basic_total", "basic_capped", "basic_is_capped", "brand_adjustment",
+            "brand_multiplier", "transmission_adjustment", "condition_adjustments",
+            "advanced_adjustments_total", "advanced_total", "advanced_capped", "advanced_is_capped",
+            "total_raw", "total_capped", "is_capped",
+        ]
+        assert list(get_verdict(700000, 600000).to_dict()) == [
+            "verdict", "emoji", "color", "difference_percent", "difference_amount",
+        ]
+
+    def test_depreciation_legacy_fields(self):
+        depreciation = calculate_total_depreciation(
+            year=CURRENT_YEAR - 14, fuel_type="Diesel", state="Delhi", owner="4th+ Owner", km=240000,
+            body_condition="Poor", accident_history="Major",
+        )
+        assert depreciation["total_raw"] == depreciation.advanced_total
+        assert depreciation["total_capped"] == depreciation.advanced_capped == MAX_DEPRECIATION
+        assert depreciation["is_capped"] is True
+        assert depreciation.to_dict()["is_capped"] is True
+
+    def test_fair_value_legacy_base_fair_value(self):
+        basic = calculate_complete_fair_value(1000000, 0.3, 0.4, True, 800000, use_advanced=False)
+        advanced = calculate_complete_fair_value(1000000, 0.3, 0.4, True, 800000, use_advanced=True)
+        assert basic["base_fair_value"] == basic.basic_fair_value
+        assert advanced["base_fair_value"] == advanced.advanced_fair_value != basic.basic_fair_value
+        assert "base_fair_value" in advanced.keys()
+
+    def test_records_are_read_only(self):
+        on_road = calculate_on_road_price(ex_showroom=1000000, state="Maharashtra", fuel_type="Petrol")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            on_road.on_road_price = 0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            del on_road.tcs
+        for name in ("slab_info", "gst_info", "gst_breakdown"):
+            with pytest.raises(TypeError):
+                on_road[name]["rate"] = 0
+        depreciation = calculate_total_depreciation(
+            year=2020, fuel_type="Petrol", state="Maharashtra", owner="1st Owner", km=50000
+        )
+        with pytest.raises(TypeError):
+            depreciation["condition_adjustments"]["total"] = 0
+
+    def test_to_dict_returns_plain_dicts(self):
+        on_road = calculate_on_road_price(ex_showroom=1000000, state="Maharashtra", fuel_type="Petrol")
+        data = on_road.to_dict()
+        assert type(data["slab_info"]) is dict
+        data["slab_info"]["rate"] = 0
+        assert on_road.slab_info["rate"] == 0.11
+
+    def test_to_plain_serializes_records(self):
+        result = calculate_car_value(_sample_inputs(1)[0])
+        decoded = json.loads(json.dumps(result, default=to_plain))
+        assert decoded["on_road_data"] == json.loads(json.dumps(result["on_road_data"].to_dict()))
+        assert decoded["depreciation_data"]["total_capped"] == result["depreciation_data"].total_capped
+        assert json.loads(json.dumps(result["on_road_data"].slab_info, default=to_plain)) == dict(
+            result["on_road_data"].slab_info
+        )
+        with pytest.raises(TypeError):
+            to_plain(object())
+
+    def test_copies_stay_read_only(self):
+        verdict = get_verdict(700000, 600000)
+        on_road = calculate_on_road_price(ex_showroom=1000000, state="Maharashtra", fuel_type="Petrol")
+        for record in (verdict, on_road):
+            restored = pickle.loads(pickle.dumps(record))
+            assert restored == record
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                setattr(restored, dataclasses.fields(restored)[0].name, 0)
+        replaced = dataclasses.replace(verdict, color="red")
+        assert replaced.color == "red" and verdict.color != "red"
+        assert make_key({"on_road": on_road}) == make_key({"on_road": on_road.to_dict()})
+
+
+class TestBatchValuation:
+    """Tests for the vectorized batch valuation engine."""
+
+    def test_matches_scalar_pipeline_exactly(self):
+        inputs = _sample_inputs(600)
+        columns = {key: [row[key] for row in inputs] for key in inputs[0]}
+        batch = value_cars(columns)
+
+        for i, row in enumerate(inputs):
+            result = calculate_car_value(row)
+            on_road = result["on_road_data"]
+            depreciation = result["depreciation_data"]
+            fair_value = result["fair_value_data"]
+
+            assert batch["on_road_price"][i] == on_road["on_road_price"]
+            assert batch["road_tax_rate"][i] == on_road["road_tax_rate"]
+            assert batch["basic_capped"][i] == depreciation["basic_capped"]
+            assert batch["advanced_capped"][i] == depreciation["advanced_capped"]
+            assert batch["mileage_status"][i] == depreciation["mileage_status"]
+            assert batch["basic_min"][i] == fair_value["basic_min"]
+            assert batch["advanced_max"][i] == fair_value["advanced_max"]
+            assert batch["fair_value"][i] == fair_value["fair_value"]
+            assert batch["insurance_deduction"][i] == fair_value["insurance_deduction"]
+            assert batch["verdict"][i] == result["verdict_data"]["verdict"]
+            assert batch["difference_percent"][i] == result["verdict_data"]["difference_percent"]
+            assert batch["negotiation_target"][i] == result["negotiation_target"]
+
+    def test_optional_columns_use_defaults(self):
+        columns = {
+            "ex_showroom": [1500000],
+            "year": [2020],
+            "km": [60000],
+            "fuel_type": ["Petrol"],
+            "state": ["Maharashtra"],
+            "owner": ["1st Owner"],
+            "asking_price": [900000],
+            "insurance_status": ["Valid"],
+        }
+        batch = value_cars(columns)
+
+        assert batch["brand_multiplier"][0] == 1.0
+        assert batch["transmission_adjustment"][0] == 0.0
+        assert not batch["is_custom_rate"][0]
+        assert not batch["using_advanced"][0]
+
+    def test_missing_required_column(self):
+        with pytest.raises(KeyError):
+            value_cars({"ex_showroom": [1500000]})
+
+
+class TestFairValueSurface:
+    """Tests for the year x km fair value surface."""
+
+    def test_every_cell_matches_scalar_pipeline(self):
+        years = [CURRENT_YEAR - age for age in range(0, 17, 2)]
+        km_grid = [0, 15000, 45000, 90000, 200000]
+        for base in _sample_inputs(60):
+            surface = fair_value_surface(base, years, km_grid)
+            assert surface["fair_value"].shape == (len(years), len(km_grid))
+            result = calculate_car_value(base)
+            assert surface["on_road_price"] == result["on_road_data"]["on_road_price"]
+            assert surface["insurance_deduction"] == result["fair_value_data"]["insurance_deduction"]
+            for i, year in enumerate(years):
+                for j, km in enumerate(km_grid):
+                    expected = calculate_car_value({**base, "year": year, "km": km})["fair_value_data"]
+                    assert surface["basic_adjusted"][i, j] == expected["basic_adjusted"]
+                    assert surface["advanced_adjusted"][i, j] == expected["advanced_adjusted"]
+                    assert surface["fair_value"][i, j] == expected["fair_value"]
+
+    def test_value_falls_with_age_and_km(self):
+        base = _sample_inputs(1)[0]
+        surface = fair_value_surface(base, [CURRENT_YEAR, CURRENT_YEAR - 5], [10000, 150000])
+        basic = surface["basic_adjusted"]
+        assert basic[0, 0] > basic[1, 0]
+        assert basic[1, 0] > basic[1, 1]
+
+
+class _RecordingDict(dict):
+    """Dict that records which keys were read."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.read = set()
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.read.add(key)
+        return super().get(key, default)
+
+
+class TestValuationGraph:
+    """Tests for the incremental valuation graph."""
+
+    def test_matches_full_pipeline_across_edits(self):
+        graph = ValuationGraph()
+        samples = _sample_inputs(40)
+        inputs = samples[0]
+        for i, other in enumerate(samples[1:], start=1):
+            # Edit a rotating subset of fields, as a user would between reruns
+            fields = list(other)[i % 7::5]
+            inputs = {**inputs, **{field: other[field] for field in fields}}
+            result = graph.evaluate(inputs)
+            expected = calculate_car_value(inputs)
+            for key in ("on_road_data", "depreciation_data", "fair_value_data", "verdict_data"):
+                assert result[key].to_dict() == expected[key].to_dict()
+            assert result["negotiation_target"] == expected["negotiation_target"]
+            assert result["warnings"] == expected["warnings"]
+
+    def test_only_invalidated_nodes_rerun(self):
+        graph = ValuationGraph(cache=None)
+        inputs = _sample_inputs(1)[0]
+        graph.evaluate(inputs)
+        assert graph.recomputed == list(VALUATION_NODES)
+
+        graph.evaluate(dict(inputs))
+        assert graph.recomputed == []
+
+        graph.evaluate({**inputs, "asking_price": inputs["asking_price"] + 1})
+        assert graph.recomputed == ["verdict"]
+
+        flipped = "Valid" if inputs["insurance_status"] == "Expired" else "Expired"
+        graph.evaluate({**inputs, "insurance_status": flipped})
+        assert graph.recomputed == ["fair_value", "verdict"]
+
+        graph.evaluate({**inputs, "insurance_status": flipped, "km": inputs["km"] + 1})
+        assert graph.recomputed == ["depreciation", "fair_value", "verdict", "warnings"]
+
+    def test_full_miss_reuses_shared_cache(self):
+        inputs = _sample_inputs(1)[0]
+        VALUATION_CACHE.clear()
+        first = ValuationGraph().evaluate(inputs)
+
+        other_session = ValuationGraph()
+        assert other_session.evaluate(dict(inputs)) is first
+        assert other_session.recomputed == []
+        assert cached_car_value(inputs) is first
+
+        # The cached result seeds the graph, so an edit reruns only its nodes
+        other_session.evaluate({**inputs, "asking_price": inputs["asking_price"] + 1})
+        assert other_session.recomputed == ["verdict"]
+
+    def test_records_stage_timings(self):
+        METRICS.reset()
+        METRICS.enable()
+        try:
+            graph = ValuationGraph(cache=None)
+            inputs = _sample_inputs(1)[0]
+            graph.evaluate(inputs)
+            graph.evaluate({**inputs, "asking_price": inputs["asking_price"] + 1})
+            counts = {stage: h["count"] for stage, h in METRICS.snapshot().items()}
+        finally:
+            METRICS.disable()
+            METRICS.reset()
+        assert counts == {
+            "on_road_price": 1, "depreciation": 1, "fair_value": 1,
+            "verdict": 2, "warnings": 1, "valuation": 2,
+        }
+
+    def test_nodes_declare_every_field_they_read(self):
+        inputs = _sample_inputs(1)[0]
+        upstream = {}
+        for name, node in VALUATION_NODES.items():
+            recording = _RecordingDict(inputs)
+            upstream[name] = node.compute(recording, *(upstream[d] for d in node.deps))
+            assert recording.read <= set(node.fields), name
+
+
+class TestValuationCache:
+    """Tests for the LRU valuation cache."""
+
+    def test_key_is_canonical(self):
+        a = {"year": 2020, "ex_showroom": 1500000, "use_advanced": True}
+        b = {"use_advanced": True, "ex_showroom": 1500000.0, "year": 2020}
+        assert make_key(a) == make_key(b)
+        assert make_key({**a, "use_advanced": 1}) != make_key(a)
+
+    def test_lru_eviction_and_counters(self):
+        cache = ValuationCache(maxsize=2, ttl=None)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (1, 1, 1, 2)
+
+    def test_ttl_expiry(self):
+        now = [0.0]
+        cache = ValuationCache(maxsize=4, ttl=10.0, clock=lambda: now[0])
+        cache.put("a", 1)
+        now[0] = 9.9
+        assert cache.get("a") == 1
+        now[0] = 10.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_cached_car_value_reuses_result(self):
+        inputs = _sample_inputs(1)[0]
+        VALUATION_CACHE.clear()
+        first = cached_car_value(inputs)
+        second = cached_car_value(dict(reversed(list(inputs.items()))))
+        assert second is first
+        assert first["fair_value_data"] == calculate_car_value(inputs)["fair_value_data"]
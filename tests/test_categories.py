@@ -0,0 +1,90 @@
+"""Tests for the integer-encoded categorical inputs."""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.data.categories import (
+    CATEGORIES,
+    OWNER,
+    BRAND,
+    TRANSMISSION,
+    BODY_CONDITION,
+    ACCIDENT_HISTORY,
+    SERVICE_HISTORY,
+    OWNERSHIP_PREMIUM_TABLE,
+    BRAND_MULTIPLIER_TABLE,
+    TRANSMISSION_ADJUSTMENT_TABLE,
+    BODY_CONDITION_TABLE,
+    ACCIDENT_HISTORY_TABLE,
+    SERVICE_HISTORY_TABLE,
+    STATE,
+    encode_columns,
+)
+from app.data.brands import get_brand_multiplier
+from app.calculators.batch import value_cars
+from app.calculators.depreciation import (
+    get_owner_number,
+    calculate_ownership_premium,
+    calculate_transmission_adjustment,
+    calculate_condition_adjustment,
+)
+
+
+class TestCategory:
+    """Tests for label encoding."""
+
+    def test_encode_round_trip(self):
+        labels = ["Goa", "Delhi", "Atlantis", "Goa"]
+        codes = STATE.encode(labels)
+        assert codes.dtype == np.int8
+        assert codes[2] == -1
+        assert STATE.decode(codes).tolist() == ["Goa", "Delhi", None, "Goa"]
+
+    def test_integer_codes_pass_through(self):
+        codes = np.array([0, 3, -1])
+        assert STATE.encode(codes).tolist() == [0, 3, -1]
+
+    def test_encode_columns_leaves_numeric_columns(self):
+        columns = {"state": ["Delhi"], "brand": ["Kia"], "km": [1000]}
+        encoded = encode_columns(columns)
+        assert encoded["km"] == [1000]
+        assert encoded["brand"].tolist() == [BRAND.code("Kia")]
+        assert set(CATEGORIES) >= {"state", "fuel_type", "owner", "insurance_status"}
+
+
+class TestLookupTables:
+    """The dense tables must agree with the scalar calculators, fallback included."""
+
+    @pytest.mark.parametrize("category, table, scalar", [
+        (OWNER, OWNERSHIP_PREMIUM_TABLE, lambda v: calculate_ownership_premium(get_owner_number(v))),
+        (BRAND, BRAND_MULTIPLIER_TABLE, get_brand_multiplier),
+        (TRANSMISSION, TRANSMISSION_ADJUSTMENT_TABLE, calculate_transmission_adjustment),
+        (BODY_CONDITION, BODY_CONDITION_TABLE, lambda v: calculate_condition_adjustment(v, "None", "Partial")["body"]),
+        (ACCIDENT_HISTORY, ACCIDENT_HISTORY_TABLE, lambda v: calculate_condition_adjustment("Good", v, "Partial")["accident"]),
+        (SERVICE_HISTORY, SERVICE_HISTORY_TABLE, lambda v: calculate_condition_adjustment("Good", "None", v)["service"]),
+    ])
+    def test_table_matches_scalar(self, category, table, scalar):
+        labels = [*category.labels, "Unknown label"]
+        assert table[category.encode(labels)].tolist() == [scalar(label) for label in labels]
+
+    def test_value_cars_accepts_codes(self):
+        columns = {
+            "ex_showroom": [1500000, 800000],
+            "year": [2020, 2018],
+            "km": [40000, 90000],
+            "fuel_type": ["Diesel", "Petrol"],
+            "state": ["Delhi", "Kerala"],
+            "owner": ["1st Owner", "3rd Owner"],
+            "asking_price": [900000, 350000],
+            "insurance_status": ["Valid", "Expired"],
+            "brand": ["Toyota", "Atlantis Motors"],
+        }
+        by_label = value_cars(columns)
+        by_code = value_cars(encode_columns(columns))
+        for name in ("on_road_price", "advanced_capped", "fair_value"):
+            assert by_code[name].tolist() == by_label[name].tolist()
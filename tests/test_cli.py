@@ -0,0 +1,165 @@
+"""Tests for the bulk valuation CLI and listing parsing."""
+
+import json
+import re
+import zipfile
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.cli import main
+from app.calculators.valuation import calculate_car_value
+from app.utils.listings import ListingError, parse_listing
+
+CSV_LISTINGS = """ex_showroom,year,km,fuel_type,state,owner,asking_price,insurance_status,brand
+1500000,2020,60000,Petrol,Maharashtra,1st Owner,900000,Valid,Honda
+"8,00,000",2018,90000,Diesel,Delhi,2nd Owner,400000,Expired,
+abc,2018,90000,Diesel,Delhi,2nd Owner,400000,Expired,
+1500000,2020,-5,Petrol,Maharashtra,1st Owner,900000,Valid,
+"""
+
+
+def _page_count(pdf_bytes: bytes) -> int:
+    return len(re.findall(rb"/Type\s*/Page\b(?!s)", pdf_bytes))
+
+
+class TestParseListing:
+    """Tests for listing parsing and coercion."""
+
+    def test_parses_csv_strings(self):
+        listing = parse_listing({
+            "ex_showroom": "15,00,000",
+            "year": "2020",
+            "km": "45000.0",
+            "fuel_type": "Petrol",
+            "state": "Delhi",
+            "owner": "1st Owner",
+            "asking_price": "900000",
+            "commercial_use": "yes",
+        })
+        assert listing["ex_showroom"] == 1500000.0
+        assert listing["km"] == 45000
+        assert listing["commercial_use"] is True
+        assert listing["insurance_status"] == "Valid"
+        assert listing["use_advanced"] is True  # derived from commercial_use
+
+    def test_reports_every_bad_field(self):
+        with pytest.raises(ListingError) as exc_info:
+            parse_listing({"ex_showroom": "abc", "year": "2020"})
+        assert len(exc_info.value.errors) >= 2
+
+    @pytest.mark.parametrize("value", ["nan", "inf", "-Infinity", float("nan"), float("inf")])
+    def test_rejects_non_finite_numbers(self, value):
+        raw = {
+            "ex_showroom": 1500000, "year": 2020, "km": 60000, "fuel_type": "Petrol",
+            "state": "Delhi", "owner": "1st Owner", "asking_price": value,
+        }
+        with pytest.raises(ListingError) as exc_info:
+            parse_listing(raw)
+        assert any("asking_price" in error for error in exc_info.value.errors)
+
+
+class TestValueCommand:
+    """Tests for ``python -m app.cli value``."""
+
+    def test_values_csv_and_reports_errors(self, tmp_path, capsys):
+        source = tmp_path / "listings.csv"
+        source.write_text(CSV_LISTINGS)
+        output = tmp_path / "results.jsonl"
+        errors = tmp_path / "errors.jsonl"
+
+        assert main(["value", str(source), "-o", str(output), "--errors", str(errors), "--chunk-size", "1"]) == 0
+
+        results = [json.loads(line) for line in output.read_text().splitlines()]
+        rejected = [json.loads(line) for line in errors.read_text().splitlines()]
+        assert [r["line"] for r in results] == [2, 3]
+        assert [r["line"] for r in rejected] == [4, 5]
+        assert "Valued 2 listings (2 rejected)" in capsys.readouterr().err
+
+        expected = calculate_car_value(parse_listing({
+            "ex_showroom": "1500000", "year": "2020", "km": "60000", "fuel_type": "Petrol",
+            "state": "Maharashtra", "owner": "1st Owner", "asking_price": "900000", "brand": "Honda",
+        }))
+        assert results[0]["fair_value"] == expected["fair_value_data"]["fair_value"]
+        assert results[0]["verdict"] == expected["verdict_data"]["verdict"]
+
+    def test_workers_match_single_process(self, tmp_path):
+        source = tmp_path / "listings.csv"
+        source.write_text(CSV_LISTINGS * 5)
+        serial = tmp_path / "serial.jsonl"
+        parallel = tmp_path / "parallel.jsonl"
+        serial_errors = tmp_path / "serial_errors.jsonl"
+        parallel_errors = tmp_path / "parallel_errors.jsonl"
+
+        main(["value", str(source), "-o", str(serial), "--errors", str(serial_errors), "-w", "1", "-q"])
+        main(["value", str(source), "-o", str(parallel), "--errors", str(parallel_errors),
+              "-w", "2", "--chunk-size", "3", "-q"])
+
+        assert parallel.read_text() == serial.read_text()
+        assert parallel_errors.read_text() == serial_errors.read_text()
+
+
+class TestReportCommand:
+    """Tests for ``python -m app.cli report``."""
+
+    def test_zip_has_one_pdf_per_valid_listing(self, tmp_path):
+        source = tmp_path / "listings.csv"
+        source.write_text(CSV_LISTINGS)
+        output = tmp_path / "reports.zip"
+        errors = tmp_path / "errors.jsonl"
+
+        assert main(["report", str(source), "-o", str(output), "--errors", str(errors), "-w", "2", "--chunk-size", "1", "-q"]) == 0
+
+        with zipfile.ZipFile(output) as archive:
+            names = archive.namelist()
+            assert names == ["carworth_report_2_2020_petrol.pdf", "carworth_report_3_2018_diesel.pdf"]
+            assert all(archive.read(name).startswith(b"%PDF") for name in names)
+        assert len(errors.read_text().splitlines()) == 2
+
+    def test_member_names_cannot_escape_archive(self, tmp_path):
+        source = tmp_path / "listings.jsonl"
+        listing = {
+            "ex_showroom": 1500000, "year": 2020, "km": 60000, "fuel_type": "../../../tmp/evil",
+            "state": "Delhi", "owner": "1st Owner", "asking_price": 900000, "insurance_status": "Valid",
+        }
+        source.write_text(json.dumps(listing) + "\n")
+        output = tmp_path / "reports.zip"
+
+        assert main(["report", str(source), "-o", str(output), "-w", "1", "-q"]) == 0
+
+        with zipfile.ZipFile(output) as archive:
+            assert archive.namelist() == ["carworth_report_1_2020_tmp-evil.pdf"]
+
+    def test_single_pdf_contains_every_report(self, tmp_path):
+        source = tmp_path / "listings.csv"
+        source.write_text(CSV_LISTINGS)
+        combined = tmp_path / "reports.pdf"
+        archive_path = tmp_path / "reports.zip"
+
+        assert main(["report", str(source), "-o", str(combined), "--errors", str(tmp_path / "e1.jsonl"), "-q"]) == 0
+        assert main(["report", str(source), "-o", str(archive_path), "--errors", str(tmp_path / "e2.jsonl"), "-w", "1", "-q"]) == 0
+
+        with zipfile.ZipFile(archive_path) as archive:
+            separate_pages = sum(_page_count(archive.read(name)) for name in archive.namelist())
+        assert combined.read_bytes().startswith(b"%PDF")
+        assert _page_count(combined.read_bytes()) == separate_pages
+
+
+class TestPortfolioCommand:
+    """Tests for ``python -m app.cli portfolio``."""
+
+    def test_summarizes_csv(self, tmp_path, capsys):
+        source = tmp_path / "listings.csv"
+        source.write_text(CSV_LISTINGS)
+        output = tmp_path / "summary.json"
+
+        assert main(["portfolio", str(source), "-o", str(output), "--errors", str(tmp_path / "errors.jsonl")]) == 0
+
+        summary = json.loads(output.read_text())
+        assert summary["count"] == 2
+        assert summary["rejected"] == 2
+        assert summary["total_asking_price"] == 1300000.0
+        assert {row["state"] for row in summary["by_state"]} == {"Maharashtra", "Delhi"}
+        assert "Summarized 2 listings (2 rejected)" in capsys.readouterr().err
@@ -0,0 +1,91 @@
+"""Tests for the asyncio micro-batching coalescer."""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.coalescer import Coalescer
+
+
+class Recorder:
+    """Batch function that doubles items and remembers each batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, items):
+        self.batches.append(list(items))
+        return [item * 2 for item in items]
+
+
+def run_concurrently(coalescer, items):
+    async def main():
+        return await asyncio.gather(*(coalescer.submit(item) for item in items))
+    return asyncio.run(main())
+
+
+class TestCoalescer:
+    """Tests for batching, result routing and statistics."""
+
+    def test_concurrent_submits_share_one_batch(self):
+        batch_fn = Recorder()
+        coalescer = Coalescer(batch_fn, max_batch=100, max_wait=0.01)
+
+        assert run_concurrently(coalescer, range(10)) == [i * 2 for i in range(10)]
+        assert batch_fn.batches == [list(range(10))]
+
+    def test_max_batch_flushes_immediately(self):
+        batch_fn = Recorder()
+        coalescer = Coalescer(batch_fn, max_batch=4, max_wait=0.01)
+
+        assert run_concurrently(coalescer, range(10)) == [i * 2 for i in range(10)]
+        assert batch_fn.batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert coalescer.stats()["full_batches"] == 2
+
+    def test_sequential_submits_are_separate_batches(self):
+        batch_fn = Recorder()
+        coalescer = Coalescer(batch_fn, max_batch=100, max_wait=0.001)
+
+        async def main():
+            return [await coalescer.submit(item) for item in range(3)]
+
+        assert asyncio.run(main()) == [0, 2, 4]
+        assert batch_fn.batches == [[0], [1], [2]]
+
+    def test_errors_reach_every_caller_in_the_batch(self):
+        def fail(items):
+            raise ValueError("boom")
+
+        coalescer = Coalescer(fail, max_batch=100, max_wait=0.001)
+
+        async def main():
+            return await asyncio.gather(*(coalescer.submit(i) for i in range(3)), return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_works_across_event_loops(self):
+        coalescer = Coalescer(Recorder(), max_batch=100, max_wait=0.001)
+        assert run_concurrently(coalescer, [1]) == [2]
+        assert run_concurrently(coalescer, [2]) == [4]
+
+    def test_stats(self):
+        coalescer = Coalescer(Recorder(), max_batch=4, max_wait=0.001)
+        run_concurrently(coalescer, range(6))
+
+        stats = coalescer.stats()
+        assert stats["batches"] == 2
+        assert stats["items"] == 6
+        assert stats["mean_batch_size"] == 3.0
+        assert stats["max_batch_size"] == 4
+        assert 0 <= stats["queue_wait_p50"] <= stats["queue_wait_p99"]
+
+        coalescer.reset_stats()
+        assert coalescer.stats()["batches"] == 0
+
+    def test_rejects_empty_batches(self):
+        with pytest.raises(ValueError):
+            Coalescer(Recorder(), max_batch=0)
@@ -0,0 +1,93 @@
+"""Tests for Parquet/Arrow bulk input and output."""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.ipc  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+from app.cli import OUTPUT_FIELDS, main  # noqa: E402
+from app.utils.columnar import (  # noqa: E402
+    COLUMN_TYPES,
+    ColumnarWriter,
+    read_columnar_listings,
+    result_schema,
+)
+from benchmarks.workloads import sample_inputs  # noqa: E402
+
+
+@pytest.fixture
+def listings_parquet(tmp_path):
+    rows = sample_inputs(250)
+    rows[3] = {**rows[3], "km": -5}  # rejected
+    path = tmp_path / "listings.parquet"
+    pq.write_table(pa.Table.from_pylist(rows), path, row_group_size=100)
+    return path, rows
+
+
+class TestColumnarSchema:
+    """Tests for the flat result schema."""
+
+    def test_covers_every_output_field(self):
+        assert set(OUTPUT_FIELDS) <= set(COLUMN_TYPES)
+
+    def test_categoricals_are_dictionary_encoded(self):
+        schema = result_schema(OUTPUT_FIELDS)
+        for name in ("state", "fuel_type", "brand", "verdict"):
+            assert pa.types.is_dictionary(schema.field(name).type)
+        assert schema.field("fair_value").type == pa.float64()
+        assert schema.field("use_advanced").type == pa.bool_()
+
+
+class TestColumnarIO:
+    """Round trips through the CLI and the writer."""
+
+    def test_parquet_matches_jsonl_output(self, tmp_path, listings_parquet):
+        source, _ = listings_parquet
+        parquet_out = tmp_path / "results.parquet"
+        jsonl_out = tmp_path / "results.jsonl"
+
+        assert main(["value", str(source), "-o", str(parquet_out), "-w", "1", "--chunk-size", "64", "-q",
+                     "--errors", str(tmp_path / "errors.jsonl"), "--compression", "zstd"]) == 0
+        assert main(["value", str(source), "-o", str(jsonl_out), "-w", "1", "-q",
+                     "--errors", str(tmp_path / "errors.jsonl")]) == 0
+
+        table = pq.read_table(parquet_out)
+        expected = [json.loads(line) for line in jsonl_out.read_text().splitlines()]
+        assert table.num_rows == len(expected) == 249
+        assert pq.ParquetFile(parquet_out).metadata.num_row_groups == 4
+        assert table.column("line").to_pylist() == [r["line"] for r in expected]
+        assert table.column("fair_value").to_pylist() == [r["fair_value"] for r in expected]
+        assert table.column("verdict").to_pylist() == [r["verdict"] for r in expected]
+
+    def test_arrow_round_trip(self, tmp_path, listings_parquet):
+        source, _ = listings_parquet
+        arrow_out = tmp_path / "results.arrow"
+        assert main(["value", str(source), "-o", str(arrow_out), "-w", "1", "--chunk-size", "50", "-q",
+                     "--errors", str(tmp_path / "errors.jsonl")]) == 0
+
+        table = pa.ipc.open_file(arrow_out).read_all()
+        assert table.num_rows == 249
+        # Results can be fed back in as listings
+        assert sum(1 for _ in read_columnar_listings(str(arrow_out), "arrow")) == 249
+
+    def test_reads_rows_in_order(self, listings_parquet):
+        source, rows = listings_parquet
+        read = list(read_columnar_listings(str(source), "parquet", batch_size=33))
+        assert [number for number, _ in read] == list(range(1, len(rows) + 1))
+        assert read[10][1]["state"] == rows[10]["state"]
+
+    def test_unknown_labels_extend_the_dictionary(self, tmp_path):
+        path = tmp_path / "brands.arrow"
+        with ColumnarWriter(str(path), "arrow", ["line", "brand"], row_group_size=1) as writer:
+            writer.write_many([{"line": 1, "brand": "Honda"}, {"line": 2, "brand": "Trabant"}, {"line": 3, "brand": None}])
+        assert pa.ipc.open_file(path).read_all().column("brand").to_pylist() == ["Honda", "Trabant", None]
+
+    def test_rejects_unsupported_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            ColumnarWriter(str(tmp_path / "x.arrow"), "arrow", ["line"], compression="snappy")
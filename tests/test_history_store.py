@@ -0,0 +1,224 @@
+"""Tests for the durable valuation history store."""
+
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.history_store import (
+    HistoryFilter,
+    HistoryStore,
+    HistoryWriter,
+    SQLiteHistoryStore,
+    FileHistoryStore,
+    open_history_store,
+)
+
+NOW = 1_750_000_000.0
+
+
+def make_entry(i: int, session_id: str = "a", **overrides) -> dict:
+    entry = {
+        "session_id": session_id,
+        "created_at": NOW - i * 3600,  # one hour apart, i = 0 newest
+        "year": 2018 + i % 5,
+        "fuel_type": ["Petrol", "Diesel"][i % 2],
+        "state": ["Delhi", "Maharashtra", "Karnataka"][i % 3],
+        "ex_showroom": 1000000.0,
+        "asking_price": 700000.0,
+        "km": 10000 * i,
+        "fair_value": 650000.0,
+        "verdict": ["Fair Price", "Overpriced"][i % 2],
+    }
+    entry.update(overrides)
+    return entry
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def store(request, tmp_path):
+    store = open_history_store(request.param, tmp_path)
+    yield store
+    store.close()
+
+
+class TestHistoryStore:
+    """Tests shared by both backends."""
+
+    def test_query_newest_first_and_paginated(self, store):
+        store.add_many([make_entry(i) for i in range(25)])
+
+        first = store.query(HistoryFilter(session_id="a"), limit=10)
+        third = store.query(HistoryFilter(session_id="a"), limit=10, offset=20)
+
+        assert [e["km"] for e in first] == [10000 * i for i in range(10)]
+        assert [e["km"] for e in third] == [10000 * i for i in range(20, 25)]
+        assert store.count(HistoryFilter(session_id="a")) == 25
+
+    def test_round_trips_fields(self, store):
+        entry = make_entry(3)
+        store.add_many([entry])
+        stored = store.query()[0]
+        assert {name: stored[name] for name in entry} == entry
+
+    def test_filters(self, store):
+        entries = [make_entry(i) for i in range(30)] + [make_entry(i, session_id="b") for i in range(5)]
+        store.add_many(entries)
+
+        filters = HistoryFilter(session_id="a", state="Delhi", fuel_type="Diesel", verdict="Overpriced")
+        expected = [
+            e for e in entries
+            if e["session_id"] == "a" and e["state"] == "Delhi" and e["fuel_type"] == "Diesel"
+            and e["verdict"] == "Overpriced"
+        ]
+        assert store.count(filters) == len(expected) == 5
+        assert [e["km"] for e in store.query(filters, limit=100)] == [e["km"] for e in expected]
+
+        last_day = HistoryFilter(session_id="a", since=NOW - 10 * 3600 + 1, until=NOW)
+        assert [e["km"] for e in store.query(last_day)] == [10000 * i for i in range(1, 10)]
+        assert store.count(HistoryFilter(session_id="b")) == 5
+
+    def test_delete(self, store):
+        store.add_many([make_entry(i) for i in range(4)] + [make_entry(0, session_id="b")])
+        assert store.delete(HistoryFilter(session_id="a")) == 4
+        assert store.count() == 1
+
+    def test_prune_by_age(self, store):
+        store.retention_days = 1
+        store.add_many([make_entry(i * 12) for i in range(5)])  # 0, 12, 24, 36, 48 hours old
+
+        assert store.prune(now=NOW) == 2
+        assert [e["km"] for e in store.query()] == [0, 120000, 240000]
+
+    def test_prune_per_session(self, store):
+        store.max_per_session = 3
+        store.add_many([make_entry(i) for i in range(5)] + [make_entry(i, session_id="b") for i in range(2)])
+
+        assert store.prune(now=NOW) == 2
+        assert [e["km"] for e in store.query(HistoryFilter(session_id="a"))] == [0, 10000, 20000]
+        assert store.count(HistoryFilter(session_id="b")) == 2
+
+    def test_survives_reopen(self, store):
+        store.add_many([make_entry(i) for i in range(3)])
+        store.close()
+        reopened = type(store)(store.path)
+        reopened.add_many([make_entry(3)])
+        assert reopened.count() == 4
+        assert len({e["id"] for e in reopened.query()}) == 4
+        reopened.close()
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            open_history_store("redis", tmp_path)
+
+
+class TestHistoryStoreInterface:
+    """Tests for the abstract backend interface."""
+
+    def test_backend_must_implement_every_method(self):
+        class PartialStore(HistoryStore):
+            def add_many(self, entries):
+                pass
+
+        with pytest.raises(TypeError, match="query"):
+            PartialStore()
+        with pytest.raises(TypeError):
+            HistoryStore()
+
+
+class TestSQLiteHistoryStore:
+    """SQLite specifics."""
+
+    def test_wal_mode(self, tmp_path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        mode = store._read_conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        store.close()
+
+    @pytest.mark.parametrize("column", ["state", "fuel_type", "verdict"])
+    def test_filtered_page_uses_index(self, tmp_path, column):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        plan = store._read_conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM valuation_history WHERE session_id = ? AND {column} = ?"
+            " ORDER BY created_at DESC, id DESC LIMIT 10",
+            ("a", "x"),
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "USING INDEX" in detail
+        store.close()
+
+    def test_reads_from_other_threads(self, tmp_path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        store.add_many([make_entry(i) for i in range(3)])
+        counts = []
+        thread = threading.Thread(target=lambda: counts.append(store.count()))
+        thread.start()
+        thread.join()
+        assert counts == [3]
+        store.close()
+
+    def test_short_lived_threads_share_connections(self, tmp_path):
+        # Streamlit runs every rerun on a new thread
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        store.add_many([make_entry(i) for i in range(3)])
+        counts = []
+
+        def rerun():
+            counts.append(store.count(HistoryFilter(session_id="a")))
+            store.query(HistoryFilter(session_id="a"))
+
+        for _ in range(10):
+            threads = [threading.Thread(target=rerun) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert counts == [3] * 200
+        assert len(store._connections) == 2
+        store.close()
+
+
+class TestHistoryWriter:
+    """Tests for batched background writes."""
+
+    def test_wait_sees_own_writes(self, tmp_path):
+        writer = HistoryWriter(FileHistoryStore(tmp_path / "history.jsonl"), batch_size=100, flush_interval=60)
+        seq = writer.submit(make_entry(0))
+        assert writer.wait(seq, timeout=5)
+        assert writer.store.count() == 1
+        writer.close()
+
+    def test_batches_writes(self, tmp_path):
+        class CountingStore(FileHistoryStore):
+            batches = []
+
+            def add_many(self, entries):
+                self.batches.append(len(entries))
+                super().add_many(entries)
+
+        store = CountingStore(tmp_path / "history.jsonl")
+        writer = HistoryWriter(store, batch_size=10, flush_interval=60)
+        for i in range(10):
+            writer.submit(make_entry(i))
+        assert writer.wait(timeout=5)
+        assert store.batches == [10]
+        writer.close()
+
+    def test_close_flushes_queue(self, tmp_path):
+        writer = HistoryWriter(FileHistoryStore(tmp_path / "history.jsonl"), batch_size=100, flush_interval=60)
+        for i in range(5):
+            writer.submit(make_entry(i))
+        writer.close()
+        assert FileHistoryStore(tmp_path / "history.jsonl").count() == 5
+        with pytest.raises(RuntimeError):
+            writer.submit(make_entry(0))
+
+    def test_prunes_after_writes(self, tmp_path):
+        store = FileHistoryStore(tmp_path / "history.jsonl", max_per_session=2)
+        writer = HistoryWriter(store, batch_size=100, flush_interval=60)
+        for i in range(5):
+            writer.submit(make_entry(i))
+        writer.close()
+        assert store.count() == 2
@@ -0,0 +1,56 @@
+"""Tests for cold-start import cost."""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.imports import ImportTime, measure_import, parse_importtime
+
+# Cold import of the calculator package on its own (numpy is most of it).
+# Generous headroom for slow CI machines; the point is to catch a heavy
+# dependency creeping in, which costs hundreds of milliseconds.
+CALCULATORS_IMPORT_BUDGET_MS = 500
+
+# Dependencies only the UI pages, PDF reports or columnar files need
+HEAVY_MODULES = ["pandas", "fpdf", "altair", "pyarrow", "streamlit"]
+
+
+def _loaded(report: dict, modules: list[str]) -> list[str]:
+    return [module for module in modules if module in report["imported"]]
+
+
+class TestImportReport:
+    """Tests for parsing -X importtime output."""
+
+    def test_parses_lines_after_marker(self):
+        stderr = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 | site",
+            "-- carworth import report --",
+            "import time:       300 |        300 |   numpy",
+            "import time:        50 |        350 | app.calculators",
+        ])
+        assert parse_importtime(stderr) == [
+            ImportTime("numpy", 300, 300, 1),
+            ImportTime("app.calculators", 50, 350, 0),
+        ]
+
+
+class TestColdImports:
+    """Cold-import budgets, each measured in a fresh interpreter."""
+
+    def test_calculators_within_budget(self):
+        report = measure_import("app.calculators")
+        assert _loaded(report, HEAVY_MODULES) == []
+        assert report["total_ms"] < CALCULATORS_IMPORT_BUDGET_MS
+
+    def test_cli_skips_ui_and_pdf_dependencies(self):
+        report = measure_import("app.cli")
+        assert _loaded(report, HEAVY_MODULES) == []
+
+    def test_main_defers_page_dependencies(self):
+        pytest.importorskip("streamlit_shadcn_ui")
+        report = measure_import("app.main")
+        assert _loaded(report, ["pandas", "fpdf", "altair", "pyarrow"]) == []
@@ -0,0 +1,86 @@
+"""Tests for streaming portfolio analytics."""
+
+import pytest
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.calculators.batch import value_rows
+from app.calculators.portfolio import summarize_portfolio
+from benchmarks.workloads import sample_inputs
+
+
+@pytest.fixture(scope="module")
+def listings():
+    return sample_inputs(1500)
+
+
+class TestSummarizePortfolio:
+    """Aggregates must match grouping the per-car batch records."""
+
+    def test_totals_and_verdict_mix(self, listings):
+        records = value_rows(listings)
+        summary = summarize_portfolio(listings, chunk_size=400).to_dict()
+
+        assert summary["count"] == len(listings)
+        assert summary["total_fair_value"] == pytest.approx(sum(r["fair_value"] for r in records))
+        assert summary["total_asking_price"] == pytest.approx(sum(r["asking_price"] for r in records))
+        assert summary["verdicts"] == {
+            verdict: Counter(r["verdict"] for r in records)[verdict] for verdict in summary["verdicts"]
+        }
+
+    @pytest.mark.parametrize("key, section", [
+        ("state", "by_state"),
+        ("fuel_type", "by_fuel_type"),
+        ("brand", "by_brand"),
+    ])
+    def test_group_breakdowns(self, listings, key, section):
+        records = value_rows(listings)
+        expected = defaultdict(Counter)
+        fair_values = defaultdict(float)
+        for record in records:
+            expected[record[key]][record["verdict"]] += 1
+            fair_values[record[key]] += record["fair_value"]
+
+        rows = summarize_portfolio(listings).to_dict()[section]
+        assert {row[key] for row in rows} == set(expected)
+        for row in rows:
+            assert row["count"] == sum(expected[row[key]].values())
+            assert all(row["verdicts"][verdict] == n for verdict, n in expected[row[key]].items())
+            assert row["total_fair_value"] == pytest.approx(fair_values[row[key]])
+
+    def test_depreciation_by_age(self, listings):
+        records = value_rows(listings)
+        by_age = defaultdict(list)
+        for record, listing in zip(records, listings):
+            capped = record["advanced_capped"] if listing["use_advanced"] else record["basic_capped"]
+            by_age[record["age"]].append(capped)
+
+        rows = summarize_portfolio(listings, chunk_size=97).to_dict()["depreciation_by_age"]
+        assert [row["age"] for row in rows] == sorted(by_age)
+        for row in rows:
+            values = by_age[row["age"]]
+            assert row["count"] == len(values)
+            assert row["mean_depreciation"] == pytest.approx(sum(values) / len(values))
+
+    def test_chunk_size_does_not_change_counts(self, listings):
+        small = summarize_portfolio(listings, chunk_size=7).to_dict()
+        large = summarize_portfolio(listings, chunk_size=10000).to_dict()
+        assert small["verdicts"] == large["verdicts"]
+        assert small["by_brand"] == [
+            {**row, "total_fair_value": pytest.approx(row["total_fair_value"]),
+             "total_asking_price": pytest.approx(row["total_asking_price"])}
+            for row in large["by_brand"]
+        ]
+
+    def test_unknown_labels_are_grouped(self, listings):
+        summary = summarize_portfolio([{**listings[0], "brand": "Trabant"}]).to_dict()
+        assert [row["brand"] for row in summary["by_brand"]] == ["Unknown"]
+
+    def test_empty(self):
+        summary = summarize_portfolio([]).to_dict()
+        assert summary["count"] == 0
+        assert summary["by_state"] == []
+        assert summary["depreciation_by_age"] == []
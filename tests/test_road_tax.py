@@ -0,0 +1,75 @@
+"""Tests for the precompiled road tax slab index."""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.data.road_tax import (
+    STATE_TAX_CONFIG,
+    DEFAULT_STATE,
+    get_slab_info,
+    get_road_tax_rate,
+    lookup_rates,
+    encode_states,
+)
+from app.data.constants import FUEL_TYPES
+from app.data.version import TAX_DATA_VERSION, tax_data_version
+
+
+class TestSlabIndex:
+    """Tests for slab resolution via the compiled index."""
+
+    def test_slab_boundaries_are_inclusive(self):
+        assert get_slab_info("Delhi", "Petrol", 600000)["slab_name"] == "slab1"
+        assert get_slab_info("Delhi", "Petrol", 600001)["slab_name"] == "slab2"
+        assert get_slab_info("Delhi", "Petrol", 1000000)["slab_name"] == "slab2"
+        assert get_slab_info("Delhi", "Petrol", 1000001)["slab_name"] == "slab3"
+
+    def test_unknown_state_and_fuel_fall_back(self):
+        info = get_slab_info("Atlantis", "LPG", 1500000)
+        expected = STATE_TAX_CONFIG[DEFAULT_STATE]["rates"]["Petrol"]["slab2"]
+        assert info["rate"] == expected
+        assert info["reason"].startswith(DEFAULT_STATE)
+
+    def test_numeric_mode_skips_text(self):
+        full = get_slab_info("Karnataka", "Diesel", 1500000)
+        numeric = get_slab_info("Karnataka", "Diesel", 1500000, explain=False)
+        assert numeric == {key: full[key] for key in ("slab_name", "slab_range", "rate")}
+
+    def test_lookup_rates_matches_scalar(self):
+        prices = [100000, 500000, 500001, 800000, 1000000, 1500000, 2000000, 2000001, 9000000]
+        states, fuels, flat_prices = [], [], []
+        for state in list(STATE_TAX_CONFIG) + ["Atlantis"]:
+            for fuel in FUEL_TYPES + ["LPG"]:
+                for price in prices:
+                    states.append(state)
+                    fuels.append(fuel)
+                    flat_prices.append(price)
+
+        rates, slabs = lookup_rates(states, fuels, flat_prices)
+
+        for i, (state, fuel, price) in enumerate(zip(states, fuels, flat_prices)):
+            assert rates[i] == get_road_tax_rate(state, fuel, price)
+            config = STATE_TAX_CONFIG.get(state, STATE_TAX_CONFIG[DEFAULT_STATE])
+            assert config["slabs"][slabs[i]][1] == get_slab_info(state, fuel, price)["slab_name"]
+
+    def test_lookup_rates_accepts_codes(self):
+        codes = encode_states(["Karnataka", "Atlantis"])
+        rates, _ = lookup_rates(codes, np.array([1, -1]), [1500000, 1500000])
+        assert rates[0] == STATE_TAX_CONFIG["Karnataka"]["rates"]["Diesel"]["slab3"]
+        assert rates[1] == STATE_TAX_CONFIG[DEFAULT_STATE]["rates"]["Petrol"]["slab2"]
+
+
+class TestTaxDataVersion:
+    """Tests for the tax table content version."""
+
+    def test_version_is_stable_and_tracks_content(self, monkeypatch):
+        assert tax_data_version() == TAX_DATA_VERSION
+        monkeypatch.setitem(
+            STATE_TAX_CONFIG["Goa"]["rates"]["Petrol"], "slab1", 0.5
+        )
+        assert tax_data_version() != TAX_DATA_VERSION
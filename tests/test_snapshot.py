@@ -0,0 +1,87 @@
+"""Tests for the memory-mapped lookup table snapshot."""
+
+import mmap
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.cli import main
+from app.data import categories, road_tax
+from app.data.snapshot import (
+    MAGIC,
+    build,
+    build_tables,
+    load_tables,
+    read_snapshot,
+    write_snapshot,
+)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = build(tmp_path / "tables.snapshot")
+    yield path
+    load_tables.cache_clear()
+
+
+class TestSnapshot:
+    """Tests for building and loading the snapshot."""
+
+    def test_round_trip_matches_fresh_build(self, snapshot_path):
+        tables = load_tables(snapshot_path)
+        expected = build_tables()
+        assert tables.keys() == expected.keys()
+        for name, array in expected.items():
+            assert tables[name].dtype == array.dtype
+            np.testing.assert_array_equal(tables[name], array)
+
+    def test_arrays_are_read_only_views_of_the_mapping(self, snapshot_path):
+        _, arrays = read_snapshot(snapshot_path)
+        for array in arrays.values():
+            assert not array.flags.writeable
+            base = array
+            while isinstance(base, np.ndarray):
+                base = base.base
+            assert isinstance(base, memoryview) and isinstance(base.obj, mmap.mmap)
+
+    def test_stale_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "stale.snapshot"
+        write_snapshot(path, build_tables(), "0" * 64)
+        assert read_snapshot(path)[0]["source_hash"] == "0" * 64
+        assert load_tables(path) is None
+        load_tables.cache_clear()
+
+    def test_bad_magic_is_ignored(self, tmp_path):
+        path = tmp_path / "bad.snapshot"
+        path.write_bytes(b"NOTASNAP" + bytes(64))
+        with pytest.raises(ValueError):
+            read_snapshot(path)
+        assert load_tables(path) is None
+        load_tables.cache_clear()
+
+    def test_missing_snapshot_is_ignored(self, tmp_path):
+        assert load_tables(tmp_path / "missing.snapshot") is None
+        load_tables.cache_clear()
+
+    def test_file_starts_with_magic(self, snapshot_path):
+        assert snapshot_path.read_bytes().startswith(MAGIC)
+
+    def test_module_tables_match_fresh_build(self):
+        expected = build_tables()
+        np.testing.assert_array_equal(road_tax.RATE_MATRIX, expected["rate_matrix"])
+        np.testing.assert_array_equal(categories.BRAND_MULTIPLIER_TABLE, expected["brand_multiplier"])
+
+
+class TestSnapshotCommand:
+    """Tests for the snapshot CLI subcommand."""
+
+    def test_build_then_check(self, tmp_path):
+        path = tmp_path / "tables.snapshot"
+        assert main(["snapshot", "--check", "-o", str(path)]) == 1
+        assert main(["snapshot", "-o", str(path)]) == 0
+        load_tables.cache_clear()
+        assert main(["snapshot", "--check", "-o", str(path)]) == 0
+        load_tables.cache_clear()
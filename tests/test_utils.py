@@ -8,7 +8,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.utils.formatters import (
     format_currency,
+    format_currency_column,
     format_currency_lakhs,
+    format_lakhs_column,
     format_percentage,
     format_indian_number,
 )
@@ -19,6 +21,8 @@ from app.utils.validators import (
     validate_asking_price,
     validate_inputs,
 )
+from app.utils.pdf_generator import REPORT_CACHE, cached_valuation_report
+from app.calculators.valuation import calculate_car_value
 
 
 class TestFormatters:
@@ -40,6 +44,29 @@ class TestFormatters:
         result = format_currency(1500000, include_symbol=False)
         assert "Rs." not in result
 
+    def test_format_currency_is_locale_independent(self):
+        assert format_currency(1234567.89) == "Rs. 12,34,567"
+        assert format_currency(999, include_symbol=False) == "999"
+
+    def test_format_indian_number_negative(self):
+        assert format_indian_number(-150) == "-150"
+        assert format_indian_number(-15000) == "-15,000"
+        assert format_indian_number(-1234567) == "-12,34,567"
+
+    def test_format_currency_column_matches_scalar(self):
+        amounts = [0, 999.9, 1500000, 1500000.4, 123456789, -15000, 1500000]
+        assert format_currency_column(amounts) == [format_currency(a) for a in amounts]
+        assert format_currency_column(amounts, include_symbol=False) == [
+            format_currency(a, include_symbol=False) for a in amounts
+        ]
+        assert format_currency_column([]) == []
+
+    def test_format_lakhs_column_matches_scalar(self):
+        amounts = [0, 1500000, 1234567, 1500000, 98765432.1, -250000]
+        assert format_lakhs_column(amounts) == [format_currency_lakhs(a) for a in amounts]
+        assert format_lakhs_column(amounts, 1) == [format_currency_lakhs(a, 1) for a in amounts]
+        assert format_lakhs_column([]) == []
+
     def test_format_currency_lakhs(self):
         assert format_currency_lakhs(1500000) == "15.00 L"
         assert format_currency_lakhs(1234567) == "12.35 L"
@@ -120,3 +147,28 @@ class TestValidators:
         is_valid, errors = validate_inputs(inputs)
         assert not is_valid
         assert len(errors) >= 3
+
+
+class TestReportCache:
+    """Tests for the cached PDF report."""
+
+    def _report(self, asking_price):
+        result = calculate_car_value({
+            "ex_showroom": 1000000, "year": 2020, "km": 40000, "fuel_type": "Petrol",
+            "state": "Delhi", "owner": "1st Owner", "asking_price": asking_price,
+            "insurance_status": "Valid", "custom_road_tax_rate": None, "brand": "Other",
+            "transmission": "Manual", "body_condition": "Good", "accident_history": "None",
+            "service_history": "Unknown", "commercial_use": False, "new_gen_available": False,
+            "use_advanced": False,
+        })
+        del result["use_advanced"]
+        return result
+
+    def test_reuses_rendered_bytes(self):
+        REPORT_CACHE.clear()
+        report = self._report(600000)
+        first = cached_valuation_report(**report)
+        assert first.startswith(b"%PDF")
+        assert cached_valuation_report(**report) is first
+        assert cached_valuation_report(**self._report(650000)) is not first
+        assert len(REPORT_CACHE) == 2